@@ -0,0 +1,44 @@
+"""Add accommodation_stats table and average_sol_score index
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # 숙소별 사전 계산 통계 테이블 (크롤링 배치가 갱신)
+    op.create_table(
+        'accommodation_stats',
+        sa.Column('accommodation_id', sa.String(), nullable=False),
+        sa.Column('avg_closed_score', sa.Float(), nullable=True),
+        sa.Column('avg_price', sa.Float(), nullable=True),
+        sa.Column('date_count', sa.Integer(), nullable=True),
+        sa.Column('closed_date_count', sa.Integer(), nullable=True),
+        sa.Column('priced_date_count', sa.Integer(), nullable=True),
+        sa.Column('weekday_averages', sa.JSON(), nullable=True),
+        sa.Column('score_bucket_counts', sa.JSON(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['accommodation_id'], ['accommodations.id']),
+        sa.PrimaryKeyConstraint('accommodation_id')
+    )
+    op.create_index('ix_accommodation_stats_accommodation_id', 'accommodation_stats', ['accommodation_id'])
+
+    # /sol-recommended 정렬용 인덱스
+    op.create_index('ix_accommodations_average_sol_score', 'accommodations', ['average_sol_score'])
+
+
+def downgrade():
+    op.drop_index('ix_accommodations_average_sol_score', 'accommodations')
+    op.drop_index('ix_accommodation_stats_accommodation_id', 'accommodation_stats')
+    op.drop_table('accommodation_stats')
@@ -0,0 +1,46 @@
+"""Store faq_vectors embeddings as packed float32 blobs
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def _create_faq_vectors(embedding_type):
+    op.create_table(
+        'faq_vectors',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('faq_id', sa.String(), nullable=False),
+        sa.Column('text_chunk', sa.Text(), nullable=False),
+        sa.Column('embedding', embedding_type, nullable=False),
+        sa.Column('meta_data', sa.JSON(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['faq_id'], ['faqs.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_faq_vectors_id', 'faq_vectors', ['id'])
+    op.create_index('ix_faq_vectors_faq_id', 'faq_vectors', ['faq_id'])
+
+
+def upgrade():
+    # faq_vectors는 지금까지 읽고 쓰는 코드가 없었으므로(데이터 없음) 새 컬럼 타입으로 다시 생성
+    # (SQLite/Turso는 컬럼 타입 변경을 지원하지 않음)
+    if 'faq_vectors' in sa.inspect(op.get_bind()).get_table_names():
+        op.drop_table('faq_vectors')
+    _create_faq_vectors(sa.LargeBinary())
+
+
+def downgrade():
+    op.drop_table('faq_vectors')
+    _create_faq_vectors(sa.JSON())
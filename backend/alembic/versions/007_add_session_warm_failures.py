@@ -0,0 +1,29 @@
+"""Add session warm failure tracking to users
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # 백그라운드 세션 갱신 실패 시 재시도 간격을 늘리기 위한 컬럼
+    op.add_column('users',
+                  sa.Column('session_warm_failures', sa.Integer(), nullable=True, server_default='0'))
+    op.add_column('users',
+                  sa.Column('session_warm_failed_at', sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    op.drop_column('users', 'session_warm_failed_at')
+    op.drop_column('users', 'session_warm_failures')
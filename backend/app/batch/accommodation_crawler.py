@@ -13,13 +13,16 @@ from datetime import datetime
 from html import unescape
 from urllib.parse import urljoin
 from typing import List, Dict, Optional
-from sqlalchemy import select
 from app.database import AsyncSessionLocal
 from app.models.accommodation import Accommodation
 from app.models.accommodation_date import AccommodationDate
 from app.models.today_accommodation import TodayAccommodation
 from app.config import settings
 from app.utils.logger import get_logger
+from app.utils.response_cache import invalidate_response_cache
+from app.utils.accommodation_stats import refresh_accommodation_stats
+from app.utils.bulk_upsert import bulk_upsert
+from app.batch.crawl_pool import HostRateLimiter, run_page_pool
 from app.utils.sol_score import (
     calculate_sol_scores_for_accommodation_dates,
     calculate_and_update_average_sol_scores
@@ -36,14 +39,18 @@ logger = get_logger(__name__)
 SHB_REFRESH_INTRO_URL = "https://shbrefresh.interparkb2b.co.kr/intro"
 SHB_REFRESH_INDEX_URL = "https://shbrefresh.interparkb2b.co.kr/index"
 
-async def crawl_accommodations(page: Page) -> List[Dict]:
+async def crawl_accommodations(page: Page, concurrency: Optional[int] = None) -> List[Dict]:
     """
     RESERVATION 페이지에서 숙소 정보 및 날짜별 신청 점수/인원 크롤링
     
     전략:
     1. 메인 페이지에서 지역별 연성소 링크 수집
     2. 각 지역별 페이지에서 개별 숙소 링크 수집
-    3. 각 개별 숙소 상세 페이지에서 정보 추출
+    3. 각 개별 숙소 상세 페이지에서 정보 추출 (concurrency개 페이지로 동시 처리)
+    
+    Args:
+        page: 로그인된 Playwright Page 객체 (같은 BrowserContext의 페이지를 추가로 엽니다)
+        concurrency: 동시에 사용할 페이지 수 (None이면 settings.CRAWLER_CONCURRENCY)
     
     Returns:
         List[Dict]: 크롤링한 숙소 정보 리스트
@@ -149,17 +156,33 @@ async def crawl_accommodations(page: Page) -> List[Dict]:
             logger.warning("No accommodation links found!")
             return accommodations
 
-        # STEP 2: 각 숙소 상세 페이지에서 정보 추출
-        logger.info(f"STEP 2: Crawling {len(accommodation_urls)} accommodations...")
+        # STEP 2: 각 숙소 상세 페이지에서 정보 추출 (로그인 컨텍스트를 공유하는 페이지 풀)
+        concurrency = concurrency or settings.CRAWLER_CONCURRENCY
+        logger.info(f"STEP 2: Crawling {len(accommodation_urls)} accommodations with {concurrency} pages...")
+
+        async def crawl_one(worker_page: Page, acc_url: str) -> List[Dict]:
+            crawled: List[Dict] = []
+            await crawl_individual_accommodation(worker_page, acc_url, crawled)
+            return crawled
+
+        results, pool_stats = await run_page_pool(
+            page.context,
+            sorted(accommodation_urls),
+            crawl_one,
+            concurrency=concurrency,
+            rate_limiter=HostRateLimiter(settings.CRAWLER_REQUESTS_PER_SECOND),
+            max_retries=settings.CRAWLER_MAX_RETRIES,
+            label="accommodations",
+        )
+
+        # URL 순서대로 결과 병합
+        for crawled in results:
+            if crawled:
+                accommodations.extend(crawled)
+
+        if pool_stats.failed_items:
+            logger.warning(f"  Failed URLs: {', '.join(pool_stats.failed_items)}")
 
-        for acc_idx, acc_url in enumerate(sorted(accommodation_urls), 1):
-            logger.info(f"  [{acc_idx}/{len(accommodation_urls)}] Processing: {acc_url}")
-            try:
-                await crawl_individual_accommodation(page, acc_url, accommodations)
-            except Exception as e:
-                logger.warning(f"    Error crawling {acc_url}: {str(e)}")
-                continue
-        
         logger.info(f"Crawled {len(accommodations)} accommodations")
         return accommodations
         
@@ -1023,6 +1046,8 @@ async def crawl_individual_accommodation(
             
     except Exception as e:
         logger.warning(f"  Error crawling individual accommodation {acc_url}: {str(e)}")
+        # 페이지 풀이 재시도할 수 있도록 호출자에게 전달
+        raise
 
 
 async def extract_date_booking_info(element, page: Page) -> Dict[str, Dict[str, int]]:
@@ -1206,6 +1231,79 @@ async def extract_date_booking_info(element, page: Page) -> Dict[str, Dict[str,
     return date_info
 
 
+def _merge_accommodation_row(raw_by_id: Dict[str, Dict]):
+    """
+    기존 숙소 행과 새로 크롤링한 값을 합치는 merge 함수 생성
+    - 크롤링에서 값을 못 찾은 항목(rbroomNo, 타입, 정원, 요약)은 기존 값 유지
+    - 이미지 URL은 기존 목록 뒤에 새 URL만 추가 (중복 제거)
+    """
+    def merge(existing: Dict, new: Dict) -> Dict:
+        acc_data = raw_by_id[new["id"]]
+        merged = dict(new)
+
+        if not acc_data.get("accommodation_id"):
+            merged["accommodation_id"] = existing["accommodation_id"]
+        if not acc_data.get("accommodation_type"):
+            merged["accommodation_type"] = existing["accommodation_type"]
+        if acc_data.get("capacity") is None:
+            merged["capacity"] = existing["capacity"]
+        if acc_data.get("summary") is None:
+            merged["summary"] = existing["summary"]
+
+        existing_images = list(existing["images"] or [])
+        new_image_urls = acc_data.get("image_urls", [])
+        if new_image_urls:
+            for img_url in new_image_urls:
+                if img_url not in existing_images:
+                    existing_images.append(img_url)
+        merged["images"] = existing_images
+
+        return merged
+
+    return merge
+
+
+ACCOMMODATION_COMPARE_COLUMNS = (
+    "name", "region", "address", "contact", "website", "accommodation_id",
+    "accommodation_type", "capacity", "summary", "images",
+)
+DATE_COMPARE_COLUMNS = ("score", "applicants", "status")
+
+
+def _build_date_row(acc_id: str, date_str: str, booking_data: Dict) -> Optional[Dict]:
+    """날짜별 크롤링 결과를 accommodation_dates/today_accommodation_info 공통 행으로 변환"""
+    from datetime import date as date_obj
+
+    # 날짜 파싱
+    date_parts = date_str.split("-")
+    if len(date_parts) != 3:
+        logger.warning(f"Invalid date format: {date_str}")
+        return None
+
+    # 날짜 객체 생성 (요일, 주차 계산용)
+    try:
+        year = int(date_parts[0])
+        month = int(date_parts[1])
+        day = int(date_parts[2])
+        date_value = date_obj(year, month, day)
+    except ValueError:
+        logger.warning(f"Invalid date: {date_str}")
+        return None
+
+    return {
+        "year": year,
+        "month": month,
+        "day": day,
+        "weekday": date_value.weekday(),  # 0=월요일, 6=일요일
+        "week_number": date_value.isocalendar()[1],  # ISO week number
+        "date": date_str,
+        "accommodation_id": acc_id,
+        "applicants": booking_data.get("applicants", 0),
+        "score": booking_data.get("score", 0.0),
+        "status": booking_data.get("status", "Unknown"),
+    }
+
+
 async def save_accommodations_to_db(accommodations: List[Dict]):
     """
     크롤링한 숙소 정보를 DB에 저장
@@ -1213,6 +1311,8 @@ async def save_accommodations_to_db(accommodations: List[Dict]):
     - AccommodationDate: 날짜별 숙소 내역
     - TodayAccommodation: 오늘자 숙소 내역
 
+    테이블별로 기존 행을 IN 쿼리로 미리 조회한 뒤 신규/변경 행만 bulk upsert 한다.
+
     Args:
         accommodations: 크롤링한 숙소 정보 리스트
     """
@@ -1220,199 +1320,87 @@ async def save_accommodations_to_db(accommodations: List[Dict]):
         try:
             from datetime import date as date_obj
 
-            saved_accommodations = 0
-            updated_accommodations = 0
-            saved_dates = 0
-            updated_dates = 0
-            saved_today = 0
-            updated_today = 0
-
             today_str = date_obj.today().isoformat()  # YYYY-MM-DD
 
+            raw_by_id: Dict[str, Dict] = {}
+            accommodation_rows = []
+            date_rows = []
+            today_rows = []
+
             for acc_data in accommodations:
-                # 1. Accommodation 저장/업데이트 (숙소 기본 정보)
+                # 1. Accommodation 행 (숙소 기본 정보)
                 # URL에서 추출한 실제 숙소 ID 사용
                 acc_id = acc_data.get("id")
                 if not acc_id:
                     logger.warning(f"Skipping accommodation without ID: {acc_data.get('name')}")
                     continue
 
-                # 기존 숙소 확인
-                existing = await db.execute(
-                    select(Accommodation).where(Accommodation.id == acc_id)
-                )
-                existing_acc = existing.scalar_one_or_none()
-
-                if existing_acc:
-                    # 업데이트
-                    existing_acc.name = acc_data["name"]
-                    existing_acc.region = acc_data.get("region", "Unknown")
-                    existing_acc.address = acc_data.get("address")
-                    existing_acc.contact = acc_data.get("contact")
-                    existing_acc.website = acc_data.get("homepage")
-                    # accommodation_id 업데이트 (rbroomNo)
-                    if acc_data.get("accommodation_id"):
-                        existing_acc.accommodation_id = acc_data.get("accommodation_id")
-                    if acc_data.get("accommodation_type"):
-                        existing_acc.accommodation_type = acc_data.get("accommodation_type")
-                    capacity_value = acc_data.get("capacity")
-                    if capacity_value is not None:
-                        existing_acc.capacity = capacity_value
-                    if acc_data.get("summary") is not None:
-                        existing_acc.summary = acc_data.get("summary")
-
-                    # 이미지 URL 업데이트 (여러 개)
-                    new_image_urls = acc_data.get("image_urls", [])
-                    if new_image_urls:
-                        existing_images = existing_acc.images or []
-                        # 새로운 이미지 추가 (중복 제거)
-                        for img_url in new_image_urls:
-                            if img_url not in existing_images:
-                                existing_images.append(img_url)
-                        existing_acc.images = existing_images
-
-                    existing_acc.updated_at = datetime.utcnow()
-                    db.add(existing_acc)
-                    updated_accommodations += 1
-                else:
-                    # 새로 생성
-                    new_acc = Accommodation(
-                        id=acc_id,
-                        accommodation_id=acc_data.get("accommodation_id"),  # rbroomNo 값
-                        name=acc_data["name"],
-                        region=acc_data.get("region", "Unknown"),
-                        address=acc_data.get("address"),
-                        contact=acc_data.get("contact"),
-                        website=acc_data.get("homepage"),
-                        images=acc_data.get("image_urls", []),  # 이미지 URL 리스트
-                        accommodation_type=acc_data.get("accommodation_type"),
-                        capacity=acc_data.get("capacity") or 2,  # 기본값
-                        summary=acc_data.get("summary", []),
-                    )
-                    db.add(new_acc)
-                    saved_accommodations += 1
-
-                # 2. AccommodationDate 저장/업데이트 (날짜별 정보)
+                raw_by_id[acc_id] = acc_data
+                accommodation_rows.append({
+                    "id": acc_id,
+                    "accommodation_id": acc_data.get("accommodation_id"),  # rbroomNo 값
+                    "name": acc_data["name"],
+                    "region": acc_data.get("region", "Unknown"),
+                    "address": acc_data.get("address"),
+                    "contact": acc_data.get("contact"),
+                    "website": acc_data.get("homepage"),
+                    "images": acc_data.get("image_urls", []),  # 이미지 URL 리스트
+                    "accommodation_type": acc_data.get("accommodation_type"),
+                    "capacity": acc_data.get("capacity") or 2,  # 기본값
+                    "summary": acc_data.get("summary", []),
+                })
+
+                # 2. AccommodationDate 행 (날짜별 정보)
                 date_booking_info = acc_data.get("date_booking_info", {})
                 for date_str, booking_data in date_booking_info.items():
-                    try:
-                        new_score = booking_data.get("score", 0.0)
-                        new_applicants = booking_data.get("applicants", 0)
-                        new_status = booking_data.get("status", "Unknown")
-
-                        # 날짜 파싱
-                        date_parts = date_str.split("-")
-                        if len(date_parts) != 3:
-                            logger.warning(f"Invalid date format: {date_str}")
-                            continue
-
-                        year = int(date_parts[0])
-                        month = int(date_parts[1])
-                        day = int(date_parts[2])
-
-                        # 날짜 객체 생성 (요일, 주차 계산용)
-                        try:
-                            date_value = date_obj(year, month, day)
-                            weekday = date_value.weekday()  # 0=월요일, 6=일요일
-                            week_number = date_value.isocalendar()[1]  # ISO week number
-                        except ValueError:
-                            logger.warning(f"Invalid date: {date_str}")
-                            continue
-
-                        # AccommodationDate ID 생성
-                        date_id = f"{acc_id}_{date_str}"
-
-                        # 기존 날짜 정보 확인
-                        existing_date = await db.execute(
-                            select(AccommodationDate).where(AccommodationDate.id == date_id)
-                        )
-                        existing_date_obj = existing_date.scalar_one_or_none()
-
-                        if existing_date_obj:
-                            # 동일한 날짜/숙소/점수 조합이 이미 있으면 스킵 (중복 삽입 방지)
-                            if (existing_date_obj.score == new_score and
-                                existing_date_obj.applicants == new_applicants and
-                                existing_date_obj.status == new_status):
-                                logger.debug(f"      Skipping {date_str}: identical data (score={new_score}, applicants={new_applicants}, status={new_status})")
-                                continue
-
-                            # 업데이트 (데이터가 변경된 경우에만)
-                            existing_date_obj.applicants = new_applicants
-                            existing_date_obj.score = new_score
-                            existing_date_obj.status = new_status
-                            existing_date_obj.updated_at = datetime.utcnow()
-                            db.add(existing_date_obj)
-                            updated_dates += 1
-                            logger.debug(f"      Updated {date_str}: score {existing_date_obj.score}->{new_score}, applicants {existing_date_obj.applicants}->{new_applicants}")
-                        else:
-                            # 새로 생성
-                            new_date = AccommodationDate(
-                                id=date_id,
-                                year=year,
-                                month=month,
-                                day=day,
-                                weekday=weekday,
-                                week_number=week_number,
-                                date=date_str,
-                                accommodation_id=acc_id,
-                                applicants=booking_data.get("applicants", 0),
-                                score=booking_data.get("score", 0.0),
-                                status=booking_data.get("status", "Unknown")
-                            )
-                            db.add(new_date)
-                            saved_dates += 1
-
-                        # 3. TodayAccommodation 저장/업데이트 (오늘 날짜만)
-                        if date_str == today_str:
-                            today_id = f"today_{date_id}"
-
-                            # 기존 오늘 정보 확인
-                            existing_today = await db.execute(
-                                select(TodayAccommodation).where(TodayAccommodation.id == today_id)
-                            )
-                            existing_today_obj = existing_today.scalar_one_or_none()
-
-                            if existing_today_obj:
-                                # 동일한 데이터인지 확인 (점수와 인원이 동일하면 스킵)
-                                if (existing_today_obj.score == new_score and
-                                    existing_today_obj.applicants == new_applicants and
-                                    existing_today_obj.status == new_status):
-                                    logger.debug(f"      Skipping today {date_str}: identical data")
-                                    continue
-
-                                # 업데이트 (데이터가 변경된 경우에만)
-                                existing_today_obj.applicants = new_applicants
-                                existing_today_obj.score = new_score
-                                existing_today_obj.status = new_status
-                                existing_today_obj.updated_at = datetime.utcnow()
-                                db.add(existing_today_obj)
-                                updated_today += 1
-                            else:
-                                # 새로 생성
-                                new_today = TodayAccommodation(
-                                    id=today_id,
-                                    year=year,
-                                    month=month,
-                                    day=day,
-                                    weekday=weekday,
-                                    week_number=week_number,
-                                    date=date_str,
-                                    accommodation_id=acc_id,
-                                    applicants=booking_data.get("applicants", 0),
-                                    score=booking_data.get("score", 0.0),
-                                    status=booking_data.get("status", "Unknown")
-                                )
-                                db.add(new_today)
-                                saved_today += 1
-
-                    except Exception as e:
-                        logger.warning(f"Error saving date {date_str}: {str(e)}")
+                    date_row = _build_date_row(acc_id, date_str, booking_data)
+                    if date_row is None:
                         continue
 
+                    # AccommodationDate ID 생성
+                    date_id = f"{acc_id}_{date_str}"
+                    date_rows.append({"id": date_id, **date_row})
+
+                    # 3. TodayAccommodation 행 (오늘 날짜만)
+                    if date_str == today_str:
+                        today_rows.append({"id": f"today_{date_id}", **date_row})
+
+            # 숙소 → 날짜 순서로 저장 (FK)
+            acc_result = await bulk_upsert(
+                db,
+                Accommodation,
+                accommodation_rows,
+                compare_columns=ACCOMMODATION_COMPARE_COLUMNS,
+                merge=_merge_accommodation_row(raw_by_id),
+            )
+            date_result = await bulk_upsert(
+                db, AccommodationDate, date_rows, compare_columns=DATE_COMPARE_COLUMNS
+            )
+            today_result = await bulk_upsert(
+                db, TodayAccommodation, today_rows, compare_columns=DATE_COMPARE_COLUMNS
+            )
+
             await db.commit()
-            logger.info(f"Accommodations - Saved: {saved_accommodations}, Updated: {updated_accommodations}")
-            logger.info(f"Accommodation Dates - Saved: {saved_dates}, Updated: {updated_dates}")
-            logger.info(f"Today Accommodations - Saved: {saved_today}, Updated: {updated_today}")
+            logger.info(f"Accommodations - {acc_result}")
+            logger.info(f"Accommodation Dates - {date_result}")
+            logger.info(f"Today Accommodations - {today_result}")
+
+            # 숙소 또는 날짜 데이터가 바뀐 숙소만 통계 갱신
+            date_owner = {row["id"]: row["accommodation_id"] for row in date_rows}
+            stats_dirty_ids = set(acc_result.changed_keys) | {
+                date_owner[date_id] for date_id in date_result.changed_keys
+            }
+            stats_result = await refresh_accommodation_stats(db, list(stats_dirty_ids))
+            logger.info(
+                f"Accommodation Stats - Refreshed: {stats_result['total']} "
+                f"(inserted: {stats_result['inserted']}, updated: {stats_result['updated']})"
+            )
+
+            return {
+                "accommodations": acc_result.as_dict(),
+                "accommodation_dates": date_result.as_dict(),
+                "today_accommodations": today_result.as_dict(),
+            }
 
         except Exception as e:
             await db.rollback()
@@ -1546,7 +1534,7 @@ async def process_accommodation_crawling(
                 }
             
             # DB에 저장
-            await save_accommodations_to_db(accommodations)
+            save_stats = await save_accommodations_to_db(accommodations)
 
             # SOL점수 계산 및 업데이트
             logger.info("=" * 50)
@@ -1558,23 +1546,32 @@ async def process_accommodation_crawling(
                 logger.info(f"  - Total records: {sol_stats['total']}")
                 logger.info(f"  - Calculated: {sol_stats['calculated']}")
                 logger.info(f"  - Skipped: {sol_stats['skipped']}")
+                logger.info(f"  - Updated: {sol_stats['updated']}")
 
             # 숙소별 평균 SOL점수 계산 및 업데이트
             logger.info("=" * 50)
             logger.info("STEP 5: Calculating average SOL scores for accommodations...")
             logger.info("=" * 50)
             async with AsyncSessionLocal() as db:
-                avg_stats = await calculate_and_update_average_sol_scores(db)
+                # SOL점수가 바뀐 날짜가 있는 숙소만 다시 집계
+                avg_stats = await calculate_and_update_average_sol_scores(
+                    db, sol_stats['changed_accommodation_ids']
+                )
                 logger.info(f"✓ Average SOL score calculation completed:")
                 logger.info(f"  - Total accommodations: {avg_stats['total']}")
                 logger.info(f"  - Updated: {avg_stats['updated']}")
                 logger.info(f"  - Skipped: {avg_stats['skipped']}")
+                logger.info(f"  - Changed: {avg_stats['changed']}")
+
+            # 공개 API 응답 캐시 무효화
+            await invalidate_response_cache()
 
             logger.info(f"Accommodation crawling completed: {len(accommodations)} accommodations")
             
             return {
                 "status": "success",
                 "accommodations_count": len(accommodations),
+                "save_stats": save_stats,
                 "timestamp": datetime.utcnow().isoformat()
             }
             
@@ -11,18 +11,18 @@ from sqlalchemy import select
 from app.database import AsyncSessionLocal
 from app.models.accommodation import Accommodation
 from app.models.accommodation_date import AccommodationDate
-from app.batch.naver_hotel_price import search_hotel_price_on_naver
+from app.batch.naver_price_cache import NaverPriceCache
+from app.batch.naver_price_fetcher import PriceWriteBuffer, fetch_naver_prices, price_key
 from app.utils.logger import get_logger
-from playwright.async_api import async_playwright, Browser, Page, BrowserContext
+from app.utils.response_cache import invalidate_response_cache
+from app.utils.bulk_upsert import bulk_upsert, keep_existing, UpsertResult
+from app.utils.accommodation_stats import refresh_accommodation_stats
+from playwright.async_api import async_playwright, Browser, BrowserContext
 
 logger = get_logger(__name__)
 
-def _adult_count_from_capacity(capacity: Optional[int]) -> int:
-    try:
-        return max(1, int(capacity)) if capacity is not None else 2
-    except (TypeError, ValueError):
-        return 2
-
+# 가격을 모아서 DB에 기록하는 단위
+PRICE_FLUSH_SIZE = 50
 
 async def get_accommodation_dates_to_update() -> List[Dict]:
     """
@@ -75,35 +75,28 @@ async def get_accommodation_dates_to_update() -> List[Dict]:
             return []
 
 
-async def update_online_price_in_db(date_id: str, online_price: float) -> bool:
+async def update_online_prices_in_db(prices: Dict[str, float]) -> UpsertResult:
     """
-    accommodation_dates 테이블의 online_price 업데이트
+    accommodation_dates 테이블의 online_price 일괄 업데이트
+    - 기존 레코드를 IN 쿼리 한 번으로 조회한 뒤 가격이 비어 있는 레코드만 갱신
     """
     async with AsyncSessionLocal() as db:
         try:
-            result = await db.execute(
-                select(AccommodationDate).where(AccommodationDate.id == date_id)
+            result = await bulk_upsert(
+                db,
+                AccommodationDate,
+                [{"id": record_id, "online_price": price} for record_id, price in prices.items()],
+                compare_columns=("online_price",),
+                merge=keep_existing("online_price"),
+                insert_missing=False,
             )
-            record = result.scalar_one_or_none()
-
-            if record:
-                if record.online_price is not None:
-                    logger.info(f"  Skipping {date_id}: online_price already set")
-                    return False
-
-                record.online_price = online_price
-                record.updated_at = datetime.utcnow()
-                db.add(record)
-                await db.commit()
-                logger.debug(f"  Updated online_price: ₩{online_price:,.0f}")
-                return True
-            else:
-                logger.warning(f"  AccommodationDate record not found: {date_id}")
-                return False
+            await db.commit()
+            logger.info(f"  Flushed {len(prices)} prices - {result}")
+            return result
 
         except Exception as e:
             await db.rollback()
-            logger.error(f"Error updating online_price for {date_id}: {str(e)}")
+            logger.error(f"Error updating online_price for {len(prices)} records: {str(e)}")
             raise
 
 
@@ -114,7 +107,7 @@ async def process_accommodation_dates_price_crawler() -> Dict:
     async with async_playwright() as p:
         browser: Browser = None
         context: BrowserContext = None
-        page: Page = None
+        price_cache: Optional[NaverPriceCache] = None
 
         try:
             logger.info("=" * 60)
@@ -146,73 +139,46 @@ async def process_accommodation_dates_price_crawler() -> Dict:
                 user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
                 locale="ko-KR"
             )
-            page = await context.new_page()
+            price_cache = NaverPriceCache()
+            price_cache.purge_expired()
+
+            # 네이버 가격 조회 (영구 캐시 + 페이지 풀 동시 조회)
+            # 가격이 확정되는 즉시 버퍼에 넣어 PRICE_FLUSH_SIZE건마다 DB에 기록
+            price_writer = PriceWriteBuffer(
+                records, "date_id", update_online_prices_in_db, AccommodationDate.__tablename__, PRICE_FLUSH_SIZE
+            )
+            prices, fetch_stats = await fetch_naver_prices(
+                context, records, price_cache, on_price=price_writer.add
+            )
+            await price_writer.flush()
+            price_result = price_writer.result
 
             total_processed = 0
-            total_updated = 0
             total_failed = 0
             total_skipped = 0
 
-            # 같은 숙소/날짜/타입에 대한 중복 크롤링 방지
-            price_cache = {}
+            for record in records:
+                total_processed += 1
 
-            for idx, record in enumerate(records, 1):
-                logger.info(f"[{idx}/{len(records)}] Processing {record['accommodation_name']} on {record['date']}")
-
-                try:
-                    if not record.get("naver_hotel_id"):
-                        logger.info("  Skipping: naver_hotel_id is missing")
-                        total_skipped += 1
-                        total_processed += 1
-                        continue
-
-                    check_in_date = record['date']
-                    check_in = datetime.strptime(check_in_date, "%Y-%m-%d").date()
-                    check_out = check_in + timedelta(days=1)
-                    check_out_date = check_out.isoformat()
-                    adult_cnt = _adult_count_from_capacity(record.get("capacity"))
-
-                    # 캐시 확인
-                    cache_key = (
-                        f"{record.get('naver_hotel_id') or record['accommodation_name']}"
-                        f"|{record.get('room_type') or ''}|{check_in_date}|{adult_cnt}"
-                    )
-                    if cache_key in price_cache:
-                        price = price_cache[cache_key]
-                        logger.info(f"  ✓ Using cached price: ₩{price:,.0f}")
-                    else:
-                        # 네이버 호텔에서 가격 검색
-                        price = await search_hotel_price_on_naver(
-                            page,
-                            record['accommodation_name'],
-                            record['room_type'],
-                            check_in_date,
-                            check_out_date,
-                            naver_hotel_id=record.get("naver_hotel_id"),
-                            capacity=adult_cnt,
-                        )
-
-                        if price:
-                            price_cache[cache_key] = price
-
-                    if price:
-                        updated = await update_online_price_in_db(record['date_id'], price)
-                        if updated:
-                            total_updated += 1
-                        else:
-                            total_skipped += 1
-                    else:
-                        total_failed += 1
+                if not record.get("naver_hotel_id"):
+                    total_skipped += 1
+                elif not prices.get(price_key(record)):
+                    total_failed += 1
 
-                    total_processed += 1
+            total_updated = price_result.updated
+            total_skipped += price_result.unchanged + price_result.missing
 
-                    # 과부하 방지
-                    await page.wait_for_timeout(2000)
+            # 가격이 바뀐 숙소의 온라인 평균가 통계 갱신
+            owner_by_date_id = {record['date_id']: record['accommodation_id'] for record in records}
+            updated_accommodation_ids = {owner_by_date_id[date_id] for date_id in price_result.changed_keys}
+            if updated_accommodation_ids:
+                async with AsyncSessionLocal() as db:
+                    stats_result = await refresh_accommodation_stats(db, list(updated_accommodation_ids))
+                    logger.info(f"Accommodation stats refreshed: {stats_result['total']} accommodations")
 
-                except Exception as e:
-                    logger.warning(f"Error processing record {record['date_id']}: {str(e)}")
-                    total_failed += 1
-                    continue
+            # 공개 API 응답 캐시 무효화
+            if price_result.changed_keys:
+                await invalidate_response_cache()
 
             logger.info("=" * 60)
             logger.info(f"Batch job completed:")
@@ -220,7 +186,8 @@ async def process_accommodation_dates_price_crawler() -> Dict:
             logger.info(f"  Successfully updated: {total_updated}")
             logger.info(f"  Skipped: {total_skipped}")
             logger.info(f"  Failed: {total_failed}")
-            logger.info(f"  Cache hits: {len(price_cache)}")
+            logger.info(f"  Cache hits: {fetch_stats.cache_hits}")
+            logger.info(f"  Fetched from Naver: {fetch_stats.fetched} ({fetch_stats.found} found)")
             logger.info("=" * 60)
 
             return {
@@ -229,7 +196,8 @@ async def process_accommodation_dates_price_crawler() -> Dict:
                 "total_updated": total_updated,
                 "total_skipped": total_skipped,
                 "total_failed": total_failed,
-                "cache_hits": len(price_cache),
+                "cache_hits": fetch_stats.cache_hits,
+                "fetch_stats": fetch_stats.as_dict(),
                 "timestamp": datetime.utcnow().isoformat()
             }
 
@@ -241,8 +209,8 @@ async def process_accommodation_dates_price_crawler() -> Dict:
                 "timestamp": datetime.utcnow().isoformat()
             }
         finally:
-            if page:
-                await page.close()
+            if price_cache:
+                price_cache.close()
             if context:
                 await context.close()
             if browser:
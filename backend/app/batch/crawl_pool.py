@@ -0,0 +1,219 @@
+"""
+Playwright 페이지 풀 기반 동시 크롤링 유틸리티
+
+하나의 로그인된 BrowserContext를 공유하는 N개의 Page로 URL 목록을 나눠 처리합니다.
+- 호스트별 요청 속도 제한 (토큰 버킷)
+  항목 단위가 아니라 요청 단위로 적용: 페이지 라우팅으로 대상 호스트의 페이지 이동(goto, 링크/폼)과
+  XHR/fetch(달력 클릭 등)가 나가기 전에 토큰을 받으므로, 항목당 요청이 여러 번이어도 실제 속도가 제한을 넘지 않음
+- 실패 시 페이지를 새로 열어 재시도
+- 진행률/예상 완료 시간 로그
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Set
+from urllib.parse import urlparse
+from playwright.async_api import BrowserContext, Page, Request, Route
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 속도 제한을 적용할 요청 종류 (페이지 이동 + 페이지 내 API 호출, 이미지/CSS 등 정적 리소스 제외)
+DEFAULT_THROTTLED_RESOURCE_TYPES = ("document", "xhr", "fetch")
+
+
+class HostRateLimiter:
+    """
+    호스트별 토큰 버킷 속도 제한기
+
+    rate(초당 요청 수)만큼 토큰이 채워지고, burst 개까지 모아둘 수 있습니다.
+    여러 워커가 같은 호스트로 요청하더라도 합산 요청 속도가 rate를 넘지 않습니다.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._buckets: Dict[str, Dict[str, float]] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    async def acquire(self, url_or_host: str) -> None:
+        """요청 전에 호출. 토큰이 없으면 채워질 때까지 대기"""
+        if self.rate <= 0:
+            return
+
+        host = _host(url_or_host)
+        lock = self._locks.setdefault(host, asyncio.Lock())
+
+        async with lock:
+            bucket = self._buckets.setdefault(
+                host, {"tokens": float(self.burst), "updated": time.monotonic()}
+            )
+            while True:
+                now = time.monotonic()
+                bucket["tokens"] = min(
+                    float(self.burst),
+                    bucket["tokens"] + (now - bucket["updated"]) * self.rate
+                )
+                bucket["updated"] = now
+
+                if bucket["tokens"] >= 1:
+                    bucket["tokens"] -= 1
+                    return
+
+                await asyncio.sleep((1 - bucket["tokens"]) / self.rate)
+
+
+def _host(url_or_host: str) -> str:
+    return urlparse(url_or_host).netloc or url_or_host
+
+
+async def _open_page(
+    context: BrowserContext,
+    rate_limiter: Optional[HostRateLimiter],
+    hosts: Set[str],
+    resource_types: Sequence[str],
+) -> Page:
+    """새 페이지를 열고, 대상 호스트로 나가는 요청마다 속도 제한 토큰을 받도록 라우팅"""
+    page = await context.new_page()
+    if rate_limiter is None or rate_limiter.rate <= 0:
+        return page
+
+    async def throttle(route: Route, request: Request) -> None:
+        if request.resource_type in resource_types:
+            await rate_limiter.acquire(request.url)
+        try:
+            await route.continue_()
+        except Exception:
+            # 대기 중 페이지가 닫힌 경우 등
+            pass
+
+    await page.route(lambda url: _host(url) in hosts, throttle)
+    return page
+
+
+@dataclass
+class PoolStats:
+    """페이지 풀 실행 결과 통계"""
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    retried: int = 0
+    elapsed_seconds: float = 0.0
+    failed_items: List[Any] = field(default_factory=list)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "total": self.total,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "retried": self.retried,
+            "elapsed_seconds": round(self.elapsed_seconds, 1),
+        }
+
+
+async def run_page_pool(
+    context: BrowserContext,
+    items: Sequence[Any],
+    worker: Callable[[Page, Any], Awaitable[Any]],
+    concurrency: int,
+    rate_limiter: Optional[HostRateLimiter] = None,
+    max_retries: int = 2,
+    item_url: Callable[[Any], str] = str,
+    label: str = "items",
+    throttled_resource_types: Sequence[str] = DEFAULT_THROTTLED_RESOURCE_TYPES,
+) -> tuple[List[Any], PoolStats]:
+    """
+    items를 concurrency개의 페이지로 나눠 worker(page, item)를 실행합니다.
+
+    Args:
+        context: 로그인된 BrowserContext (쿠키/세션 공유)
+        items: 처리할 항목 목록 (보통 URL)
+        worker: (page, item) → 결과. 실패 시 예외를 던지면 재시도
+        concurrency: 동시에 사용할 페이지 수
+        rate_limiter: 호스트별 속도 제한기 (항목의 호스트로 나가는 요청마다 적용)
+        max_retries: 항목당 추가 재시도 횟수
+        item_url: 항목에서 속도 제한 대상 호스트를 정할 URL을 꺼내는 함수
+        label: 진행률 로그에 표시할 이름
+        throttled_resource_types: 속도 제한을 적용할 요청 종류 (Playwright resource_type)
+
+    Returns:
+        (items 순서대로 정렬된 결과 리스트 - 실패 항목은 None, 실행 통계)
+    """
+    stats = PoolStats(total=len(items))
+    results: List[Any] = [None] * len(items)
+    if not items:
+        return results, stats
+
+    queue: asyncio.Queue = asyncio.Queue()
+    for index, item in enumerate(items):
+        queue.put_nowait((index, item))
+
+    started_at = time.monotonic()
+    concurrency = max(1, min(concurrency, len(items)))
+    throttled_hosts = {_host(item_url(item)) for item in items}
+
+    def log_progress() -> None:
+        done = stats.succeeded + stats.failed
+        elapsed = time.monotonic() - started_at
+        eta = elapsed / done * (stats.total - done) if done else 0
+        logger.info(
+            f"  Progress {label}: {done}/{stats.total} "
+            f"(failed {stats.failed}, elapsed {elapsed:.0f}s, ETA {eta:.0f}s)"
+        )
+
+    async def run_worker(worker_id: int) -> None:
+        page: Optional[Page] = None
+        try:
+            while True:
+                try:
+                    index, item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                for attempt in range(max_retries + 1):
+                    try:
+                        # 페이지 열기 실패도 항목 실패로 처리 (전체 gather가 중단되지 않도록)
+                        if page is None:
+                            page = await _open_page(
+                                context, rate_limiter, throttled_hosts, throttled_resource_types
+                            )
+                        results[index] = await worker(page, item)
+                        stats.succeeded += 1
+                        break
+                    except Exception as e:
+                        logger.warning(
+                            f"  [worker {worker_id}] {item} failed "
+                            f"(attempt {attempt + 1}/{max_retries + 1}): {str(e)}"
+                        )
+                        # 실패한 페이지는 상태를 알 수 없으므로 새 페이지로 교체
+                        if page is not None:
+                            try:
+                                await page.close()
+                            except Exception:
+                                pass
+                        page = None
+                        if attempt < max_retries:
+                            stats.retried += 1
+                            await asyncio.sleep(2 ** attempt)
+                else:
+                    stats.failed += 1
+                    stats.failed_items.append(item)
+
+                log_progress()
+        finally:
+            if page:
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+
+    logger.info(f"Starting page pool: {len(items)} {label}, {concurrency} pages")
+    await asyncio.gather(*(run_worker(worker_id) for worker_id in range(concurrency)))
+
+    stats.elapsed_seconds = time.monotonic() - started_at
+    logger.info(
+        f"Page pool finished: {stats.succeeded}/{stats.total} succeeded, "
+        f"{stats.failed} failed, {stats.retried} retries, {stats.elapsed_seconds:.1f}s"
+    )
+    return results, stats
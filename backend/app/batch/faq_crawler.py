@@ -570,6 +570,25 @@ async def save_faqs_to_db(faq_items: List[Dict]):
             raise
 
 
+async def sync_faq_vectors() -> Dict:
+    """
+    크롤링 후 FAQ 벡터 증분 동기화
+    벡터화에 실패해도 크롤링 결과는 유지되도록 오류를 결과에 담아 반환
+    
+    Returns:
+        Dict: 동기화 결과 (추가/변경/삭제 개수) 또는 오류 메시지
+    """
+    try:
+        from app.services.faq_vector_service import get_faq_vector_service
+        
+        faq_vector_service = get_faq_vector_service()
+        async with AsyncSessionLocal() as db:
+            return await faq_vector_service.sync_faqs(db)
+    except Exception as e:
+        logger.error(f"FAQ vector sync failed: {str(e)}", exc_info=True)
+        return {"error": str(e)}
+
+
 async def process_faq_crawling(
     username: Optional[str] = None,
     password: Optional[str] = None
@@ -711,9 +730,13 @@ async def process_faq_crawling(
             
             logger.info(f"FAQ crawling completed: {len(faq_items)} FAQ items")
             
+            # 단계 5: 바뀐 FAQ만 벡터 스토어에 반영
+            vector_sync = await sync_faq_vectors()
+            
             return {
                 "status": "success",
                 "faq_count": len(faq_items),
+                "vector_sync": vector_sync,
                 "timestamp": datetime.utcnow().isoformat()
             }
             
@@ -1,8 +1,10 @@
 import json
 import re
 from datetime import datetime, timedelta
-from typing import List, Optional
+from html.parser import HTMLParser
+from typing import Any, Dict, List, Optional
 
+import httpx
 from playwright.async_api import Page
 
 from app.utils.logger import get_logger
@@ -39,6 +41,31 @@ PRICE_PATTERNS = [
 MIN_PRICE = 10_000
 MAX_PRICE = 10_000_000
 
+# HTTP 전용 조회 (Playwright 없이 상세 페이지 HTML/JSON 파싱)
+HTTP_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "ko-KR,ko;q=0.9",
+    "Referer": NAVER_HOTEL_BASE_URL + "/",
+}
+NEXT_DATA_PATTERN = re.compile(
+    r'<script[^>]+id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL
+)
+# 닫는 태그가 없는 HTML 요소 (Info 블록 깊이 계산에서 제외)
+VOID_HTML_ELEMENTS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "source", "track", "wbr",
+}
+# JSON 페이로드에서 가격으로 취급할 키 (소문자 비교)
+PRICE_JSON_KEYS = ("lowestprice", "minprice", "saleprice", "price")
+# 호텔 노드를 식별하는 키 (소문자 비교) - 추천/주변 호텔 노드와 구분
+HOTEL_ID_JSON_KEYS = ("hotelid", "hotelcid", "naverhotelid", "cid")
+# 요금 구성 항목(세금, 할인, 1박별 금액 등) 하위 트리는 가격 후보에서 제외
+PRICE_FRAGMENT_JSON_MARKERS = ("breakdown", "nightly", "daily", "tax", "fee", "coupon", "discount")
+
 
 def _normalize_prices(text: str) -> List[float]:
     if not text:
@@ -307,3 +334,153 @@ async def search_hotel_price_on_naver(
         logger.warning(f"  ⚠️  No Naver Hotel price found for {search_query}")
 
     return price
+
+
+def create_naver_http_client(max_connections: int = 10) -> httpx.AsyncClient:
+    """네이버 호텔 HTTP 조회용 커넥션 풀 클라이언트"""
+    return httpx.AsyncClient(
+        headers=HTTP_HEADERS,
+        timeout=httpx.Timeout(15.0, connect=5.0),
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        ),
+        follow_redirects=True,
+    )
+
+
+def _json_hotel_id(node: Dict) -> Optional[str]:
+    """호텔 ID 키가 있는 노드면 그 값을 반환"""
+    for key, value in node.items():
+        if isinstance(key, str) and key.lower() in HOTEL_ID_JSON_KEYS:
+            if isinstance(value, (str, int)) and not isinstance(value, bool):
+                return str(value).strip()
+    return None
+
+
+def _find_hotel_nodes(node: Any, hotel_id: str, found: List[Dict]) -> None:
+    """JSON 트리에서 요청한 호텔 ID를 가진 노드 수집"""
+    if isinstance(node, dict):
+        if _json_hotel_id(node) == hotel_id:
+            found.append(node)
+            return
+        for value in node.values():
+            _find_hotel_nodes(value, hotel_id, found)
+    elif isinstance(node, list):
+        for item in node:
+            _find_hotel_nodes(item, hotel_id, found)
+
+
+def _collect_json_prices(node: Any, hotel_id: str, prices: List[float]) -> None:
+    """호텔 노드 안의 가격 값 수집 (다른 호텔 노드, 요금 구성 항목은 건너뜀)"""
+    if isinstance(node, dict):
+        node_hotel_id = _json_hotel_id(node)
+        if node_hotel_id is not None and node_hotel_id != hotel_id:
+            return
+        for key, value in node.items():
+            lowered = key.lower() if isinstance(key, str) else ""
+            if lowered in PRICE_JSON_KEYS:
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    if MIN_PRICE <= value <= MAX_PRICE:
+                        prices.append(float(value))
+                elif isinstance(value, str):
+                    prices.extend(_normalize_prices(f"{value}원"))
+            if any(marker in lowered for marker in PRICE_FRAGMENT_JSON_MARKERS):
+                continue
+            _collect_json_prices(value, hotel_id, prices)
+    elif isinstance(node, list):
+        for item in node:
+            _collect_json_prices(item, hotel_id, prices)
+
+
+class _InfoPriceParser(HTMLParser):
+    """
+    첫 Info_Info__* 블록 안의 첫 common_price__* 요소 텍스트만 수집 (INFO_PRICE_SELECTOR와 같은 위치)
+    블록이 끝날 때까지 가격 요소가 없으면 뒤쪽 블록(추천/주변 호텔 카드)은 읽지 않음
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.depth = 0
+        self.info_depth: Optional[int] = None
+        self.price_depth: Optional[int] = None
+        self.done = False
+        self.parts: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if self.done or tag in VOID_HTML_ELEMENTS:
+            return
+        self.depth += 1
+        class_name = dict(attrs).get("class") or ""
+        if self.info_depth is None:
+            if class_name.startswith("Info_Info__"):
+                self.info_depth = self.depth
+        elif self.price_depth is None and class_name.startswith("common_price__"):
+            self.price_depth = self.depth
+
+    def handle_endtag(self, tag):
+        if self.done or tag in VOID_HTML_ELEMENTS:
+            return
+        if self.depth in (self.price_depth, self.info_depth):
+            self.done = True
+        self.depth -= 1
+
+    def handle_data(self, data):
+        if self.price_depth is not None and not self.done:
+            self.parts.append(data)
+
+
+def _extract_prices_from_html(html: str, hotel_id: str) -> List[float]:
+    """
+    상세 페이지 HTML에서 요청한 호텔의 가격 추출.
+    1) __NEXT_DATA__ JSON 페이로드 중 hotel_id 노드 안의 가격 필드
+    2) 서버 렌더링된 첫 Info_Info__* 블록 안의 첫 common_price__* 텍스트 (Playwright 경로와 같은 위치)
+    어느 쪽에서도 찾지 못하면 빈 리스트 (페이지의 다른 호텔 가격은 사용하지 않음)
+    """
+    prices: List[float] = []
+    hotel_id = str(hotel_id).strip()
+
+    match = NEXT_DATA_PATTERN.search(html)
+    if match:
+        try:
+            hotel_nodes: List[Dict] = []
+            _find_hotel_nodes(json.loads(match.group(1)), hotel_id, hotel_nodes)
+            for node in hotel_nodes:
+                _collect_json_prices(node, hotel_id, prices)
+        except (ValueError, TypeError):
+            logger.debug("Failed to parse __NEXT_DATA__ payload")
+
+    if not prices:
+        parser = _InfoPriceParser()
+        parser.feed(html)
+        prices.extend(_normalize_prices(" ".join(parser.parts)))
+
+    return prices
+
+
+async def fetch_hotel_price_via_http(
+    client: httpx.AsyncClient,
+    naver_hotel_id: str,
+    check_in_date: str,
+    check_out_date: Optional[str] = None,
+    capacity: Optional[int] = None,
+) -> Optional[float]:
+    """
+    브라우저 없이 상세 URL을 HTTP로 받아 최저가 추출.
+    가격을 찾지 못하면 None을 반환하며, 호출자는 Playwright 경로로 폴백합니다.
+    """
+    check_out_date = _ensure_check_out_date(check_in_date, check_out_date)
+    adult_cnt = _sanitize_adult_count(capacity)
+    detail_url = _build_detail_url(naver_hotel_id, check_in_date, check_out_date, adult_cnt=adult_cnt)
+
+    try:
+        response = await client.get(detail_url)
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        logger.debug(f"Naver Hotel HTTP fetch failed for CID {naver_hotel_id}: {e}")
+        return None
+
+    price = _pick_lowest_price(_extract_prices_from_html(response.text, naver_hotel_id))
+    if price:
+        logger.info(f"  ✓ Naver Hotel price found via HTTP: ₩{price:,.0f}")
+    return price
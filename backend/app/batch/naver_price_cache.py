@@ -0,0 +1,90 @@
+"""
+네이버 호텔 가격 영구 캐시
+
+(naver_hotel_id, 체크인 날짜, 성인 수) → 가격을 로컬 SQLite 파일에 TTL과 함께 저장합니다.
+accommodation_dates_price_crawler와 today_accommodation_price_crawler가 같은 파일을 공유하므로
+같은 호텔/날짜를 하루에 두 번 조회하지 않습니다.
+"""
+
+import os
+import sqlite3
+import tempfile
+import time
+from typing import Optional, Tuple
+from app.config import settings
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+PriceKey = Tuple[str, str, int]
+
+
+def _default_cache_path() -> str:
+    # Lambda 등 읽기 전용 환경에서도 쓸 수 있도록 임시 디렉터리 사용
+    return os.path.join(tempfile.gettempdir(), "refresh_plus_naver_price_cache.sqlite3")
+
+
+class NaverPriceCache:
+    """SQLite 기반 네이버 호텔 가격 캐시"""
+
+    def __init__(self, path: Optional[str] = None, ttl_hours: Optional[float] = None):
+        self.path = path or settings.NAVER_PRICE_CACHE_PATH or _default_cache_path()
+        ttl = settings.NAVER_PRICE_CACHE_TTL_HOURS if ttl_hours is None else ttl_hours
+        self.ttl_seconds = ttl * 3600
+        self.hits = 0
+        self.misses = 0
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.path, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS naver_prices (
+                naver_hotel_id TEXT NOT NULL,
+                check_in_date TEXT NOT NULL,
+                adults INTEGER NOT NULL,
+                price REAL NOT NULL,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (naver_hotel_id, check_in_date, adults)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get(self, key: PriceKey) -> Optional[float]:
+        """TTL 안에 저장된 가격을 반환 (없으면 None)"""
+        row = self._conn.execute(
+            "SELECT price FROM naver_prices "
+            "WHERE naver_hotel_id = ? AND check_in_date = ? AND adults = ? AND fetched_at >= ?",
+            (*key, time.time() - self.ttl_seconds),
+        ).fetchone()
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return row[0]
+
+    def set(self, key: PriceKey, price: float) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO naver_prices "
+            "(naver_hotel_id, check_in_date, adults, price, fetched_at) VALUES (?, ?, ?, ?, ?)",
+            (*key, price, time.time()),
+        )
+        self._conn.commit()
+
+    def purge_expired(self) -> int:
+        """만료된 항목 삭제 후 삭제 건수 반환"""
+        cursor = self._conn.execute(
+            "DELETE FROM naver_prices WHERE fetched_at < ?",
+            (time.time() - self.ttl_seconds,),
+        )
+        self._conn.commit()
+        return cursor.rowcount
+
+    def close(self) -> None:
+        self._conn.close()
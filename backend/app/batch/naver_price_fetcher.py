@@ -0,0 +1,289 @@
+"""
+네이버 호텔 가격 동시 조회
+
+가격 크롤러들이 공유하는 조회 단계입니다.
+1. 레코드를 (naver_hotel_id, 날짜, 성인 수) 키로 묶어 중복 조회 제거
+2. 영구 캐시(NaverPriceCache)에 있는 키는 건너뜀
+3. 나머지는 HTTP 전용 경로(httpx)로 먼저 조회
+4. HTTP로 찾지 못한 키만 K개 페이지 풀(Playwright)로 조회
+가격이 확정되는 즉시 캐시에 저장하고 on_price로 넘기므로(PriceWriteBuffer가 DB 기록을 모아 처리),
+Lambda 시간 초과 등으로 작업이 중간에 끊겨도 그때까지 찾은 가격은 남습니다.
+엔진별 적중률/지연 시간을 기록해 HTTP 경로가 얼마나 통하는지 보고합니다.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional
+from playwright.async_api import BrowserContext, Page
+from app.batch.crawl_pool import HostRateLimiter, run_page_pool
+from app.batch.naver_hotel_price import (
+    NAVER_HOTEL_BASE_URL,
+    _sanitize_adult_count,
+    create_naver_http_client,
+    fetch_hotel_price_via_http,
+    search_hotel_price_on_naver,
+)
+from app.batch.naver_price_cache import NaverPriceCache, PriceKey
+from app.config import settings
+from app.utils.bulk_upsert import UpsertResult
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 가격이 확정될 때마다 호출되는 콜백 (캐시 키, 가격)
+PriceCallback = Callable[[PriceKey, float], Awaitable[None]]
+
+
+def price_key(record: Dict) -> PriceKey:
+    """가격 레코드의 캐시 키 (naver_hotel_id, 체크인 날짜, 성인 수 - 상세 URL의 adultCnt와 같은 규칙)"""
+    return (
+        str(record["naver_hotel_id"]).strip(),
+        record["date"],
+        _sanitize_adult_count(record.get("capacity")),
+    )
+
+
+class PriceWriteBuffer:
+    """
+    확정된 가격을 레코드 ID별로 모아 flush_size건마다 DB에 기록
+
+    fetch_naver_prices(on_price=buffer.add)로 넘기면 조회 도중에도 가격이 DB에 반영됩니다.
+    """
+
+    def __init__(
+        self,
+        records: List[Dict],
+        id_field: str,
+        write: Callable[[Dict[str, float]], Awaitable[UpsertResult]],
+        table: str,
+        flush_size: int,
+    ):
+        self._ids_by_key: Dict[PriceKey, List[str]] = {}
+        for record in records:
+            if record.get("naver_hotel_id"):
+                self._ids_by_key.setdefault(price_key(record), []).append(record[id_field])
+        self._write = write
+        self._flush_size = flush_size
+        self._pending: Dict[str, float] = {}
+        self.result = UpsertResult(table=table)
+
+    async def add(self, key: PriceKey, price: float) -> None:
+        for record_id in self._ids_by_key.get(key, []):
+            self._pending[record_id] = price
+        if len(self._pending) < self._flush_size:
+            return
+        try:
+            await self.flush()
+        except Exception as e:
+            # 조회는 계속 진행하고, 실패한 묶음은 다음 flush에서 다시 기록
+            logger.warning(f"Price flush failed, will retry with the next batch: {str(e)}")
+
+    async def flush(self) -> None:
+        """대기 중인 가격 기록 (실패 시 대기 목록으로 되돌리고 예외 전파)"""
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, {}
+        try:
+            self.result.merge(await self._write(batch))
+        except Exception:
+            self._pending = {**batch, **self._pending}
+            raise
+
+
+@dataclass
+class EngineStats:
+    """조회 엔진(http/playwright)별 적중률 및 지연 시간"""
+    attempts: int = 0
+    hits: int = 0
+    latencies: List[float] = field(default_factory=list)
+
+    def record(self, hit: bool, latency: float) -> None:
+        self.attempts += 1
+        if hit:
+            self.hits += 1
+        self.latencies.append(latency)
+
+    def as_dict(self) -> Dict[str, float]:
+        latencies = sorted(self.latencies)
+        return {
+            "attempts": self.attempts,
+            "hits": self.hits,
+            "hit_rate": round(self.hits / self.attempts, 3) if self.attempts else 0.0,
+            "avg_latency_ms": round(sum(latencies) / len(latencies) * 1000, 1) if latencies else 0.0,
+            "p50_latency_ms": round(latencies[len(latencies) // 2] * 1000, 1) if latencies else 0.0,
+        }
+
+
+@dataclass
+class PriceFetchStats:
+    """가격 조회 통계"""
+    unique_keys: int = 0
+    cache_hits: int = 0
+    fetched: int = 0
+    found: int = 0
+    failed: int = 0
+    engines: Dict[str, EngineStats] = field(
+        default_factory=lambda: {"http": EngineStats(), "playwright": EngineStats()}
+    )
+
+    def as_dict(self) -> Dict:
+        return {
+            "unique_keys": self.unique_keys,
+            "cache_hits": self.cache_hits,
+            "fetched": self.fetched,
+            "found": self.found,
+            "failed": self.failed,
+            "engines": {name: engine.as_dict() for name, engine in self.engines.items()},
+        }
+
+
+async def _fetch_via_http(
+    keys: List[PriceKey],
+    rate_limiter: HostRateLimiter,
+    concurrency: int,
+    stats: PriceFetchStats,
+    resolve: PriceCallback,
+) -> Dict[PriceKey, float]:
+    """HTTP 전용 경로로 키 목록을 동시 조회 (찾은 키만 반환, 찾는 즉시 resolve 호출)"""
+    found: Dict[PriceKey, float] = {}
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with create_naver_http_client(max_connections=concurrency) as client:
+        async def fetch_one(key: PriceKey) -> None:
+            async with semaphore:
+                await rate_limiter.acquire(NAVER_HOTEL_BASE_URL)
+                started_at = time.monotonic()
+                try:
+                    price = await fetch_hotel_price_via_http(client, key[0], key[1], capacity=key[2])
+                except Exception as e:
+                    logger.debug(f"HTTP price fetch error for {key}: {str(e)}")
+                    price = None
+                stats.engines["http"].record(bool(price), time.monotonic() - started_at)
+                if price:
+                    found[key] = price
+                    await resolve(key, price)
+
+        await asyncio.gather(*(fetch_one(key) for key in keys))
+
+    return found
+
+
+async def fetch_naver_prices(
+    context: BrowserContext,
+    records: List[Dict],
+    cache: NaverPriceCache,
+    concurrency: Optional[int] = None,
+    requests_per_second: Optional[float] = None,
+    on_price: Optional[PriceCallback] = None,
+) -> tuple[Dict[PriceKey, float], PriceFetchStats]:
+    """
+    레코드 목록의 네이버 호텔 가격을 조회합니다.
+
+    Args:
+        context: 브라우저 컨텍스트 (페이지 풀이 페이지를 엽니다)
+        records: naver_hotel_id/date/capacity/accommodation_name/room_type을 가진 레코드
+        cache: 영구 가격 캐시
+        concurrency: 동시 페이지 수 (None이면 settings.NAVER_PRICE_CONCURRENCY)
+        requests_per_second: 초당 요청 수 (None이면 settings.NAVER_PRICE_REQUESTS_PER_SECOND)
+        on_price: 가격이 확정될 때마다(캐시 적중 포함) 호출할 콜백 (예: PriceWriteBuffer.add)
+
+    Returns:
+        ({캐시 키: 가격}, 조회 통계) - 가격을 찾지 못한 키는 포함되지 않음
+    """
+    stats = PriceFetchStats()
+    prices: Dict[PriceKey, float] = {}
+
+    async def resolve(key: PriceKey, price: float) -> None:
+        # 새로 찾은 가격은 바로 캐시에 저장 (작업이 중간에 끊겨도 다음 실행에서 재사용)
+        cache.set(key, price)
+        if on_price:
+            await on_price(key, price)
+
+    # 1. 키별 대표 레코드 (같은 호텔/날짜/인원은 한 번만 조회)
+    representatives: Dict[PriceKey, Dict] = {}
+    for record in records:
+        if record.get("naver_hotel_id"):
+            representatives.setdefault(price_key(record), record)
+    stats.unique_keys = len(representatives)
+
+    # 2. 영구 캐시 확인
+    to_fetch: List[PriceKey] = []
+    for key in representatives:
+        cached = cache.get(key)
+        if cached is not None:
+            prices[key] = cached
+            stats.cache_hits += 1
+            if on_price:
+                await on_price(key, cached)
+        else:
+            to_fetch.append(key)
+
+    logger.info(
+        f"Naver price lookup: {len(records)} records → {stats.unique_keys} unique keys, "
+        f"{stats.cache_hits} cache hits, {len(to_fetch)} to fetch"
+    )
+
+    if not to_fetch:
+        return prices, stats
+
+    concurrency = concurrency or settings.NAVER_PRICE_CONCURRENCY
+    rate_limiter = HostRateLimiter(
+        requests_per_second or settings.NAVER_PRICE_REQUESTS_PER_SECOND
+    )
+
+    # 3. HTTP 전용 경로 (브라우저 렌더링 없이 HTML/JSON 파싱)
+    fetched: Dict[PriceKey, Optional[float]] = {}
+    if settings.NAVER_PRICE_HTTP_ENABLED:
+        fetched.update(await _fetch_via_http(to_fetch, rate_limiter, concurrency, stats, resolve))
+
+    # 4. HTTP로 찾지 못한 키만 Playwright 페이지 풀로 조회
+    fallback_keys = [key for key in to_fetch if key not in fetched]
+
+    async def fetch_one(page: Page, key: PriceKey) -> Optional[float]:
+        record = representatives[key]
+        check_in = datetime.strptime(key[1], "%Y-%m-%d").date()
+        started_at = time.monotonic()
+        price = await search_hotel_price_on_naver(
+            page,
+            record["accommodation_name"],
+            record.get("room_type"),
+            key[1],
+            (check_in + timedelta(days=1)).isoformat(),
+            naver_hotel_id=key[0],
+            capacity=key[2],
+        )
+        stats.engines["playwright"].record(bool(price), time.monotonic() - started_at)
+        if price:
+            await resolve(key, price)
+        return price
+
+    if fallback_keys:
+        results, _ = await run_page_pool(
+            context,
+            fallback_keys,
+            fetch_one,
+            concurrency=concurrency,
+            rate_limiter=rate_limiter,
+            max_retries=1,
+            item_url=lambda key: NAVER_HOTEL_BASE_URL,
+            label="naver prices",
+            # HTTP 경로와 같은 기준(상세 페이지 요청 1회당 토큰 1개)으로 제한, 페이지 내 API 호출은 제외
+            throttled_resource_types=("document",),
+        )
+        fetched.update(zip(fallback_keys, results))
+
+    for engine_name, engine in stats.engines.items():
+        logger.info(f"  Engine {engine_name}: {engine.as_dict()}")
+
+    for key in to_fetch:
+        price = fetched.get(key)
+        stats.fetched += 1
+        if price:
+            prices[key] = price
+            stats.found += 1
+        else:
+            stats.failed += 1
+
+    return prices, stats
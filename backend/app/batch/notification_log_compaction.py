@@ -0,0 +1,90 @@
+"""
+알림 로그 중복 방지 데이터 정리 배치 작업
+- 만료된 notification_logs의 dedup_key/dedup_expires_at를 비워 중복 방지 인덱스를 작게 유지
+- 발송 이력(제목/본문/상태)은 그대로 보존
+- 매일 04:00 KST 실행
+"""
+
+import json
+from datetime import datetime
+from sqlalchemy import select, update
+from app.database import AsyncSessionLocal
+from app.models.notification_log import NotificationLog
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 한 번에 정리할 행 수
+COMPACTION_BATCH_SIZE = 1000
+
+async def process_notification_log_compaction():
+    """
+    만료된 중복 방지 데이터 정리
+    - dedup_expires_at <= 현재 시각인 행의 dedup 컬럼을 NULL로 변경
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            logger.info("=" * 80)
+            logger.info("Starting notification log compaction")
+            logger.info("=" * 80)
+
+            now = datetime.utcnow()
+            compacted = 0
+
+            while True:
+                result = await db.execute(
+                    select(NotificationLog.id)
+                    .where(NotificationLog.dedup_expires_at <= now)
+                    .limit(COMPACTION_BATCH_SIZE)
+                )
+                ids = result.scalars().all()
+                if not ids:
+                    break
+
+                await db.execute(
+                    update(NotificationLog)
+                    .where(NotificationLog.id.in_(ids))
+                    .values(dedup_key=None, dedup_expires_at=None)
+                )
+                await db.commit()
+                compacted += len(ids)
+
+
+            logger.info("=" * 80)
+            logger.info(f"Notification log compaction completed")
+            logger.info(f"Compacted: {compacted}")
+            logger.info("=" * 80)
+
+            return {
+                "status": "success",
+                "compacted": compacted,
+                "timestamp": datetime.utcnow().isoformat()
+            }
+
+        except Exception as e:
+            logger.error(f"Notification log compaction failed: {str(e)}", exc_info=True)
+            return {
+                "status": "error",
+                "message": str(e),
+                "timestamp": datetime.utcnow().isoformat()
+            }
+
+def handler(event, context):
+    """AWS Lambda 핸들러"""
+    import asyncio
+
+    try:
+        result = asyncio.run(process_notification_log_compaction())
+        return {
+            "statusCode": 200,
+            "body": json.dumps(result)
+        }
+    except Exception as e:
+        logger.error(f"Lambda handler error: {str(e)}")
+        return {
+            "statusCode": 500,
+            "body": json.dumps({
+                "status": "error",
+                "message": str(e)
+            })
+        }
@@ -5,24 +5,23 @@
 """
 
 import asyncio
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import List, Dict, Optional
 from sqlalchemy import select
 from app.database import AsyncSessionLocal
 from app.models.accommodation import Accommodation
 from app.models.today_accommodation import TodayAccommodation
-from app.batch.naver_hotel_price import search_hotel_price_on_naver
+from app.batch.naver_price_cache import NaverPriceCache
+from app.batch.naver_price_fetcher import PriceWriteBuffer, fetch_naver_prices, price_key
 from app.utils.logger import get_logger
-from playwright.async_api import async_playwright, Browser, Page, BrowserContext
+from app.utils.response_cache import invalidate_response_cache
+from app.utils.bulk_upsert import bulk_upsert, keep_existing, UpsertResult
+from playwright.async_api import async_playwright, Browser, BrowserContext
 
 logger = get_logger(__name__)
 
-def _adult_count_from_capacity(capacity: Optional[int]) -> int:
-    try:
-        return max(1, int(capacity)) if capacity is not None else 2
-    except (TypeError, ValueError):
-        return 2
-
+# 가격을 모아서 DB에 기록하는 단위
+PRICE_FLUSH_SIZE = 50
 
 async def get_today_accommodation_records() -> List[Dict]:
     """
@@ -83,36 +82,28 @@ async def get_today_accommodation_records() -> List[Dict]:
             return []
 
 
-async def update_online_price_in_db(today_id: str, online_price: float) -> bool:
+async def update_online_prices_in_db(prices: Dict[str, float]) -> UpsertResult:
     """
-    today_accommodation_info 테이블의 online_price 업데이트
+    today_accommodation_info 테이블의 online_price 일괄 업데이트
+    - 기존 레코드를 IN 쿼리 한 번으로 조회한 뒤 가격이 비어 있는 레코드만 갱신
     """
     async with AsyncSessionLocal() as db:
         try:
-            # 기존 레코드 조회
-            result = await db.execute(
-                select(TodayAccommodation).where(TodayAccommodation.id == today_id)
+            result = await bulk_upsert(
+                db,
+                TodayAccommodation,
+                [{"id": record_id, "online_price": price} for record_id, price in prices.items()],
+                compare_columns=("online_price",),
+                merge=keep_existing("online_price"),
+                insert_missing=False,
             )
-            record = result.scalar_one_or_none()
-
-            if record:
-                if record.online_price is not None:
-                    logger.info(f"  Skipping {today_id}: online_price already set")
-                    return False
-
-                record.online_price = online_price
-                record.updated_at = datetime.utcnow()
-                db.add(record)
-                await db.commit()
-                logger.debug(f"  Updated online_price: ₩{online_price:,.0f}")
-                return True
-            else:
-                logger.warning(f"  TodayAccommodation record not found: {today_id}")
-                return False
+            await db.commit()
+            logger.info(f"  Flushed {len(prices)} prices - {result}")
+            return result
 
         except Exception as e:
             await db.rollback()
-            logger.error(f"Error updating online_price for {today_id}: {str(e)}")
+            logger.error(f"Error updating online_price for {len(prices)} records: {str(e)}")
             raise
 
 
@@ -123,7 +114,7 @@ async def process_today_accommodation_price_crawler() -> Dict:
     async with async_playwright() as p:
         browser: Browser = None
         context: BrowserContext = None
-        page: Page = None
+        price_cache: Optional[NaverPriceCache] = None
 
         try:
             logger.info("=" * 60)
@@ -157,78 +148,38 @@ async def process_today_accommodation_price_crawler() -> Dict:
                 user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
                 locale="ko-KR"
             )
-            page = await context.new_page()
+            price_cache = NaverPriceCache()
+            price_cache.purge_expired()
+
+            # 네이버 가격 조회 (영구 캐시 + 페이지 풀 동시 조회)
+            # 가격이 확정되는 즉시 버퍼에 넣어 PRICE_FLUSH_SIZE건마다 DB에 기록
+            price_writer = PriceWriteBuffer(
+                records, "today_id", update_online_prices_in_db, TodayAccommodation.__tablename__, PRICE_FLUSH_SIZE
+            )
+            prices, fetch_stats = await fetch_naver_prices(
+                context, records, price_cache, on_price=price_writer.add
+            )
+            await price_writer.flush()
+            price_result = price_writer.result
 
-            # 각 레코드 처리
             total_processed = 0
-            total_updated = 0
             total_failed = 0
             total_skipped = 0
 
-            # 같은 숙소/방타입/날짜에 대해 중복 크롤링 방지 (캐시)
-            price_cache = {}
+            for record in records:
+                total_processed += 1
 
-            for idx, record in enumerate(records, 1):
-                logger.info(f"[{idx}/{len(records)}] Processing {record['accommodation_name']} on {record['date']}")
-
-                try:
-                    if not record.get("naver_hotel_id"):
-                        logger.info("  Skipping: naver_hotel_id is missing")
-                        total_skipped += 1
-                        total_processed += 1
-                        continue
-
-                    # 체크인 날짜 = record['date']
-                    # 체크아웃 날짜 = 체크인 + 1일
-                    check_in_date = record['date']
-                    check_in = datetime.strptime(check_in_date, "%Y-%m-%d").date()
-                    check_out = check_in + timedelta(days=1)
-                    check_out_date = check_out.isoformat()
-                    adult_cnt = _adult_count_from_capacity(record.get("capacity"))
-
-                    # 캐시 확인
-                    cache_key = (
-                        f"{record.get('naver_hotel_id') or record['accommodation_name']}"
-                        f"|{record.get('room_type') or ''}|{check_in_date}|{adult_cnt}"
-                    )
-                    if cache_key in price_cache:
-                        price = price_cache[cache_key]
-                        logger.info(f"  ✓ Using cached price: ₩{price:,.0f}")
-                    else:
-                        # 네이버 호텔에서 가격 검색
-                        price = await search_hotel_price_on_naver(
-                            page,
-                            record['accommodation_name'],
-                            record['room_type'],
-                            check_in_date,
-                            check_out_date,
-                            naver_hotel_id=record.get("naver_hotel_id"),
-                            capacity=adult_cnt,
-                        )
-
-                        # 캐시에 저장
-                        if price:
-                            price_cache[cache_key] = price
-
-                    if price:
-                        # DB 업데이트
-                        updated = await update_online_price_in_db(record['today_id'], price)
-                        if updated:
-                            total_updated += 1
-                        else:
-                            total_skipped += 1
-                    else:
-                        total_failed += 1
-
-                    total_processed += 1
+                if not record.get("naver_hotel_id"):
+                    total_skipped += 1
+                elif not prices.get(price_key(record)):
+                    total_failed += 1
 
-                    # 과부하 방지
-                    await page.wait_for_timeout(2000)
+            total_updated = price_result.updated
+            total_skipped += price_result.unchanged + price_result.missing
 
-                except Exception as e:
-                    logger.warning(f"Error processing record {record['today_id']}: {str(e)}")
-                    total_failed += 1
-                    continue
+            # 공개 API 응답 캐시 무효화
+            if price_result.changed_keys:
+                await invalidate_response_cache()
 
             logger.info("=" * 60)
             logger.info(f"Batch job completed:")
@@ -236,7 +187,8 @@ async def process_today_accommodation_price_crawler() -> Dict:
             logger.info(f"  Successfully updated: {total_updated}")
             logger.info(f"  Skipped: {total_skipped}")
             logger.info(f"  Failed: {total_failed}")
-            logger.info(f"  Cache hits: {len(price_cache)}")
+            logger.info(f"  Cache hits: {fetch_stats.cache_hits}")
+            logger.info(f"  Fetched from Naver: {fetch_stats.fetched} ({fetch_stats.found} found)")
             logger.info("=" * 60)
 
             return {
@@ -245,7 +197,8 @@ async def process_today_accommodation_price_crawler() -> Dict:
                 "total_updated": total_updated,
                 "total_skipped": total_skipped,
                 "total_failed": total_failed,
-                "cache_hits": len(price_cache),
+                "cache_hits": fetch_stats.cache_hits,
+                "fetch_stats": fetch_stats.as_dict(),
                 "timestamp": datetime.utcnow().isoformat()
             }
 
@@ -257,8 +210,8 @@ async def process_today_accommodation_price_crawler() -> Dict:
                 "timestamp": datetime.utcnow().isoformat()
             }
         finally:
-            if page:
-                await page.close()
+            if price_cache:
+                price_cache.close()
             if context:
                 await context.close()
             if browser:
@@ -16,7 +16,9 @@ from app.models.accommodation import Accommodation
 from app.models.today_accommodation import TodayAccommodation
 from app.config import settings
 from app.utils.logger import get_logger
+from app.utils.response_cache import invalidate_response_cache
 from app.utils.sol_score import calculate_sol_scores_for_today_accommodation
+from app.utils.bulk_upsert import bulk_upsert
 from playwright.async_api import async_playwright, Browser, Page, BrowserContext
 from auth.lulu_lala_auth import (
     login_to_lulu_lala,
@@ -438,9 +440,7 @@ async def save_today_accommodations_to_db(
     """
     async with AsyncSessionLocal() as db:
         try:
-            saved = 0
-            updated = 0
-
+            rows = []
             for date_info in dates_info:
                 date_str = date_info["date"]
 
@@ -459,45 +459,32 @@ async def save_today_accommodations_to_db(
                     logger.warning(f"Invalid date: {date_str}")
                     continue
 
-                # TodayAccommodation ID 생성
-                today_id = f"today_{accommodation_id}_{date_str}"
+                rows.append({
+                    "id": f"today_{accommodation_id}_{date_str}",
+                    "year": year,
+                    "month": month,
+                    "day": day,
+                    "weekday": weekday,
+                    "week_number": week_number,
+                    "date": date_str,
+                    "accommodation_id": accommodation_id,
+                    "applicants": date_info.get("applicants", 0),
+                    "score": date_info.get("score", 0.0),
+                    "status": date_info.get("status", "Unknown"),
+                })
 
-                # 기존 레코드 확인
-                existing = await db.execute(
-                    select(TodayAccommodation).where(TodayAccommodation.id == today_id)
-                )
-                existing_obj = existing.scalar_one_or_none()
-
-                if existing_obj:
-                    # 업데이트
-                    existing_obj.applicants = date_info.get("applicants", 0)
-                    existing_obj.score = date_info.get("score", 0.0)
-                    existing_obj.status = date_info.get("status", "Unknown")
-                    existing_obj.updated_at = datetime.utcnow()
-                    db.add(existing_obj)
-                    updated += 1
-                else:
-                    # 새로 생성
-                    new_today = TodayAccommodation(
-                        id=today_id,
-                        year=year,
-                        month=month,
-                        day=day,
-                        weekday=weekday,
-                        week_number=week_number,
-                        date=date_str,
-                        accommodation_id=accommodation_id,
-                        applicants=date_info.get("applicants", 0),
-                        score=date_info.get("score", 0.0),
-                        status=date_info.get("status", "Unknown"),
-                        updated_at=datetime.utcnow()
-                    )
-                    db.add(new_today)
-                    saved += 1
+            # 값이 같은 행은 건너뛰고 신규/변경 행만 일괄 기록
+            # (건너뛴 행도 오늘 이미 기록된 행이므로 cleanup 대상이 아님)
+            result = await bulk_upsert(
+                db,
+                TodayAccommodation,
+                rows,
+                compare_columns=("applicants", "score", "status"),
+            )
 
             await db.commit()
-            logger.info(f"  DB save - Saved: {saved}, Updated: {updated}")
-            return saved, updated
+            logger.info(f"  DB save - {result}")
+            return result.inserted, result.updated
 
         except Exception as e:
             await db.rollback()
@@ -674,6 +661,9 @@ async def process_today_accommodation_realtime(
                 logger.info(f"  - Calculated: {sol_stats['calculated']}")
                 logger.info(f"  - Skipped: {sol_stats['skipped']}")
 
+            # 공개 API 응답 캐시 무효화
+            await invalidate_response_cache()
+
             return {
                 "status": "success",
                 "mode": "daily",
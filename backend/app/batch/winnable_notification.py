@@ -68,49 +68,41 @@ async def process_winnable_notification():
 
             logger.info(f"Found {len(notifications_to_send)} users with high win probability")
 
-            sent_count = 0
-            failed_count = 0
-
-            for notif in notifications_to_send:
-                try:
-                    # 알림 발송
-                    success = await notification_service.send_notification(
-                        user_id=notif.user_id,
-                        notification_type='high_win_probability',
-                        data={
-                            'accommodation_id': notif.accommodation_id,
-                            'accommodation_name': notif.accommodation_name,
-                            'date': str(notif.date),
-                            'user_score': int(notif.user_score),
-                            'avg_score': notif.avg_score,
-                            'applicants': notif.applicants
-                        },
-                        db=db
-                    )
-
-                    if success:
-                        sent_count += 1
-                        logger.info(
-                            f"✓ Sent to user {notif.user_id}: {notif.accommodation_name} "
-                            f"(user: {notif.user_score}점, avg: {notif.avg_score}점)"
-                        )
-                    else:
-                        failed_count += 1
-                        logger.warning(f"✗ Failed to send to user {notif.user_id}")
-
-                except Exception as e:
-                    logger.error(f"Error sending notification to user {notif.user_id}: {e}")
-                    failed_count += 1
+            # 발송 대상 일괄 발송 (사전 조회 + 병렬 발송 + 로그 일괄 저장)
+            users_data = [
+                {
+                    'user_id': notif.user_id,
+                    'data': {
+                        'accommodation_id': notif.accommodation_id,
+                        'accommodation_name': notif.accommodation_name,
+                        'date': str(notif.date),
+                        'user_score': int(notif.user_score),
+                        'avg_score': notif.avg_score,
+                        'applicants': notif.applicants
+                    }
+                }
+                for notif in notifications_to_send
+            ]
+            bulk_result = await notification_service.send_bulk_notification(
+                users_data,
+                notification_type='high_win_probability'
+            )
 
             logger.info("=" * 80)
             logger.info(f"Winnable notification completed")
-            logger.info(f"Sent: {sent_count}, Failed: {failed_count}")
+            logger.info(
+                f"Sent: {bulk_result['sent']}, Failed: {bulk_result['failed']}, "
+                f"Skipped: {bulk_result['skipped']}, {bulk_result['sends_per_second']} sends/sec"
+            )
             logger.info("=" * 80)
 
             return {
                 "status": "success",
-                "sent": sent_count,
-                "failed": failed_count,
+                "sent": bulk_result['sent'],
+                "failed": bulk_result['failed'],
+                "skipped": bulk_result['skipped'],
+                "duration_seconds": bulk_result['duration_seconds'],
+                "sends_per_second": bulk_result['sends_per_second'],
                 "timestamp": datetime.utcnow().isoformat()
             }
 
@@ -65,45 +65,40 @@ async def process_wishlist_notification_morning():
 
             logger.info(f"Found {len(notifications_to_send)} wishlists to notify")
 
-            sent_count = 0
-            failed_count = 0
-
-            for notif in notifications_to_send:
-                try:
-                    # 알림 발송
-                    success = await notification_service.send_notification(
-                        user_id=notif.user_id,
-                        notification_type='wishlist_available',
-                        data={
-                            'accommodation_id': notif.accommodation_id,
-                            'accommodation_name': notif.accommodation_name,
-                            'date': str(notif.date),
-                            'score': notif.score,
-                            'applicants': notif.applicants
-                        },
-                        db=db
-                    )
-
-                    if success:
-                        sent_count += 1
-                        logger.info(f"✓ Sent to user {notif.user_id}: {notif.accommodation_name} ({notif.date})")
-                    else:
-                        failed_count += 1
-                        logger.warning(f"✗ Failed to send to user {notif.user_id}")
-
-                except Exception as e:
-                    logger.error(f"Error sending notification to user {notif.user_id}: {e}")
-                    failed_count += 1
+            # 발송 대상 일괄 발송 (사전 조회 + 병렬 발송 + 로그 일괄 저장)
+            users_data = [
+                {
+                    'user_id': notif.user_id,
+                    'data': {
+                        'accommodation_id': notif.accommodation_id,
+                        'accommodation_name': notif.accommodation_name,
+                        'date': str(notif.date),
+                        'score': notif.score,
+                        'applicants': notif.applicants
+                    }
+                }
+                for notif in notifications_to_send
+            ]
+            bulk_result = await notification_service.send_bulk_notification(
+                users_data,
+                notification_type='wishlist_available'
+            )
 
             logger.info("=" * 80)
             logger.info(f"Wishlist notification (morning) completed")
-            logger.info(f"Sent: {sent_count}, Failed: {failed_count}")
+            logger.info(
+                f"Sent: {bulk_result['sent']}, Failed: {bulk_result['failed']}, "
+                f"Skipped: {bulk_result['skipped']}, {bulk_result['sends_per_second']} sends/sec"
+            )
             logger.info("=" * 80)
 
             return {
                 "status": "success",
-                "sent": sent_count,
-                "failed": failed_count,
+                "sent": bulk_result['sent'],
+                "failed": bulk_result['failed'],
+                "skipped": bulk_result['skipped'],
+                "duration_seconds": bulk_result['duration_seconds'],
+                "sends_per_second": bulk_result['sends_per_second'],
                 "timestamp": datetime.utcnow().isoformat()
             }
 
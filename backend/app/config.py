@@ -14,6 +14,15 @@ class Settings(BaseSettings):
     DATABASE_URL: str = os.getenv("DATABASE_URL")
     DATABASE_AUTH_TOKEN: str = os.getenv("DATABASE_AUTH_TOKEN")
     CHROMA_PERSIST_DIRECTORY: str | None = None
+    VECTOR_STORE_BACKEND: str = "chroma"  # FAQ 벡터 저장소 (chroma: 로컬 ChromaDB, numpy: faq_vectors 테이블 + 메모리 행렬)
+    VECTOR_STORE_REFRESH_SECONDS: float = 30.0  # numpy 백엔드: faq_vectors 변경(다른 프로세스의 동기화) 확인 간격
+
+    # 데이터베이스 커넥션 풀 (null: 요청마다 새 연결, queue: 연결 재사용)
+    DB_POOL_MODE: str = "null"
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0  # 풀이 가득 찼을 때 연결 대기 시간 (초)
+    DB_POOL_RECYCLE: int = 1800  # 연결 재생성 주기 (초)
 
     # Firebase
     FIREBASE_CREDENTIALS_JSON: str | None = None
@@ -30,6 +39,11 @@ class Settings(BaseSettings):
 
     # Redis (캐시)
     REDIS_URL: str | None = None
+    RESPONSE_CACHE_ENABLED: bool = True  # 공개 숙소 API 응답 캐시 사용 여부
+    RESPONSE_CACHE_MAX_ENTRIES: int = 1000  # Redis가 없을 때 프로세스 내 LRU 최대 항목 수
+    # Redis 없이 LRU만 쓰면 배치의 무효화가 다른 프로세스(API 서버)에 전달되지 않음 → 이 TTL(초)로 상한을 두어 오래된 응답 노출 시간을 제한
+    # 배치 직후 바로 반영되어야 하는 운영 환경에서는 REDIS_URL 설정 필수
+    RESPONSE_CACHE_LOCAL_MAX_TTL: int = 30
 
     # Sentry
     SENTRY_DSN: str | None = None
@@ -63,22 +77,70 @@ class Settings(BaseSettings):
     RAG_MODEL: str = "gpt-4o-mini"
     RAG_TEMPERATURE: float = 0.7
     OPENAI_API_KEY: str | None = None
+    EMBEDDING_CACHE_ENABLED: bool = True  # 텍스트 임베딩 디스크 캐시 사용 여부
+    EMBEDDING_BATCH_SIZE: int = 100  # 임베딩 API 요청당 최대 텍스트 수
+    EMBEDDING_CONCURRENCY: int = 4  # 동시 임베딩 API 요청 수
+    EMBEDDING_MAX_RETRIES: int = 3  # 임베딩 요청 실패 시 재시도 횟수
+    CHATBOT_ANSWER_CACHE_ENABLED: bool = True  # 챗봇 답변 캐시 사용 여부
+    CHATBOT_ANSWER_CACHE_PATH: str | None = None  # 답변 캐시 SQLite 파일 (None이면 ChromaDB 디렉터리)
+    CHATBOT_ANSWER_CACHE_MAX_ENTRIES: int = 1000  # 캐시할 최대 질문 수 (LRU)
+    CHATBOT_ANSWER_CACHE_TTL_HOURS: float = 24.0  # 답변 유효 시간
+    CHATBOT_ANSWER_CACHE_SIMILARITY: float = 0.95  # 유사 질문으로 판단할 코사인 유사도 하한
 
     # 암호화 설정
     ENCRYPTION_MASTER_KEY: str | None = None
     ENCRYPTION_SALT: str | None = None
+    ENCRYPTION_KEY_VERSION: int = 1  # 현재 마스터 키 버전 (새 암호화에 사용)
+    ENCRYPTION_RETIRED_MASTER_KEYS: dict[int, str] = {}  # 이전 버전 마스터 키 (복호화 전용)
     JWT_SECRET_KEY: str | None = None
 
+    # 액세스 토큰 검증 캐시 (토큰 → 사용자 스냅샷)
+    AUTH_TOKEN_CACHE_ENABLED: bool = True
+    AUTH_TOKEN_CACHE_TTL_SECONDS: float = 30.0
+    AUTH_TOKEN_CACHE_MAX_ENTRIES: int = 10000
+
     # Lulu-Lala 크롤링 설정
     LULU_LALA_USERNAME: str | None = None
     LULU_LALA_PASSWORD: str | None = None
     LULU_LALA_RSA_PUBLIC_KEY: str | None = None
+    LULU_LALA_HTTP_LOGIN_ENABLED: bool = False  # HTTP 전용 로그인 우선 시도 (실사이트 검증 전까지 비활성화, RSA 공개키 필요)
+    SESSION_CACHE_MAX_ENTRIES: int = 500  # 메모리 세션 캐시 최대 사용자 수 (LRU)
+    SESSION_WARMER_ENABLED: bool = True  # 만료 임박 세션 백그라운드 갱신
+    SESSION_REFRESH_BEFORE_MINUTES: int = 60  # 만료 몇 분 전에 갱신할지
+    SESSION_WARM_ACTIVE_DAYS: int = 7  # 최근 며칠 안에 로그인한 사용자만 갱신
+    SESSION_WARM_CONCURRENCY: int = 2  # 동시에 갱신할 세션 수
+    SESSION_WARM_INTERVAL_SECONDS: float = 600.0  # 워머 최대 실행 간격
+    SESSION_WARM_FAILURE_BACKOFF_MINUTES: int = 60  # 갱신 실패 후 재시도 대기 (실패할 때마다 2배)
+    SESSION_WARM_MAX_FAILURES: int = 3  # 연속 실패 시 다음 로그인 성공 전까지 갱신 중단 (계정 잠금 방지)
+    BROWSER_POOL_ENABLED: bool = True  # 앱 시작 시 로그인용 브라우저 풀 실행
+    BROWSER_POOL_SIZE: int = 1  # 브라우저(Chromium 프로세스) 수
+    BROWSER_POOL_MAX_CONTEXTS: int = 4  # 동시에 빌려줄 수 있는 컨텍스트 수 (초과 시 대기)
+    BROWSER_POOL_RECYCLE_AFTER: int = 50  # 브라우저당 사용 횟수, 초과 시 재시작
+    BROWSER_POOL_ACQUIRE_TIMEOUT: float = 60.0  # 컨텍스트 대기 최대 시간 (초)
+    CRAWLER_CONCURRENCY: int = 4  # 숙소 상세 페이지 동시 크롤링 페이지 수
+    CRAWLER_REQUESTS_PER_SECOND: float = 2.0  # 호스트별 최대 요청 속도 (페이지 이동 + XHR/fetch 요청 단위)
+    CRAWLER_MAX_RETRIES: int = 2  # 페이지 크롤링 실패 시 재시도 횟수
+
+    # 네이버 호텔 가격 크롤링 설정
+    NAVER_PRICE_CONCURRENCY: int = 3  # 동시 조회 페이지 수
+    NAVER_PRICE_REQUESTS_PER_SECOND: float = 1.0  # 네이버 호텔 초당 요청 수
+    NAVER_PRICE_CACHE_PATH: str | None = None  # 가격 캐시 SQLite 파일 (None이면 임시 디렉터리)
+    NAVER_PRICE_CACHE_TTL_HOURS: float = 24.0  # 가격 캐시 유효 시간
+    NAVER_PRICE_HTTP_ENABLED: bool = True  # HTTP 전용 조회 우선 사용 (실패 시 Playwright)
 
     # Web Push (VAPID) 설정
     VAPID_PUBLIC_KEY: str | None = None
     VAPID_PRIVATE_KEY: str | None = None
     VAPID_EMAIL: str = "noreply@refreshplus.com"
 
+    # 알림 일괄 발송 동시성
+    NOTIFICATION_SEND_CONCURRENCY: int = 20
+
+    # 푸시 전송 스레드 풀 크기 및 채널별 동시 발송 수
+    PUSH_THREAD_POOL_SIZE: int = 16
+    FCM_SEND_CONCURRENCY: int = 10
+    WEB_PUSH_SEND_CONCURRENCY: int = 10
+
     @field_validator('LULU_LALA_RSA_PUBLIC_KEY', mode='before')
     @classmethod
     def normalize_rsa_key(cls, v):
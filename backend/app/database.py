@@ -1,8 +1,11 @@
+import asyncio
+import time
+from typing import Any, Dict, List
 from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
-from sqlalchemy.pool import NullPool
-from sqlalchemy import text
+from sqlalchemy.pool import NullPool, AsyncAdaptedQueuePool
+from sqlalchemy import event, text
 from app.config import settings
 
 import libsql_experimental
@@ -11,11 +14,51 @@ import libsql_experimental
 if not hasattr(libsql_experimental, 'Binary'):
     libsql_experimental.Binary = bytes
 
+class _TimedPoolMixin:
+    """
+    연결 획득 대기 시간 측정 (풀 대기 + 신규 연결 수립 + pre-ping)
+    세션이 실제로 연결을 처음 쓸 때만 체크아웃되므로, DB를 쓰지 않는 요청(캐시 적중 등)은 측정/연결하지 않음
+    """
+
+    def connect(self):
+        started_at = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            pool_metrics.record_wait(time.perf_counter() - started_at)
+
+
+class TimedNullPool(_TimedPoolMixin, NullPool):
+    pass
+
+
+class TimedQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def _pool_kwargs() -> Dict[str, Any]:
+    """
+    DB_POOL_MODE에 따른 커넥션 풀 설정
+    - null: 요청마다 새 연결 (기본값)
+    - queue: pool_size + max_overflow 개까지 연결을 재사용
+    """
+    if settings.DB_POOL_MODE == "queue":
+        return {
+            "poolclass": TimedQueuePool,
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
+        }
+    return {"poolclass": TimedNullPool}
+
+
 def _build_engine():
     """
     Turso(libsql)와 로컬 sqlite(aiosqlite) 경로를 분리해 엔진을 생성한다.
     - libsql: 메인 DB (Turso)
     - sqlite+aiosqlite: 로컬 개발용만 허용
+    커넥션 풀은 DB_POOL_MODE 설정을 따른다.
     """
     if not settings.DATABASE_URL:
         raise ValueError("DATABASE_URL is not configured.")
@@ -44,7 +87,7 @@ def _build_engine():
             future=True,
             connect_args=connect_args,
             pool_pre_ping=True,
-            poolclass=NullPool  # SQLite 기반 드라이버는 NullPool 사용
+            **_pool_kwargs()
         )
 
     # 로컬 개발용 sqlite (aiosqlite 전용)
@@ -58,8 +101,8 @@ def _build_engine():
             echo=settings.DEBUG,
             future=True,
             connect_args={"timeout": 30, "check_same_thread": False},
-            poolclass=NullPool,
-            pool_pre_ping=True
+            pool_pre_ping=True,
+            **_pool_kwargs()
         )
 
     # 기타 드라이버 (예: postgres 등)
@@ -71,8 +114,61 @@ def _build_engine():
     )
 
 
+class PoolMetrics:
+    """커넥션 풀 지표 (체크아웃 수, 신규 연결 수, 연결 획득 대기 시간)"""
+
+    # 최근 획득 대기 시간 보관 개수
+    MAX_SAMPLES = 1000
+
+    def __init__(self):
+        self.checked_out = 0
+        self.checkouts = 0
+        self.connects = 0
+        self._wait_samples: List[float] = []
+
+    def record_wait(self, seconds: float) -> None:
+        self._wait_samples.append(seconds)
+        if len(self._wait_samples) > self.MAX_SAMPLES:
+            del self._wait_samples[:len(self._wait_samples) - self.MAX_SAMPLES]
+
+    def snapshot(self) -> Dict[str, Any]:
+        samples = sorted(self._wait_samples)
+
+        def percentile(ratio: float) -> float:
+            if not samples:
+                return 0.0
+            return round(samples[min(len(samples) - 1, int(len(samples) * ratio))] * 1000, 2)
+
+        return {
+            "mode": settings.DB_POOL_MODE,
+            "pool_status": engine.pool.status(),
+            "checked_out": self.checked_out,
+            "checkouts": self.checkouts,
+            "connects": self.connects,
+            "wait_ms_p50": percentile(0.5),
+            "wait_ms_p99": percentile(0.99),
+        }
+
+
 # 비동기 엔진
 engine = _build_engine()
+pool_metrics = PoolMetrics()
+
+
+@event.listens_for(engine.sync_engine, "connect")
+def _on_connect(dbapi_connection, connection_record):
+    pool_metrics.connects += 1
+
+
+@event.listens_for(engine.sync_engine, "checkout")
+def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+    pool_metrics.checkouts += 1
+    pool_metrics.checked_out += 1
+
+
+@event.listens_for(engine.sync_engine, "checkin")
+def _on_checkin(dbapi_connection, connection_record):
+    pool_metrics.checked_out = max(0, pool_metrics.checked_out - 1)
 
 # 세션 팩토리
 AsyncSessionLocal = sessionmaker(
@@ -98,6 +194,27 @@ async def init_db():
 
 
 
+async def warm_up_pool() -> int:
+    """
+    풀 모드일 때 pool_size 개의 연결을 미리 열어 둔다. (lifespan 시작 시 호출)
+    첫 요청들이 TLS 연결 수립 비용을 치르지 않도록 하기 위함.
+
+    Returns:
+        미리 연 연결 수 (NullPool이면 0)
+    """
+    if settings.DB_POOL_MODE != "queue":
+        return 0
+
+    async def open_connection():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            # 모든 연결이 동시에 열려 있도록 잠시 유지
+            await asyncio.sleep(0.05)
+
+    await asyncio.gather(*(open_connection() for _ in range(settings.DB_POOL_SIZE)))
+    return settings.DB_POOL_SIZE
+
+
 async def get_db() -> AsyncSession:
     """데이터베이스 세션 의존성"""
     async with AsyncSessionLocal() as session:
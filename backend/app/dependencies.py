@@ -20,7 +20,32 @@ async def get_current_user(
     2. X-User-ID 헤더 (레거시 시스템)
 
     이를 통해 기존 코드와의 호환성을 유지하면서 새 인증 시스템으로 전환할 수 있습니다.
+    사용자 행은 항상 DB에서 조회하므로 라우트에서 수정/커밋해도 안전합니다.
     """
+    return await _authenticate(authorization, x_user_id, db, allow_cached=False)
+
+
+async def get_current_user_readonly(
+    authorization: Optional[str] = Header(None),
+    x_user_id: Optional[str] = Header(None, alias="X-User-ID"),
+    db: AsyncSession = Depends(get_db)
+) -> User:
+    """
+    현재 사용자 조회 (읽기 전용 엔드포인트용)
+
+    최근 검증한 토큰이면 캐시된 스냅샷으로 만든 detached User를 반환해 DB 조회를 생략합니다.
+    값이 최대 AUTH_TOKEN_CACHE_TTL_SECONDS만큼 오래되었을 수 있고 수정해도 저장되지 않으므로,
+    사용자 행을 수정하는 라우트에서는 get_current_user를 사용합니다.
+    """
+    return await _authenticate(authorization, x_user_id, db, allow_cached=True)
+
+
+async def _authenticate(
+    authorization: Optional[str],
+    x_user_id: Optional[str],
+    db: AsyncSession,
+    allow_cached: bool
+) -> User:
     try:
         # 1. Authorization 헤더 확인 (JWT 토큰 - 새 시스템)
         if authorization:
@@ -29,7 +54,7 @@ async def get_current_user(
 
             # JWT 토큰으로 사용자 조회
             from app.services.auth_service import auth_service
-            user = await auth_service.get_user_from_token(token, db)
+            user = await auth_service.get_user_from_token(token, db, allow_cached=allow_cached)
 
             if user:
                 logger.debug(f"User authenticated via JWT: {user.id}")
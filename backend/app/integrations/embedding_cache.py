@@ -0,0 +1,204 @@
+"""
+임베딩 캐시 (메모리 매핑 파일)
+
+같은 텍스트를 다시 임베딩하지 않도록 sha256(모델명 + 텍스트) → float32 벡터를 디스크에 저장합니다.
+- {prefix}.f32: 벡터를 행 단위로 이어 붙인 float32 파일 (np.memmap으로 읽기)
+- {prefix}.keys: 4바이트 차원 헤더 + 행 순서대로 32바이트 sha256 다이제스트
+- 추가만 하는(append-only) 구조, 벡터를 먼저 쓰고 키를 나중에 써서 중단되어도 짝이 맞는 행까지만 사용
+- 여러 스레드(청크 병렬 임베딩)에서 동시에 호출할 수 있도록 잠금 사용
+- 여러 프로세스(API 워커, 배치)가 같은 파일에 쓸 수 있도록 추가 쓰기는 파일 잠금({prefix}.lock, fcntl) 안에서 수행하고,
+  행 번호는 메모리 상태가 아니라 파일 크기로 계산 (다른 프로세스가 추가한 키는 쓰기 전/조회 시 읽어 들임)
+"""
+
+import hashlib
+import os
+import struct
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+from app.utils.logger import get_logger
+
+try:
+    import fcntl
+except ImportError:  # Windows: 파일 잠금 없이 단일 프로세스 사용 가정
+    fcntl = None
+
+logger = get_logger(__name__)
+
+DIGEST_SIZE = 32
+HEADER = struct.Struct("<I")
+
+
+def embedding_key(model_name: str, text: str) -> bytes:
+    return hashlib.sha256(f"{model_name}\x00{text}".encode("utf-8")).digest()
+
+
+class EmbeddingCache:
+    """모델별 텍스트 임베딩 영구 캐시"""
+
+    def __init__(self, directory: str | Path, model_name: str):
+        self.model_name = model_name
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        prefix = directory / model_name.replace("/", "_")
+        self.vectors_path = prefix.with_suffix(".f32")
+        self.keys_path = prefix.with_suffix(".keys")
+        self.lock_path = prefix.with_suffix(".lock")
+        self.dimension: Optional[int] = None
+        self._rows: Dict[bytes, int] = {}
+        self._indexed_rows = 0  # 키 파일에서 읽어 들인 행 수
+        self._map: Optional[np.memmap] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    @contextmanager
+    def _file_lock(self):
+        """프로세스 간 배타 잠금 (쓰기/파일 정리 구간)"""
+        with open(self.lock_path, "a+b") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _load(self) -> None:
+        with self._lock, self._file_lock():
+            self._repair_files()
+            self._sync_rows()
+        if self.dimension:
+            logger.info(f"Embedding cache loaded: {len(self._rows)} vectors ({self.model_name}, dim {self.dimension})")
+
+    def _repair_files(self) -> None:
+        """중단된 쓰기로 짝이 맞지 않는 꼬리 부분 정리 (파일 잠금 안에서 호출)"""
+        if not self.keys_path.exists() or not self.vectors_path.exists():
+            self._reset_files()
+            return
+
+        keys_size = os.path.getsize(self.keys_path)
+        if keys_size < HEADER.size:
+            self._reset_files()
+            return
+
+        with open(self.keys_path, "rb") as f:
+            dimension = HEADER.unpack(f.read(HEADER.size))[0]
+        key_rows = (keys_size - HEADER.size) // DIGEST_SIZE
+        vector_rows = os.path.getsize(self.vectors_path) // (dimension * 4) if dimension else 0
+        rows = min(key_rows, vector_rows)
+
+        if keys_size != HEADER.size + rows * DIGEST_SIZE:
+            with open(self.keys_path, "r+b") as f:
+                f.truncate(HEADER.size + rows * DIGEST_SIZE)
+        if os.path.getsize(self.vectors_path) != rows * dimension * 4:
+            with open(self.vectors_path, "r+b") as f:
+                f.truncate(rows * dimension * 4)
+
+    def _reset_files(self) -> None:
+        self.keys_path.write_bytes(b"")
+        self.vectors_path.write_bytes(b"")
+        self.dimension = None
+        self._rows.clear()
+        self._indexed_rows = 0
+        self._map = None
+
+    def _sync_rows(self) -> None:
+        """
+        다른 프로세스가 추가한 키를 읽어 들임.
+        벡터를 먼저 쓰고 키를 나중에 쓰므로, 온전한 키 행은 벡터가 이미 기록된 행입니다.
+        """
+        try:
+            keys_size = os.path.getsize(self.keys_path)
+        except OSError:
+            return
+        if keys_size < HEADER.size:
+            return
+        rows = (keys_size - HEADER.size) // DIGEST_SIZE
+        if rows <= self._indexed_rows and self.dimension is not None:
+            return
+
+        with open(self.keys_path, "rb") as f:
+            if self.dimension is None:
+                self.dimension = HEADER.unpack(f.read(HEADER.size))[0]
+            f.seek(HEADER.size + self._indexed_rows * DIGEST_SIZE)
+            raw = f.read((rows - self._indexed_rows) * DIGEST_SIZE)
+
+        for offset in range(len(raw) // DIGEST_SIZE):
+            key = raw[offset * DIGEST_SIZE:(offset + 1) * DIGEST_SIZE]
+            self._rows.setdefault(key, self._indexed_rows + offset)
+        self._indexed_rows += len(raw) // DIGEST_SIZE
+
+    def _row_vector(self, row: int) -> List[float]:
+        if self._map is None or self._map.shape[0] <= row:
+            total_rows = os.path.getsize(self.vectors_path) // (self.dimension * 4)
+            self._map = np.memmap(self.vectors_path, dtype=np.float32, mode="r", shape=(total_rows, self.dimension))
+        return self._map[row].tolist()
+
+    def get_many(self, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """텍스트별 캐시된 벡터 (없으면 None)"""
+        with self._lock:
+            self._sync_rows()
+            results: List[Optional[List[float]]] = []
+            for text in texts:
+                row = self._rows.get(embedding_key(self.model_name, text))
+                if row is None:
+                    self.misses += 1
+                    results.append(None)
+                else:
+                    self.hits += 1
+                    results.append(self._row_vector(row))
+            return results
+
+    def put_many(self, texts: Sequence[str], vectors: Sequence[Sequence[float]]) -> None:
+        with self._lock, self._file_lock():
+            # 다른 프로세스가 그 사이 추가한 행을 먼저 반영해야 행 번호와 중복 판단이 맞음
+            self._sync_rows()
+            new_keys: List[bytes] = []
+            new_vectors: List[np.ndarray] = []
+            for text, vector in zip(texts, vectors):
+                key = embedding_key(self.model_name, text)
+                if key in self._rows or key in new_keys:
+                    continue
+                array = np.asarray(vector, dtype=np.float32)
+                if self.dimension is None:
+                    self.dimension = int(array.shape[0])
+                    self.keys_path.write_bytes(HEADER.pack(self.dimension))
+                if array.shape != (self.dimension,):
+                    logger.warning(f"Embedding cache: dimension mismatch {array.shape}, skipping")
+                    continue
+                new_keys.append(key)
+                new_vectors.append(array)
+
+            if not new_keys:
+                return
+
+            # 행 번호는 파일 기준: 중단된 쓰기가 남긴 짝 없는 벡터 꼬리는 잘라냄
+            first_row = self._indexed_rows
+            row_bytes = self.dimension * 4
+            with open(self.vectors_path, "r+b") as f:
+                f.truncate(first_row * row_bytes)
+                f.seek(first_row * row_bytes)
+                f.write(np.vstack(new_vectors).tobytes())
+            with open(self.keys_path, "r+b") as f:
+                f.truncate(HEADER.size + first_row * DIGEST_SIZE)
+                f.seek(HEADER.size + first_row * DIGEST_SIZE)
+                f.write(b"".join(new_keys))
+            for offset, key in enumerate(new_keys):
+                self._rows[key] = first_row + offset
+            self._indexed_rows += len(new_keys)
+
+    def snapshot(self) -> Dict:
+        total = self.hits + self.misses
+        return {
+            "model": self.model_name,
+            "vectors": len(self._rows),
+            "dimension": self.dimension,
+            "file_bytes": len(self._rows) * (self.dimension or 0) * 4,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        }
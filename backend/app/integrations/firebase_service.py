@@ -4,13 +4,34 @@ Firebase Cloud Messaging 통합
 
 import firebase_admin
 from firebase_admin import credentials, messaging
+from firebase_admin.exceptions import InvalidArgumentError
 from app.config import settings
+from app.integrations.push_transport import push_transport
 from app.utils.logger import get_logger
 from typing import Dict, Any, Optional
 import json
 
 logger = get_logger(__name__)
 
+# FCM 멀티캐스트 1회 최대 토큰 수
+FCM_MULTICAST_MAX_TOKENS = 500
+
+
+def stringify_data(data: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    """FCM data 페이로드는 문자열 값만 허용"""
+    return {
+        str(key): value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)
+        for key, value in (data or {}).items()
+        if value is not None
+    }
+
+
+def is_invalid_token_error(error: Optional[Exception]) -> bool:
+    """더 이상 쓸 수 없는 토큰(앱 삭제/만료/잘못된 형식)으로 인한 실패인지"""
+    if isinstance(error, (messaging.UnregisteredError, messaging.SenderIdMismatchError)):
+        return True
+    return isinstance(error, InvalidArgumentError) and "registration token" in str(error).lower()
+
 class FirebaseService:
     def __init__(self):
         self.app = None
@@ -62,11 +83,12 @@ class FirebaseService:
                     body=body,
                     image=image_url
                 ),
-                data=data or {},
+                data=stringify_data(data),
                 token=token,
             )
 
-            message_id = messaging.send(message)
+            # 동기 HTTP 호출이므로 전송 스레드 풀에서 실행
+            message_id = await push_transport.run("fcm", messaging.send, message)
             logger.info(f"FCM message sent: {message_id}")
 
             return message_id
@@ -81,10 +103,15 @@ class FirebaseService:
         title: str,
         body: str,
         data: Optional[Dict[str, Any]] = None
-    ):
+    ) -> messaging.BatchResponse:
         """
-        여러 디바이스로 알림 전송 (최대 500개)
+        여러 디바이스로 같은 알림 전송 (최대 500개)
+
+        Returns:
+            BatchResponse - responses[i]가 tokens[i]의 결과
         """
+        if len(tokens) > FCM_MULTICAST_MAX_TOKENS:
+            raise ValueError(f"Multicast supports up to {FCM_MULTICAST_MAX_TOKENS} tokens")
 
         try:
             message = messaging.MulticastMessage(
@@ -92,11 +119,11 @@ class FirebaseService:
                     title=title,
                     body=body
                 ),
-                data=data or {},
+                data=stringify_data(data),
                 tokens=tokens,
             )
 
-            response = messaging.send_multicast(message)
+            response = await push_transport.run("fcm", messaging.send_each_for_multicast, message)
 
             logger.info(
                 f"Multicast sent: {response.success_count} succeeded, "
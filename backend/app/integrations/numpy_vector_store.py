@@ -0,0 +1,380 @@
+"""
+faq_vectors 테이블 기반 NumPy 벡터 스토어
+
+ChromaDB PersistentClient는 로컬 디스크에 의존해 Railway처럼 컨테이너가 교체되는 환경에서
+재시작마다 재벡터화가 필요합니다. 이 백엔드는 임베딩을 faq_vectors 테이블(float32 blob)에 두고,
+시작 시 한 번 읽어 연속된 NumPy 행렬(단위 벡터)로 올린 뒤 행렬-벡터 곱 한 번으로 top-k를 찾습니다.
+- VectorStore와 같은 메서드/검색 결과 형식 (ids/documents/metadatas/distances)
+- where={"category": ...} 필터는 카테고리별 행 인덱스로 미리 좁힌 뒤 계산
+- 쓰기(추가/교체/삭제)는 DB 반영 후 메모리 행렬을 통째로 교체 → 검색 스레드는 잠금 없이 읽음
+- 쓰기 메서드는 코루틴(AsyncSessionLocal 사용), 읽기 메서드는 동기(스레드에서 호출)
+- 다른 프로세스(FAQ 크롤링 배치)가 테이블을 바꾸면 refresh_if_stale이 버전(행 수, 최대 ID, 최근 수정 시각)
+  변화를 감지해 다시 적재 (VECTOR_STORE_REFRESH_SECONDS 간격으로만 확인)
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+import numpy as np
+from sqlalchemy import bindparam, delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.integrations.vector_store import BaseVectorStore, resolve_persist_directory
+from app.models.faq_vector import FAQVector
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def pack_embedding(vector: Sequence[float]) -> bytes:
+    return np.asarray(vector, dtype="<f4").tobytes()
+
+
+def unpack_embedding(blob: bytes) -> np.ndarray:
+    return np.frombuffer(blob, dtype="<f4").astype(np.float32)
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (matrix / norms).astype(np.float32, copy=False)
+
+
+@dataclass
+class _IndexState:
+    """검색에 쓰는 불변 스냅샷 (쓰기 시 새로 만들어 교체)"""
+    ids: List[str] = field(default_factory=list)
+    documents: List[str] = field(default_factory=list)
+    metadatas: List[Dict[str, Any]] = field(default_factory=list)
+    matrix: np.ndarray = field(default_factory=lambda: np.empty((0, 0), dtype=np.float32))
+    category_rows: Dict[str, np.ndarray] = field(default_factory=dict)
+
+
+def _build_state(rows: Dict[str, tuple]) -> _IndexState:
+    """{문서 ID: (문서, 메타데이터, 원본 벡터)} → 검색 스냅샷"""
+    ids = list(rows)
+    if not ids:
+        return _IndexState()
+
+    documents = [rows[doc_id][0] for doc_id in ids]
+    metadatas = [rows[doc_id][1] for doc_id in ids]
+    matrix = _normalize_rows(np.vstack([rows[doc_id][2] for doc_id in ids]))
+
+    category_lists: Dict[str, List[int]] = {}
+    for row, metadata in enumerate(metadatas):
+        category_lists.setdefault(metadata.get("category"), []).append(row)
+    category_rows = {category: np.asarray(indices) for category, indices in category_lists.items()}
+    return _IndexState(ids, documents, metadatas, np.ascontiguousarray(matrix), category_rows)
+
+
+class NumpyVectorStore(BaseVectorStore):
+    """
+    faq_vectors 테이블 + 메모리 행렬 벡터 스토어
+    """
+
+    def __init__(self, collection_name: str = "faq_vectors"):
+        self.collection_name = collection_name
+        self._init_embeddings(resolve_persist_directory() / "embedding_cache")
+        self._state = _IndexState()
+        # 문서 ID → (문서, 메타데이터, 원본 float32 벡터), 쓰기 시 스냅샷 재구성에 사용
+        self._rows: Dict[str, tuple] = {}
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+        # 마지막으로 적재한 테이블 버전과 확인 시각 (refresh_if_stale)
+        self._version: Optional[tuple] = None
+        self._checked_at = 0.0
+        self.load_seconds = 0.0
+        self.reloads = 0
+
+    def _publish(self) -> None:
+        self._state = _build_state(self._rows)
+
+    @staticmethod
+    async def _read_version(db: AsyncSession) -> tuple:
+        """테이블 버전 (행 수, 최대 ID, 최근 수정 시각) - 추가/교체/삭제/메타데이터 갱신 시 바뀜"""
+        result = await db.execute(
+            select(func.count(FAQVector.id), func.max(FAQVector.id), func.max(FAQVector.updated_at))
+        )
+        return tuple(result.one())
+
+    async def load(self, force: bool = False) -> int:
+        """
+        faq_vectors 전체를 읽어 행렬 구성 (앱 시작 시 1회, 테이블이 바뀌면 refresh_if_stale에서 다시)
+
+        Returns:
+            적재한 벡터 수
+        """
+        if self._loaded and not force:
+            return len(self._rows)
+
+        async with self._load_lock:
+            if self._loaded and not force:
+                return len(self._rows)
+            return await self._load_rows()
+
+    async def refresh_if_stale(self, max_age: Optional[float] = None) -> bool:
+        """
+        다른 프로세스가 faq_vectors를 바꿨으면 다시 적재
+
+        Args:
+            max_age: 마지막 확인 후 이 시간(초)이 지났을 때만 버전 확인 (None이면 VECTOR_STORE_REFRESH_SECONDS)
+
+        Returns:
+            테이블이 바뀌어 다시 적재했으면 True (최초 적재는 False)
+        """
+        if not self._loaded:
+            await self.load()
+            return False
+
+        max_age = settings.VECTOR_STORE_REFRESH_SECONDS if max_age is None else max_age
+        now = time.monotonic()
+        if now - self._checked_at < max_age:
+            return False
+        self._checked_at = now
+
+        async with AsyncSessionLocal() as db:
+            version = await self._read_version(db)
+        if version == self._version:
+            return False
+
+        async with self._load_lock:
+            logger.info(f"faq_vectors changed ({self._version} → {version}), reloading numpy vector store")
+            await self._load_rows()
+            self.reloads += 1
+        return True
+
+    async def _load_rows(self) -> int:
+        started_at = time.perf_counter()
+        async with AsyncSessionLocal() as db:
+            # 버전을 먼저 읽어, 적재 도중 바뀐 내용은 다음 확인에서 다시 적재되도록 함
+            version = await self._read_version(db)
+            result = await db.execute(
+                select(FAQVector.faq_id, FAQVector.text_chunk, FAQVector.embedding, FAQVector.meta_data)
+                .order_by(FAQVector.id.asc())
+            )
+            rows = {}
+            for faq_id, text_chunk, embedding, meta_data in result.all():
+                rows[f"faq_{faq_id}"] = (text_chunk, dict(meta_data or {}), unpack_embedding(embedding))
+
+        self._rows = rows
+        self._publish()
+        self._loaded = True
+        self._version = version
+        self._checked_at = time.monotonic()
+        self.load_seconds = time.perf_counter() - started_at
+        logger.info(
+            f"Numpy vector store loaded: {len(rows)} vectors in {self.load_seconds * 1000:.0f}ms "
+            f"({self._state.matrix.nbytes / 1024:.0f}KB matrix)"
+        )
+        return len(rows)
+
+    @staticmethod
+    def _faq_id(doc_id: str, metadata: Optional[Dict[str, Any]]) -> str:
+        if metadata and metadata.get("faq_id") is not None:
+            return str(metadata["faq_id"])
+        return doc_id[len("faq_"):] if doc_id.startswith("faq_") else doc_id
+
+    # --- 쓰기 (코루틴) ---
+
+    async def upsert_documents(
+        self,
+        documents: List[str],
+        metadatas: List[Dict[str, Any]],
+        ids: List[str]
+    ) -> None:
+        """
+        문서 추가 또는 교체
+
+        Args:
+            documents: 문서 텍스트 리스트
+            metadatas: 메타데이터 리스트
+            ids: 문서 ID 리스트
+        """
+        if not ids:
+            return
+        await self.load()
+
+        embeddings = await asyncio.to_thread(self.embed_texts, documents)
+        faq_ids = [self._faq_id(doc_id, metadata) for doc_id, metadata in zip(ids, metadatas)]
+
+        # updated_at은 마이크로초까지 기록 (DB now()는 초 단위라 같은 초 안의 변경을 버전으로 구분하지 못함)
+        written_at = datetime.utcnow()
+        async with AsyncSessionLocal() as db:
+            await db.execute(delete(FAQVector).where(FAQVector.faq_id.in_(faq_ids)))
+            await db.execute(
+                insert(FAQVector.__table__),
+                [
+                    {
+                        "faq_id": faq_id,
+                        "text_chunk": document,
+                        "embedding": pack_embedding(embedding),
+                        "meta_data": metadata,
+                        "created_at": written_at,
+                        "updated_at": written_at,
+                    }
+                    for faq_id, document, metadata, embedding in zip(faq_ids, documents, metadatas, embeddings)
+                ]
+            )
+            await db.commit()
+
+        for doc_id, document, metadata, embedding in zip(ids, documents, metadatas, embeddings):
+            self._rows[doc_id] = (document, dict(metadata), np.asarray(embedding, dtype=np.float32))
+        self._publish()
+        logger.info(f"{len(ids)}개 문서 upsert됨 (faq_vectors)")
+
+    async def add_documents(
+        self,
+        documents: List[str],
+        metadatas: List[Dict[str, Any]],
+        ids: List[str]
+    ) -> None:
+        await self.upsert_documents(documents=documents, metadatas=metadatas, ids=ids)
+
+    async def update_metadatas(self, metadatas: List[Dict[str, Any]], ids: List[str]) -> None:
+        """
+        임베딩은 그대로 두고 메타데이터만 갱신
+        """
+        if not ids:
+            return
+        await self.load()
+
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(FAQVector.__table__)
+                .where(FAQVector.__table__.c.faq_id == bindparam("target_faq_id"))
+                .values(meta_data=bindparam("new_meta_data"), updated_at=datetime.utcnow()),
+                [
+                    {"target_faq_id": self._faq_id(doc_id, metadata), "new_meta_data": metadata}
+                    for doc_id, metadata in zip(ids, metadatas)
+                ]
+            )
+            await db.commit()
+
+        for doc_id, metadata in zip(ids, metadatas):
+            if doc_id in self._rows:
+                document, _, vector = self._rows[doc_id]
+                self._rows[doc_id] = (document, dict(metadata), vector)
+        self._publish()
+
+    async def delete_documents(self, ids: List[str]) -> None:
+        """
+        문서 삭제
+        """
+        if not ids:
+            return
+        await self.load()
+
+        faq_ids = [self._faq_id(doc_id, self._rows.get(doc_id, (None, None))[1]) for doc_id in ids]
+        async with AsyncSessionLocal() as db:
+            await db.execute(delete(FAQVector).where(FAQVector.faq_id.in_(faq_ids)))
+            await db.commit()
+
+        for doc_id in ids:
+            self._rows.pop(doc_id, None)
+        self._publish()
+        logger.info(f"{len(ids)}개 문서 삭제됨 (faq_vectors)")
+
+    async def reset_collection(self) -> None:
+        """
+        전체 벡터 삭제
+        """
+        async with AsyncSessionLocal() as db:
+            await db.execute(delete(FAQVector))
+            await db.commit()
+        self._rows = {}
+        self._publish()
+        self._loaded = True
+        logger.info("faq_vectors 초기화됨")
+
+    async def delete_collection(self) -> None:
+        await self.reset_collection()
+
+    # --- 읽기 (동기) ---
+
+    def get_metadatas(self) -> Dict[str, Dict[str, Any]]:
+        state = self._state
+        return dict(zip(state.ids, state.metadatas))
+
+    def get_collection_count(self) -> int:
+        return len(self._state.ids)
+
+    def query(
+        self,
+        query_text: str,
+        n_results: int = 5,
+        where: Optional[Dict[str, Any]] = None,
+        query_embedding: Optional[List[float]] = None
+    ) -> Dict[str, Any]:
+        """
+        코사인 유사도 top-k 검색 (ChromaDB query와 같은 결과 형식)
+
+        Args:
+            query_text: 쿼리 텍스트
+            n_results: 반환할 결과 개수
+            where: 메타데이터 일치 필터 (예: {"category": "취소/환불"})
+            query_embedding: 미리 계산한 쿼리 임베딩 (없으면 캐시를 거쳐 계산)
+
+        Returns:
+            {"ids": [[...]], "documents": [[...]], "metadatas": [[...]], "distances": [[...]]}
+        """
+        state = self._state
+        empty = {"ids": [[]], "documents": [[]], "metadatas": [[]], "distances": [[]]}
+        if not state.ids:
+            return empty
+
+        if query_embedding is None:
+            query_embedding = self.embed_query(query_text)
+        vector = np.asarray(query_embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0 or vector.shape[0] != state.matrix.shape[1]:
+            return empty
+        vector /= norm
+
+        # 카테고리 필터는 미리 만든 행 인덱스로 후보를 좁힌 뒤 계산
+        candidates: Optional[np.ndarray] = None
+        if where:
+            filters = dict(where)
+            if "category" in filters:
+                candidates = state.category_rows.get(filters.pop("category"))
+                if candidates is None:
+                    return empty
+            if filters:
+                pool = candidates if candidates is not None else range(len(state.ids))
+                candidates = np.asarray([
+                    row for row in pool
+                    if all(state.metadatas[row].get(key) == value for key, value in filters.items())
+                ], dtype=np.int64)
+            if len(candidates) == 0:
+                return empty
+
+        matrix = state.matrix if candidates is None else state.matrix[candidates]
+        scores = matrix @ vector
+
+        k = min(n_results, scores.shape[0])
+        top = np.argpartition(-scores, k - 1)[:k] if k < scores.shape[0] else np.arange(scores.shape[0])
+        top = top[np.argsort(-scores[top])]
+        rows = top if candidates is None else candidates[top]
+
+        return {
+            "ids": [[state.ids[row] for row in rows]],
+            "documents": [[state.documents[row] for row in rows]],
+            "metadatas": [[state.metadatas[row] for row in rows]],
+            "distances": [[float(1.0 - scores[index]) for index in top]],
+        }
+
+    def get_index_stats(self) -> Dict[str, Any]:
+        """
+        메모리 행렬 크기와 적재 시간
+        """
+        state = self._state
+        return {
+            "backend": "numpy",
+            "vectors": len(state.ids),
+            "dimension": int(state.matrix.shape[1]) if state.ids else None,
+            "matrix_bytes": int(state.matrix.nbytes),
+            "load_ms": round(self.load_seconds * 1000, 1),
+            "reloads": self.reloads,
+        }
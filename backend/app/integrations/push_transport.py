@@ -0,0 +1,148 @@
+"""
+푸시 발송 전송 계층
+
+firebase_admin(messaging.send)과 pywebpush(webpush)는 동기 HTTP 호출이라
+이벤트 루프에서 직접 부르면 왕복 시간 동안 API 전체가 멈춥니다.
+- 전용 스레드 풀(PUSH_THREAD_POOL_SIZE)에서 실행해 이벤트 루프를 막지 않음
+- 채널별 동시 발송 수 제한 (FCM_SEND_CONCURRENCY / WEB_PUSH_SEND_CONCURRENCY)
+- 채널별 지연 시간 히스토그램 (/health/push)
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
+from app.config import settings
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 히스토그램 버킷 상한 (ms), 마지막 버킷은 그 이상 전부
+LATENCY_BUCKETS_MS = [50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+
+class LatencyHistogram:
+    """고정 버킷 지연 시간 히스토그램"""
+
+    def __init__(self, buckets_ms: List[int] = LATENCY_BUCKETS_MS):
+        self.buckets_ms = buckets_ms
+        self.counts = [0] * (len(buckets_ms) + 1)
+        self.successes = 0
+        self.failures = 0
+        self.total_ms = 0.0
+
+    def record(self, latency_ms: float, success: bool) -> None:
+        for index, upper in enumerate(self.buckets_ms):
+            if latency_ms <= upper:
+                self.counts[index] += 1
+                break
+        else:
+            self.counts[-1] += 1
+
+        self.total_ms += latency_ms
+        if success:
+            self.successes += 1
+        else:
+            self.failures += 1
+
+    def percentile(self, ratio: float) -> Optional[int]:
+        """버킷 상한 기준 근사 백분위수 (ms)"""
+        total = sum(self.counts)
+        if not total:
+            return None
+        threshold = total * ratio
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= threshold:
+                return self.buckets_ms[index] if index < len(self.buckets_ms) else None
+        return None
+
+    def as_dict(self) -> Dict[str, Any]:
+        total = self.successes + self.failures
+        labels = [f"le_{upper}ms" for upper in self.buckets_ms] + [f"gt_{self.buckets_ms[-1]}ms"]
+        return {
+            "sent": self.successes,
+            "failed": self.failures,
+            "avg_ms": round(self.total_ms / total, 1) if total else 0.0,
+            "p50_ms_le": self.percentile(0.5),
+            "p99_ms_le": self.percentile(0.99),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class PushTransport:
+    """동기 푸시 SDK 호출을 스레드 풀에서 실행하는 전송 계층"""
+
+    def __init__(self):
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._limits = {
+            "fcm": settings.FCM_SEND_CONCURRENCY,
+            "web_push": settings.WEB_PUSH_SEND_CONCURRENCY,
+        }
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.histograms: Dict[str, LatencyHistogram] = {
+            channel: LatencyHistogram() for channel in self._limits
+        }
+        self.in_flight: Dict[str, int] = {channel: 0 for channel in self._limits}
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=settings.PUSH_THREAD_POOL_SIZE,
+                thread_name_prefix="push"
+            )
+        return self._executor
+
+    def _get_semaphore(self, channel: str) -> asyncio.Semaphore:
+        # 배치(Lambda)는 실행마다 asyncio.run으로 새 루프를 만들므로 루프가 바뀌면 다시 생성
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            self._semaphores = {
+                name: asyncio.Semaphore(limit) for name, limit in self._limits.items()
+            }
+            self._semaphore_loop = loop
+        return self._semaphores[channel]
+
+    async def run(self, channel: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        동기 발송 함수를 채널 동시성 제한 안에서 스레드 풀로 실행합니다.
+        예외는 그대로 전달하고, 성공/실패와 지연 시간을 히스토그램에 기록합니다.
+        """
+        async with self._get_semaphore(channel):
+            loop = asyncio.get_running_loop()
+            self.in_flight[channel] += 1
+            started_at = time.perf_counter()
+            success = False
+            try:
+                result = await loop.run_in_executor(
+                    self._get_executor(), partial(func, *args, **kwargs)
+                )
+                success = result is not False
+                return result
+            finally:
+                self.in_flight[channel] -= 1
+                self.histograms[channel].record((time.perf_counter() - started_at) * 1000, success)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "thread_pool_size": settings.PUSH_THREAD_POOL_SIZE,
+            "channels": {
+                channel: {
+                    "concurrency_limit": self._limits[channel],
+                    "in_flight": self.in_flight[channel],
+                    **histogram.as_dict(),
+                }
+                for channel, histogram in self.histograms.items()
+            },
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+push_transport = PushTransport()
@@ -1,8 +1,11 @@
 """
 ChromaDB 벡터 스토어 설정
 FAQ RAG 챗봇을 위한 벡터 데이터베이스
+(VECTOR_STORE_BACKEND=numpy면 faq_vectors 테이블 기반 NumpyVectorStore 사용)
 """
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 import chromadb
@@ -10,10 +13,138 @@ from chromadb.config import Settings
 from chromadb.utils import embedding_functions
 import logging
 from app.config import settings
+from app.integrations.embedding_cache import EmbeddingCache
 
 logger = logging.getLogger(__name__)
 
-class VectorStore:
+EMBEDDING_MODEL = "text-embedding-ada-002"
+
+
+def resolve_persist_directory(persist_directory: str | Path | None = None) -> Path:
+    """
+    벡터 스토어 로컬 저장 경로 (ChromaDB 데이터, 임베딩 캐시)
+    """
+    default_dir = Path(__file__).resolve().parents[2] / "chroma_db"
+    directory = Path(
+        persist_directory
+        or settings.CHROMA_PERSIST_DIRECTORY
+        or default_dir
+    ).expanduser().resolve()
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+
+class BaseVectorStore:
+    """
+    벡터 스토어 공통 임베딩 처리 (OpenAI 임베딩 + 디스크 캐시 + 배치 요청)
+    """
+
+    collection_name: str
+
+    def _init_embeddings(self, cache_directory: Path) -> None:
+        """
+        임베딩 함수와 임베딩 캐시 초기화
+
+        Args:
+            cache_directory: 임베딩 캐시 파일 저장 경로
+        """
+        # OpenAI 임베딩 사용 (API 키 필요)
+        openai_api_key = os.getenv("OPENAI_API_KEY")
+        if not openai_api_key:
+            raise ValueError("OPENAI_API_KEY 환경 변수가 설정되지 않았습니다.")
+
+        self.embedding_function = embedding_functions.OpenAIEmbeddingFunction(
+            api_key=openai_api_key,
+            model_name=EMBEDDING_MODEL
+        )
+        self.embedding_cache = EmbeddingCache(
+            cache_directory,
+            EMBEDDING_MODEL
+        ) if settings.EMBEDDING_CACHE_ENABLED else None
+        self.embedding_api_calls = 0
+
+    def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """
+        임베딩 API 한 번 호출 (실패 시 지수 백오프로 재시도)
+        """
+        max_retries = settings.EMBEDDING_MAX_RETRIES
+        for attempt in range(max_retries + 1):
+            try:
+                self.embedding_api_calls += 1
+                return [
+                    [float(value) for value in vector]
+                    for vector in self.embedding_function(texts)
+                ]
+            except Exception as e:
+                logger.warning(
+                    f"임베딩 요청 실패 ({len(texts)}건, "
+                    f"시도 {attempt + 1}/{max_retries + 1}): {e}"
+                )
+                if attempt >= max_retries:
+                    raise
+                time.sleep(2 ** attempt)
+
+    def embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """
+        텍스트 임베딩 (캐시 우선, 캐시에 없는 텍스트만 청크 단위로 병렬 요청)
+
+        Args:
+            texts: 임베딩할 텍스트 리스트
+
+        Returns:
+            텍스트 순서대로의 임베딩 벡터
+        """
+        if self.embedding_cache is not None:
+            vectors = self.embedding_cache.get_many(texts)
+        else:
+            vectors = [None] * len(texts)
+
+        # 중복 제거 후 캐시에 없는 텍스트만 요청
+        missing = list(dict.fromkeys(text for text, vector in zip(texts, vectors) if vector is None))
+        if missing:
+            batch_size = max(1, settings.EMBEDDING_BATCH_SIZE)
+            batches = [missing[i:i + batch_size] for i in range(0, len(missing), batch_size)]
+            workers = max(1, min(settings.EMBEDDING_CONCURRENCY, len(batches)))
+            if workers == 1:
+                embedded = [self._embed_batch(batch) for batch in batches]
+            else:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    embedded = list(executor.map(self._embed_batch, batches))
+
+            fresh: Dict[str, List[float]] = {}
+            for batch, batch_vectors in zip(batches, embedded):
+                fresh.update(zip(batch, batch_vectors))
+                if self.embedding_cache is not None:
+                    self.embedding_cache.put_many(batch, batch_vectors)
+            vectors = [vector if vector is not None else fresh[text] for text, vector in zip(texts, vectors)]
+            logger.info(f"임베딩 {len(missing)}건 요청 ({len(batches)}개 배치), 캐시 적중 {len(texts) - len(missing)}건")
+
+        return vectors
+
+    def embed_query(self, query_text: str) -> List[float]:
+        """
+        쿼리 텍스트 임베딩
+
+        Args:
+            query_text: 쿼리 텍스트
+
+        Returns:
+            임베딩 벡터
+        """
+        return self.embed_texts([query_text])[0]
+
+    def get_embedding_stats(self) -> Dict[str, Any]:
+        """
+        임베딩 캐시 및 API 호출 통계
+        """
+        return {
+            "api_calls": self.embedding_api_calls,
+            **(self.embedding_cache.snapshot() if self.embedding_cache is not None else {"enabled": False}),
+        }
+
+
+
+class VectorStore(BaseVectorStore):
     """
     ChromaDB 벡터 스토어 관리 클래스
     """
@@ -33,13 +164,7 @@ class VectorStore:
             use_openai: OpenAI 임베딩 사용 여부 (False면 HuggingFace 사용)
         """
         self.collection_name = collection_name
-        default_dir = Path(__file__).resolve().parents[2] / "chroma_db"
-        self.persist_directory = Path(
-            persist_directory
-            or settings.CHROMA_PERSIST_DIRECTORY
-            or default_dir
-        ).expanduser().resolve()
-        self.persist_directory.mkdir(parents=True, exist_ok=True)
+        self.persist_directory = resolve_persist_directory(persist_directory)
 
         # ChromaDB 클라이언트 초기화
         self.client = chromadb.PersistentClient(
@@ -51,15 +176,8 @@ class VectorStore:
         )
 
 
-        # OpenAI 임베딩 사용 (API 키 필요)
-        openai_api_key = os.getenv("OPENAI_API_KEY")
-        if not openai_api_key:
-            raise ValueError("OPENAI_API_KEY 환경 변수가 설정되지 않았습니다.")
-
-        self.embedding_function = embedding_functions.OpenAIEmbeddingFunction(
-            api_key=openai_api_key,
-            model_name="text-embedding-ada-002"
-        )
+        # 임베딩은 직접 계산해 전달 (캐시 적중 시 API 호출 생략)
+        self._init_embeddings(self.persist_directory / "embedding_cache")
 
         # 컬렉션 가져오기 또는 생성
         try:
@@ -92,6 +210,7 @@ class VectorStore:
         """
         try:
             self.collection.add(
+                embeddings=self.embed_texts(documents),
                 documents=documents,
                 metadatas=metadatas,
                 ids=ids
@@ -101,11 +220,74 @@ class VectorStore:
             logger.error(f"문서 추가 실패: {e}")
             raise
 
+    def upsert_documents(
+        self,
+        documents: List[str],
+        metadatas: List[Dict[str, Any]],
+        ids: List[str]
+    ) -> None:
+        """
+        문서 추가 또는 교체 (같은 ID가 있으면 덮어씀)
+
+        Args:
+            documents: 문서 텍스트 리스트
+            metadatas: 메타데이터 리스트
+            ids: 문서 ID 리스트
+        """
+        if not ids:
+            return
+        try:
+            self.collection.upsert(
+                embeddings=self.embed_texts(documents),
+                documents=documents,
+                metadatas=metadatas,
+                ids=ids
+            )
+            logger.info(f"{len(documents)}개 문서 upsert됨")
+        except Exception as e:
+            logger.error(f"문서 upsert 실패: {e}")
+            raise
+
+    def update_metadatas(self, metadatas: List[Dict[str, Any]], ids: List[str]) -> None:
+        """
+        임베딩은 그대로 두고 메타데이터만 갱신
+
+        Args:
+            metadatas: 메타데이터 리스트
+            ids: 문서 ID 리스트
+        """
+        if not ids:
+            return
+        self.collection.update(ids=ids, metadatas=metadatas)
+
+    def delete_documents(self, ids: List[str]) -> None:
+        """
+        문서 삭제
+
+        Args:
+            ids: 삭제할 문서 ID 리스트
+        """
+        if not ids:
+            return
+        self.collection.delete(ids=ids)
+        logger.info(f"{len(ids)}개 문서 삭제됨")
+
+    def get_metadatas(self) -> Dict[str, Dict[str, Any]]:
+        """
+        저장된 전체 문서의 ID → 메타데이터 (임베딩/문서 본문 제외)
+        """
+        result = self.collection.get(include=["metadatas"])
+        return {
+            doc_id: metadata or {}
+            for doc_id, metadata in zip(result["ids"], result["metadatas"] or [])
+        }
+
     def query(
         self,
         query_text: str,
         n_results: int = 5,
-        where: Optional[Dict[str, Any]] = None
+        where: Optional[Dict[str, Any]] = None,
+        query_embedding: Optional[List[float]] = None
     ) -> Dict[str, Any]:
         """
         유사도 검색
@@ -114,13 +296,16 @@ class VectorStore:
             query_text: 쿼리 텍스트
             n_results: 반환할 결과 개수
             where: 필터 조건 (메타데이터 기반)
+            query_embedding: 미리 계산한 쿼리 임베딩 (없으면 캐시를 거쳐 계산)
 
         Returns:
             검색 결과
         """
         try:
+            if query_embedding is None:
+                query_embedding = self.embed_query(query_text)
             results = self.collection.query(
-                query_texts=[query_text],
+                query_embeddings=[query_embedding],
                 n_results=n_results,
                 where=where
             )
@@ -164,17 +349,23 @@ class VectorStore:
 
 
 # 싱글톤 인스턴스
-_vector_store: Optional[VectorStore] = None
+_vector_store: Optional[BaseVectorStore] = None
 
-def get_vector_store() -> VectorStore:
+def get_vector_store() -> BaseVectorStore:
     """
-    VectorStore 싱글톤 인스턴스 반환
+    벡터 스토어 싱글톤 인스턴스 반환
+    VECTOR_STORE_BACKEND가 "numpy"면 faq_vectors 테이블 기반 NumpyVectorStore, 아니면 ChromaDB
     """
     global _vector_store
     if _vector_store is None:
-        _vector_store = VectorStore(
-            collection_name="faq_collection",
-            persist_directory=None,
-            use_openai=False  # HuggingFace 사용 (무료)
-        )
+        if settings.VECTOR_STORE_BACKEND == "numpy":
+            from app.integrations.numpy_vector_store import NumpyVectorStore
+
+            _vector_store = NumpyVectorStore(collection_name="faq_vectors")
+        else:
+            _vector_store = VectorStore(
+                collection_name="faq_collection",
+                persist_directory=None,
+                use_openai=False  # HuggingFace 사용 (무료)
+            )
     return _vector_store
@@ -8,6 +8,7 @@ import json
 from typing import Dict, Any
 from pywebpush import webpush, WebPushException
 from app.config import settings
+from app.integrations.push_transport import push_transport
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -26,7 +27,7 @@ class WebPushService:
         if not self.vapid_private_key or not self.vapid_public_key:
             logger.warning("VAPID keys not configured. Web Push will not work.")
 
-    def send_notification(
+    async def send_notification(
         self,
         subscription_info: Dict[str, Any],
         title: str,
@@ -59,8 +60,10 @@ class WebPushService:
                 "badge": "/badge-72x72.png"
             })
 
-            # Web Push 발송
-            webpush(
+            # Web Push 발송 (동기 HTTP 호출이므로 전송 스레드 풀에서 실행)
+            await push_transport.run(
+                "web_push",
+                webpush,
                 subscription_info=subscription_info,
                 data=payload,
                 vapid_private_key=self.vapid_private_key,
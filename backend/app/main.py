@@ -4,9 +4,14 @@ from starlette.middleware.gzip import GZipMiddleware
 from contextlib import asynccontextmanager
 
 from app.config import settings
-from app.database import engine, Base, init_db
+from app.database import engine, Base, init_db, warm_up_pool, pool_metrics
+from app.integrations.push_transport import push_transport
+from app.utils.browser_pool import browser_pool
+from app.services.lulu_lala_session_manager import session_manager
+from app.services.faq_vector_service import get_faq_vector_service
 from app.routes import accommodations, bookings, users, wishlist, notifications, scores, chatbot, auth
 from app.utils.logger import get_logger
+from app.utils.response_cache import response_cache
 
 logger = get_logger(__name__)
 
@@ -40,9 +45,27 @@ async def lifespan(app: FastAPI):
     # SQLite WAL 모드 활성화 (동시성 개선)
     await init_db()
     logger.info("Database initialized")
+    warmed = await warm_up_pool()
+    if warmed:
+        logger.info(f"Database pool warmed up: {warmed} connections")
+    # 로그인/세션 생성용 브라우저 풀 (Chromium 미리 실행)
+    if settings.BROWSER_POOL_ENABLED:
+        await browser_pool.start()
+    # 만료 임박 룰루랄라 세션 미리 갱신
+    if settings.SESSION_WARMER_ENABLED:
+        session_manager.start_warmer()
+    # faq_vectors 기반 벡터 스토어는 시작 시 메모리 행렬로 적재
+    if settings.VECTOR_STORE_BACKEND == "numpy":
+        try:
+            await get_faq_vector_service().load()
+        except Exception as e:
+            logger.error(f"Failed to load FAQ vectors (will retry on first chat): {str(e)}")
     yield
     # Shutdown
     logger.info("Application shutdown")
+    await session_manager.stop_warmer()
+    push_transport.shutdown()
+    await browser_pool.stop()
 
 app = FastAPI(
     title="Refresh Plus API",
@@ -71,6 +94,30 @@ async def health_check():
         "environment": settings.ENVIRONMENT
     }
 
+# DB 커넥션 풀 지표
+@app.get("/health/db")
+async def db_pool_health():
+    return pool_metrics.snapshot()
+
+# 응답 캐시 hit/miss 지표
+@app.get("/health/cache")
+async def response_cache_health():
+    return response_cache.snapshot()
+
+# 푸시 전송 채널별 지연 시간 지표
+@app.get("/health/push")
+async def push_transport_health():
+    return push_transport.snapshot()
+
+# 브라우저 풀 상태 (대기열, 브라우저별 사용 횟수)
+@app.get("/health/browser")
+async def browser_pool_health():
+    return {
+        **browser_pool.snapshot(),
+        "cached_sessions": len(session_manager.sessions),
+        "session_warmer": session_manager.warm_stats,
+    }
+
 # 라우터 등록
 
 # 인증 라우터 (먼저 등록 - 다른 라우터들이 의존할 수 있음)
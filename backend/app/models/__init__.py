@@ -1,6 +1,7 @@
 from app.models.user import User
 from app.models.accommodation import Accommodation
 from app.models.accommodation_date import AccommodationDate
+from app.models.accommodation_stats import AccommodationStats
 from app.models.wishlist import Wishlist
 from app.models.today_accommodation import TodayAccommodation
 from app.models.faq import FAQ
@@ -10,6 +11,7 @@ __all__ = [
     "User",
     "Accommodation",
     "AccommodationDate",
+    "AccommodationStats",
     "Wishlist",
     "TodayAccommodation",
     "FAQ",
@@ -48,7 +48,7 @@ class Accommodation(Base):
     summary = Column(JSON, nullable=True, default=list)
 
     # 평균 SOL점수 (해당 숙소의 모든 날짜별 SOL점수 평균, 0~100점)
-    average_sol_score = Column(Float, nullable=True)
+    average_sol_score = Column(Float, nullable=True, index=True)
 
     # 등록시간
     created_at = Column(DateTime, default=func.now())
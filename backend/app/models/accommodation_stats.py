@@ -0,0 +1,38 @@
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Float, JSON
+from sqlalchemy.sql import func
+from app.database import Base
+
+class AccommodationStats(Base):
+    """
+    숙소별 집계 통계 (accommodation_dates 기반 사전 계산 테이블)
+    - 크롤링 배치가 저장 후 변경된 숙소만 갱신
+    - 검색/추천 API는 숙소당 이 한 행만 읽음
+    """
+    __tablename__ = "accommodation_stats"
+
+    # 숙소id (PK, FK)
+    accommodation_id = Column(String, ForeignKey("accommodations.id"), primary_key=True, index=True)
+
+    # 마감(신청종료) 날짜 평균 점수
+    avg_closed_score = Column(Float, nullable=True)
+
+    # 온라인 평균가
+    avg_price = Column(Float, nullable=True)
+
+    # 전체 날짜 수
+    date_count = Column(Integer, default=0)
+
+    # 마감(신청종료) 날짜 수
+    closed_date_count = Column(Integer, default=0)
+
+    # 온라인 가격이 있는 날짜 수
+    priced_date_count = Column(Integer, default=0)
+
+    # 최근 90일 요일별 평균 점수 - JSON 배열 [{"weekday", "weekday_name", "avg_score", "count"}, ...]
+    weekday_averages = Column(JSON, default=list)
+
+    # 최근 90일 마감 점수 5점 구간별 날짜 수 - JSON 객체 {"90": 3, "95": 1, ...}
+    score_bucket_counts = Column(JSON, default=dict)
+
+    # 업데이트시간
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
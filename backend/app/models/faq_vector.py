@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, DateTime, Text, JSON, ForeignKey
+from sqlalchemy import Column, String, Integer, DateTime, Text, JSON, ForeignKey, LargeBinary
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -18,10 +18,10 @@ class FAQVector(Base):
     # 텍스트 청크 (question + answer 조합 또는 분할된 텍스트)
     text_chunk = Column(Text, nullable=False)
 
-    # 벡터 임베딩 (JSON 형태로 저장, Turso vector extension 사용 시 변경 가능)
-    embedding = Column(JSON, nullable=False)
+    # 벡터 임베딩 (float32 리틀엔디언 바이트, np.frombuffer로 복원)
+    embedding = Column(LargeBinary, nullable=False)
 
-    # 메타데이터 (카테고리, 청크 인덱스 등)
+    # 메타데이터 (카테고리, 순서, content_hash 등)
     meta_data = Column(JSON, nullable=True)
 
     # 등록시간
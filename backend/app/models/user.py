@@ -23,6 +23,8 @@ class User(Base):
     session_cookies = Column(JSON, nullable=True)  # 룰루랄라 세션 쿠키
     session_expires_at = Column(DateTime, nullable=True)  # 세션 만료 시간
     last_login = Column(DateTime, nullable=True)  # 마지막 로그인
+    session_warm_failures = Column(Integer, default=0)  # 백그라운드 세션 갱신 연속 실패 횟수
+    session_warm_failed_at = Column(DateTime, nullable=True)  # 마지막 백그라운드 세션 갱신 실패 시간
 
     # 보안
     is_active = Column(Boolean, default=True)  # 계정 활성화 상태
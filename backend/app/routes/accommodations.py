@@ -8,6 +8,8 @@ from app.models.booking import Booking, BookingStatus
 from app.schemas.accommodation import AccommodationResponse, RandomAccommodationResponse, PopularAccommodationResponse, SOLRecommendedAccommodationResponse, SearchAccommodationResponse, AccommodationDetailResponse, AvailableDateResponse, ScoreBasedRecommendationResponse
 from app.dependencies import get_current_user
 from app.services.accommodation_service import AccommodationService
+from app.utils.accommodation_stats import score_bucket_key
+from app.utils.response_cache import response_cache
 from typing import List, Optional
 from datetime import datetime, timedelta
 
@@ -53,21 +55,17 @@ async def get_accommodations(
     result = await db.execute(query)
     accommodations = result.scalars().all()
 
+    # 페이지 내 숙소들의 최근 4주간 평균 당첨 점수를 한 번에 계산
+    avg_winning_scores = await service.get_avg_winning_scores_4weeks(
+        [acc.id for acc in accommodations],
+        db
+    )
+
     # 각 숙소에 대해 사용자의 예약 가능 여부 계산
     responses = []
     for acc in accommodations:
-        can_book = await service.can_user_book(
-            current_user.id,
-            acc.id,
-            current_user.points,
-            db
-        )
-
-        # 최근 4주간 평균 당첨 점수 계산
-        avg_winning_score = await service.get_avg_winning_score_4weeks(
-            acc.id,
-            db
-        )
+        avg_winning_score = avg_winning_scores[acc.id]
+        can_book = current_user.points >= avg_winning_score
 
         responses.append(
             AccommodationResponse(
@@ -96,17 +94,20 @@ async def get_random_accommodations(
     - limit: 조회할 숙소 개수 (기본값: 5)
     """
 
-    accommodations = await service.get_random_accommodations(db, limit)
+    async def load():
+        accommodations = await service.get_random_accommodations(db, limit)
 
-    return [
-        RandomAccommodationResponse(
-            id=acc.id,
-            name=acc.name,
-            region=acc.region,
-            first_image=acc.images[0] if acc.images and len(acc.images) > 0 else None
-        )
-        for acc in accommodations
-    ]
+        return [
+            RandomAccommodationResponse(
+                id=acc.id,
+                name=acc.name,
+                region=acc.region,
+                first_image=acc.images[0] if acc.images and len(acc.images) > 0 else None
+            )
+            for acc in accommodations
+        ]
+
+    return await response_cache.get_or_set("random", {"limit": limit}, load)
 
 @router.get("/popular", response_model=List[PopularAccommodationResponse])
 async def get_popular_accommodations(
@@ -121,20 +122,23 @@ async def get_popular_accommodations(
     - score 기준 내림차순 정렬
     """
 
-    results = await service.get_popular_accommodations(db, limit)
+    async def load():
+        results = await service.get_popular_accommodations(db, limit)
 
-    return [
-        PopularAccommodationResponse(
-            id=acc.id,
-            name=acc.name,
-            region=acc.region,
-            first_image=acc.images[0] if acc.images and len(acc.images) > 0 else None,
-            date=today_acc.date,
-            applicants=today_acc.applicants,
-            score=today_acc.score
-        )
-        for today_acc, acc in results
-    ]
+        return [
+            PopularAccommodationResponse(
+                id=acc.id,
+                name=acc.name,
+                region=acc.region,
+                first_image=acc.images[0] if acc.images and len(acc.images) > 0 else None,
+                date=today_acc.date,
+                applicants=today_acc.applicants,
+                score=today_acc.score
+            )
+            for today_acc, acc in results
+        ]
+
+    return await response_cache.get_or_set("popular", {"limit": limit}, load)
 
 @router.get("/sol-recommended", response_model=List[SOLRecommendedAccommodationResponse])
 async def get_sol_recommended_accommodations(
@@ -148,26 +152,36 @@ async def get_sol_recommended_accommodations(
     - average_sol_score 기준 내림차순 정렬
     """
 
-    # average_sol_score가 있는 숙소만 조회하고 내림차순 정렬
-    query = select(Accommodation).where(
-        Accommodation.average_sol_score.isnot(None)
-    ).order_by(
-        Accommodation.average_sol_score.desc()
-    ).limit(limit)
-
-    result = await db.execute(query)
-    accommodations = result.scalars().all()
+    async def load():
+        # average_sol_score가 있는 숙소만 조회하고 내림차순 정렬
+        # (응답에 필요한 컬럼만 조회, average_sol_score 인덱스 사용)
+        query = select(
+            Accommodation.id,
+            Accommodation.name,
+            Accommodation.region,
+            Accommodation.images,
+            Accommodation.average_sol_score
+        ).where(
+            Accommodation.average_sol_score.isnot(None)
+        ).order_by(
+            Accommodation.average_sol_score.desc()
+        ).limit(limit)
+
+        result = await db.execute(query)
+        accommodations = result.all()
+
+        return [
+            SOLRecommendedAccommodationResponse(
+                id=acc.id,
+                name=acc.name,
+                region=acc.region,
+                first_image=acc.images[0] if acc.images and len(acc.images) > 0 else None,
+                average_sol_score=acc.average_sol_score
+            )
+            for acc in accommodations
+        ]
 
-    return [
-        SOLRecommendedAccommodationResponse(
-            id=acc.id,
-            name=acc.name,
-            region=acc.region,
-            first_image=acc.images[0] if acc.images and len(acc.images) > 0 else None,
-            average_sol_score=acc.average_sol_score
-        )
-        for acc in accommodations
-    ]
+    return await response_cache.get_or_set("sol_recommended", {"limit": limit}, load)
 
 @router.get("/score-based-recommendations", response_model=List[ScoreBasedRecommendationResponse])
 async def get_score_based_recommendations(
@@ -184,23 +198,31 @@ async def get_score_based_recommendations(
     - limit: 조회할 숙소 개수 (기본값: 10)
     """
 
-    results = await service.get_score_based_recommendations(
-        user_score=current_user.points,
-        db=db,
-        limit=limit
-    )
-
-    return [
-        ScoreBasedRecommendationResponse(
-            id=result["id"],
-            name=result["name"],
-            region=result["region"],
-            first_image=result["first_image"],
-            visitor_count=result["visitor_count"],
-            score_range=result["score_range"]
+    async def load():
+        results = await service.get_score_based_recommendations(
+            user_score=current_user.points,
+            db=db,
+            limit=limit
         )
-        for result in results
-    ]
+
+        return [
+            ScoreBasedRecommendationResponse(
+                id=result["id"],
+                name=result["name"],
+                region=result["region"],
+                first_image=result["first_image"],
+                visitor_count=result["visitor_count"],
+                score_range=result["score_range"]
+            )
+            for result in results
+        ]
+
+    # 결과는 사용자 점수가 속한 5점 구간에만 의존하므로 구간 단위로 캐시
+    return await response_cache.get_or_set(
+        "score_based",
+        {"score_bucket": score_bucket_key(current_user.points or 0), "limit": limit},
+        load
+    )
 
 @router.get("/search", response_model=List[SearchAccommodationResponse])
 async def search_accommodations(
@@ -244,19 +266,36 @@ async def search_accommodations(
     if not current_user_id and user_id:
         current_user_id = user_id
 
-    results = await service.search_accommodations(
-        db=db,
-        user_id=current_user_id,
-        keyword=keyword,
-        region=region,
-        sort_by=sort_by,
-        sort_order=sort_order,
-        available_only=available_only,
-        date=date,
-        limit=limit
-    )
+    async def load():
+        return await service.search_accommodations(
+            db=db,
+            user_id=current_user_id,
+            keyword=keyword,
+            region=region,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            available_only=available_only,
+            date=date,
+            limit=limit
+        )
 
-    return results
+    # 사용자별 즐겨찾기/알림 정보가 섞이는 로그인 검색은 캐시하지 않음
+    if current_user_id:
+        return await load()
+
+    return await response_cache.get_or_set(
+        "search",
+        {
+            "keyword": keyword,
+            "region": region,
+            "sort_by": sort_by,
+            "sort_order": sort_order,
+            "available_only": available_only,
+            "date": date,
+            "limit": limit,
+        },
+        load
+    )
 
 @router.get("/regions", response_model=List[str])
 async def get_regions(
@@ -264,7 +303,10 @@ async def get_regions(
 ):
     """accommodations 테이블의 지역 목록 조회 (중복 제거, 정렬)"""
 
-    return await service.get_regions(db)
+    async def load():
+        return await service.get_regions(db)
+
+    return await response_cache.get_or_set("regions", {}, load)
 
 @router.get("/detail/{accommodation_id}", response_model=AccommodationDetailResponse)
 async def get_accommodation_detail_page(
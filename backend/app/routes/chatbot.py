@@ -1,14 +1,16 @@
 """
 챗봇 API 라우트
 """
+import json
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 from app.database import get_db
 from app.services.chatbot_service import get_chatbot_service
 from app.services.faq_vector_service import get_faq_vector_service
 from app.dependencies import get_current_user
-from typing import Optional
+from typing import Any, AsyncIterator, Dict, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -74,6 +76,46 @@ async def chat(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _format_sse(event: str, data: Dict[str, Any]) -> str:
+    """SSE 이벤트 한 건 직렬화"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@router.post("/chat/stream")
+async def chat_stream(
+    request: ChatRequest
+):
+    """
+    챗봇 질의응답 스트리밍 (비회원 사용 가능)
+
+    Server-Sent Events로 응답을 내보냅니다.
+    - context: 검색된 FAQ 컨텍스트
+    - token: 생성된 응답 조각 ({"content": "..."})
+    - done: 완료 ({"success", "error", "cached", "first_token_ms", "total_ms"})
+      cached는 답변 캐시 적중 단계("exact" | "semantic"), 미적중이면 null
+
+    Args:
+        request: 채팅 요청
+
+    Returns:
+        text/event-stream 응답
+    """
+    chatbot_service = get_chatbot_service()
+
+    async def event_stream() -> AsyncIterator[str]:
+        async for item in chatbot_service.chat_stream(query=request.query):
+            yield _format_sse(item["event"], item["data"])
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # 프록시 버퍼링 비활성화
+        }
+    )
+
+
 @router.post("/vectorize", response_model=VectorizeResponse)
 async def vectorize_faqs(
     db: AsyncSession = Depends(get_db),
@@ -1,12 +1,12 @@
 from fastapi import APIRouter, Depends
 from app.models.user import User
-from app.dependencies import get_current_user
+from app.dependencies import get_current_user_readonly
 
 router = APIRouter()
 
 @router.get("/history")
 async def get_score_history(
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user_readonly)
 ):
     """점수 변동 이력 조회"""
     # TODO: Implement score history tracking
@@ -3,7 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
 from app.models.user import User
 from app.schemas.user import UserResponse, ScoreRecoverySchedule
-from app.dependencies import get_current_user
+from app.dependencies import get_current_user_readonly
 from app.config import settings
 from datetime import datetime, timedelta
 
@@ -11,7 +11,7 @@ router = APIRouter()
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_profile(
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_user_readonly),
     db: AsyncSession = Depends(get_db)
 ):
     """현재 사용자 프로필 조회"""
@@ -19,7 +19,7 @@ async def get_current_user_profile(
 
 @router.get("/me/score-recovery-schedule", response_model=ScoreRecoverySchedule)
 async def get_score_recovery_schedule(
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_user_readonly),
     db: AsyncSession = Depends(get_db)
 ):
     """점수 회복 스케줄 조회"""
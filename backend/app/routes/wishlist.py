@@ -6,7 +6,7 @@ from app.models.user import User
 from app.models.wishlist import Wishlist
 from app.models.accommodation import Accommodation
 from app.schemas.wishlist import WishlistCreate, WishlistUpdate, WishlistResponse
-from app.dependencies import get_current_user
+from app.dependencies import get_current_user, get_current_user_readonly
 from app.config import settings
 from typing import List
 import uuid
@@ -15,7 +15,7 @@ router = APIRouter()
 
 @router.get("", response_model=List[WishlistResponse])
 async def get_wishlist(
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_user_readonly),
     db: AsyncSession = Depends(get_db)
 ):
     """찜하기 목록 조회"""
@@ -1,14 +1,15 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, or_, case, exists
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Dict, List, Optional
 from openai import AsyncOpenAI
 from app.models.booking import Booking, BookingStatus
 from app.models.accommodation import Accommodation
 from app.models.today_accommodation import TodayAccommodation
-from app.models.accommodation_date import AccommodationDate
+from app.models.accommodation_stats import AccommodationStats
 from app.models.wishlist import Wishlist
 from app.utils.logger import get_logger
+from app.utils.accommodation_stats import fetch_weekday_averages, score_bucket_key
 from app.config import settings
 
 logger = get_logger(__name__)
@@ -46,18 +47,42 @@ class AccommodationService:
     ) -> int:
         """최근 4주간 평균 당첨 점수 계산"""
 
+        avg_scores = await self.get_avg_winning_scores_4weeks([accommodation_id], db)
+        return avg_scores[accommodation_id]
+
+    async def get_avg_winning_scores_4weeks(
+        self,
+        accommodation_ids: List[str],
+        db: AsyncSession
+    ) -> Dict[str, int]:
+        """
+        여러 숙소의 최근 4주간 평균 당첨 점수를 한 번의 GROUP BY 쿼리로 계산
+
+        Returns:
+            {accommodation_id: 평균 당첨 점수} (당첨 기록이 없으면 0)
+        """
+
+        if not accommodation_ids:
+            return {}
+
         four_weeks_ago = datetime.now() - timedelta(weeks=4)
 
         result = await db.execute(
-            select(func.avg(Booking.winning_score_at_time)).where(
-                (Booking.accommodation_id == accommodation_id) &
+            select(
+                Booking.accommodation_id,
+                func.avg(Booking.winning_score_at_time)
+            ).where(
+                (Booking.accommodation_id.in_(set(accommodation_ids))) &
                 (Booking.status == BookingStatus.WON) &
                 (Booking.created_at >= four_weeks_ago)
-            )
+            ).group_by(Booking.accommodation_id)
         )
 
-        avg_score = result.scalar()
-        return int(avg_score) if avg_score else 0
+        avg_scores = {acc_id: 0 for acc_id in accommodation_ids}
+        for acc_id, avg_score in result.all():
+            avg_scores[acc_id] = int(avg_score) if avg_score else 0
+
+        return avg_scores
 
     async def get_random_accommodations(
         self,
@@ -129,27 +154,9 @@ class AccommodationService:
         if normalized_region in ["전체", "all", "ALL", "All", ""]:
             normalized_region = None
 
-        # 평균 점수 서브쿼리 (마감된 날짜만)
-        avg_score_subquery = (
-            select(
-                AccommodationDate.accommodation_id.label("accommodation_id"),
-                func.avg(AccommodationDate.score).label("avg_score")
-            )
-            .where(AccommodationDate.status == "마감(신청종료)")
-            .group_by(AccommodationDate.accommodation_id)
-            .subquery()
-        )
-
-        # 온라인 평균가 서브쿼리 (가격순 정렬용)
-        avg_price_subquery = (
-            select(
-                AccommodationDate.accommodation_id.label("accommodation_id"),
-                func.avg(AccommodationDate.online_price).label("avg_price")
-            )
-            .where(AccommodationDate.online_price.isnot(None))
-            .group_by(AccommodationDate.accommodation_id)
-            .subquery()
-        )
+        # 평균 점수/온라인 평균가는 배치가 미리 계산한 accommodation_stats에서 조회
+        avg_score_column = AccommodationStats.avg_closed_score
+        avg_price_column = AccommodationStats.avg_price
 
         # 즐겨찾기 서브쿼리 (사용자 있는 경우만)
         wishlist_subquery = None
@@ -201,17 +208,13 @@ class AccommodationService:
         query = (
             select(
                 Accommodation,
-                avg_score_subquery.c.avg_score.label("avg_score"),
-                avg_price_subquery.c.avg_price.label("avg_price"),
-            )
-            .join(
-                avg_score_subquery,
-                avg_score_subquery.c.accommodation_id == Accommodation.id,
-                isouter=True
+                avg_score_column.label("avg_score"),
+                avg_price_column.label("avg_price"),
+                AccommodationStats.weekday_averages.label("weekday_averages"),
             )
             .join(
-                avg_price_subquery,
-                avg_price_subquery.c.accommodation_id == Accommodation.id,
+                AccommodationStats,
+                AccommodationStats.accommodation_id == Accommodation.id,
                 isouter=True
             )
         )
@@ -282,7 +285,7 @@ class AccommodationService:
 
         if normalized_sort == "avg_score":
             query = query.order_by(
-                order_direction(func.coalesce(avg_score_subquery.c.avg_score, 0)),
+                order_direction(func.coalesce(avg_score_column, 0)),
                 Accommodation.name
             )
         elif normalized_sort == "name":
@@ -290,12 +293,12 @@ class AccommodationService:
         elif normalized_sort == "wishlist" and wishlist_subquery is not None:
             query = query.order_by(
                 order_direction(func.coalesce(wishlist_subquery.c.is_wishlisted, 0)),
-                order_direction(func.coalesce(avg_score_subquery.c.avg_score, 0)),
+                order_direction(func.coalesce(avg_score_column, 0)),
                 Accommodation.name
             )
         elif normalized_sort == "price":
             query = query.order_by(
-                order_direction(func.coalesce(avg_price_subquery.c.avg_price, 0)),
+                order_direction(func.coalesce(avg_price_column, 0)),
                 Accommodation.name
             )
         elif normalized_sort == "sol_score":
@@ -305,7 +308,7 @@ class AccommodationService:
             )
         else:
             query = query.order_by(
-                order_direction(func.coalesce(avg_score_subquery.c.avg_score, 0)),
+                order_direction(func.coalesce(avg_score_column, 0)),
                 Accommodation.name
             )
 
@@ -314,40 +317,23 @@ class AccommodationService:
         rows = result.all()
 
         # 각 숙소에 대해 평균 점수, 즐겨찾기 정보, 날짜별 정보, 요일별 평균 점수 조합
+        # (날짜/즐겨찾기 조인 여부에 따라 컬럼 구성이 달라지므로 이름으로 조회)
         search_results = []
         for row in rows:
-            # 날짜 정보 포함 여부에 따라 row 구조가 다름
-            if today_acc_subquery is not None and wishlist_subquery is not None:
-                accommodation, avg_score, avg_price, today_date, today_applicants, today_score, today_status, is_wishlisted_raw, notify_enabled_raw = row
-                is_wishlisted = bool(is_wishlisted_raw)
-                notify_enabled = bool(notify_enabled_raw)
-            elif today_acc_subquery is not None:
-                accommodation, avg_score, avg_price, today_date, today_applicants, today_score, today_status = row
-                is_wishlisted = False
-                notify_enabled = False
-            elif wishlist_subquery is not None:
-                accommodation, avg_score, avg_price, is_wishlisted_raw, notify_enabled_raw = row
-                today_date = None
-                today_applicants = None
-                today_score = None
-                today_status = None
-                is_wishlisted = bool(is_wishlisted_raw)
-                notify_enabled = bool(notify_enabled_raw)
-            else:
-                accommodation, avg_score, avg_price = row
-                today_date = None
-                today_applicants = None
-                today_score = None
-                today_status = None
-                is_wishlisted = False
-                notify_enabled = False
+            values = row._mapping
+            accommodation = values[Accommodation]
+            avg_score = values["avg_score"]
+            avg_price = values["avg_price"]
+            today_date = values.get("today_date")
+            today_applicants = values.get("today_applicants")
+            today_score = values.get("today_score")
+            today_status = values.get("today_status")
+            is_wishlisted = bool(values.get("is_wishlisted"))
+            notify_enabled = bool(values.get("notify_enabled"))
 
             first_image = accommodation.images[0] if accommodation.images else None
             summary = (accommodation.summary or [])[:5]
 
-            # 요일별 평균 점수 조회
-            weekday_averages = await self.get_weekday_averages(accommodation.id, db)
-
             search_results.append({
                 "id": accommodation.id,
                 "name": accommodation.name,
@@ -364,7 +350,7 @@ class AccommodationService:
                 "applicants": today_applicants,
                 "score": round(today_score, 1) if today_score else None,
                 "status": today_status,
-                "weekday_averages": weekday_averages
+                "weekday_averages": values["weekday_averages"] or []
             })
 
         return search_results
@@ -427,39 +413,21 @@ class AccommodationService:
         - 요일별로 그룹화하여 평균 점수 계산
         """
 
-        # 최근 3개월 데이터만 사용
-        three_months_ago = datetime.now() - timedelta(days=90)
-        three_months_ago_str = three_months_ago.strftime("%Y-%m-%d")
-
-        result = await db.execute(
-            select(
-                AccommodationDate.weekday,
-                func.avg(AccommodationDate.score).label('avg_score'),
-                func.count(AccommodationDate.id).label('count')
-            )
-            .where(
-                (AccommodationDate.accommodation_id == accommodation_id) &
-                (AccommodationDate.status == "마감(신청종료)") &
-                (AccommodationDate.date >= three_months_ago_str)
-            )
-            .group_by(AccommodationDate.weekday)
-            .order_by(AccommodationDate.weekday)
-        )
-
-        weekday_data = result.all()
+        weekday_averages_map = await self.get_weekday_averages_bulk([accommodation_id], db)
+        return weekday_averages_map.get(accommodation_id, [])
 
-        # 요일 이름 매핑 (0=월요일, 6=일요일)
-        weekday_names = ["월", "화", "수", "목", "금", "토", "일"]
+    async def get_weekday_averages_bulk(
+        self,
+        accommodation_ids: List[str],
+        db: AsyncSession
+    ) -> Dict[str, List[dict]]:
+        """
+        여러 숙소의 요일별 평균 점수를 한 번에 조회 (accommodation_dates)
+        - (accommodation_id, weekday) 단위 GROUP BY 한 번으로 계산
+        - 반환: {accommodation_id: [요일별 평균 점수 dict, ...]}
+        """
 
-        return [
-            {
-                "weekday": data.weekday,
-                "weekday_name": weekday_names[data.weekday] if data.weekday is not None else "",
-                "avg_score": round(data.avg_score, 1) if data.avg_score else 0.0,
-                "count": data.count
-            }
-            for data in weekday_data
-        ]
+        return await fetch_weekday_averages(db, accommodation_ids)
 
     async def get_accommodation_detail(
         self,
@@ -559,7 +527,7 @@ class AccommodationService:
     ) -> List[dict]:
         """
         사용자 점수 기반 추천 숙소 조회
-        - accommodation_dates의 score를 5점 단위로 그룹화
+        - accommodation_dates의 score를 5점 단위로 그룹화 (accommodation_stats.score_bucket_counts)
         - 사용자 점수대와 비슷한 점수로 마감된 날짜가 많은 숙소 추천
         - 각 숙소별 해당 점수대 마감 날짜 수 포함
         """
@@ -569,33 +537,27 @@ class AccommodationService:
         score_upper = score_lower + 5
         score_range = f"{int(score_lower)}~{int(score_upper)}점"
 
-        # 최근 3개월
-        three_months_ago = datetime.now() - timedelta(days=90)
-        three_months_ago_str = three_months_ago.strftime("%Y-%m-%d")
-
-        # 해당 점수대로 마감된 숙소 조회 (accommodation_dates 기반)
+        # 최근 3개월 점수대별 마감 날짜 수는 accommodation_stats에 미리 집계되어 있음
+        # 점수대 필터/정렬/개수 제한은 DB에서 처리 (JSON 키 조회 → SQLite json_extract, PostgreSQL ->>)
+        bucket_key = score_bucket_key(score_lower)
+        visitor_count = AccommodationStats.score_bucket_counts[bucket_key].as_integer()
         result = await db.execute(
             select(
                 Accommodation.id,
                 Accommodation.name,
                 Accommodation.region,
                 Accommodation.images,
-                func.count(AccommodationDate.id).label('visitor_count')
+                visitor_count.label("visitor_count")
             )
-            .join(AccommodationDate, AccommodationDate.accommodation_id == Accommodation.id)
+            .join(AccommodationStats, AccommodationStats.accommodation_id == Accommodation.id)
             .where(
-                (AccommodationDate.status == "마감(신청종료)") &
-                (AccommodationDate.score >= score_lower) &
-                (AccommodationDate.score < score_upper) &
-                (AccommodationDate.date >= three_months_ago_str)
+                (AccommodationStats.closed_date_count > 0) &
+                (visitor_count > 0)
             )
-            .group_by(Accommodation.id, Accommodation.name, Accommodation.region, Accommodation.images)
-            .order_by(func.count(AccommodationDate.id).desc())
+            .order_by(visitor_count.desc(), Accommodation.id)
             .limit(limit)
         )
 
-        accommodations = result.all()
-
         return [
             {
                 "id": acc.id,
@@ -605,5 +567,5 @@ class AccommodationService:
                 "visitor_count": acc.visitor_count,
                 "score_range": score_range
             }
-            for acc in accommodations
+            for acc in result.all()
         ]
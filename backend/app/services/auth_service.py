@@ -12,17 +12,18 @@ import logging
 
 from app.models.user import User
 from app.models.booking import Booking, BookingStatus
-from app.utils.encryption import encrypt_password, decrypt_password
+from app.utils.encryption import encrypt_password, decrypt_password, current_key_version
 from app.utils.jwt import (
     create_access_token,
     create_refresh_token,
     verify_token,
     JWTError
 )
+from app.utils.browser_pool import browser_pool
+from app.utils.token_cache import token_cache, detached_user
 from auth.lulu_lala_auth import login_to_lulu_lala, navigate_to_reservation_page
 from app.config import settings
 
-from playwright.async_api import async_playwright
 from dateutil import parser as date_parser
 import uuid
 import re
@@ -494,11 +495,8 @@ class AuthService:
         logger.info(f"Attempting Lulu-Lala login for {username}...")
 
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                context = await browser.new_context(
-                    viewport={"width": 1920, "height": 1080}
-                )
+            # 앱 시작 시 띄워 둔 브라우저 풀에서 격리된 컨텍스트를 빌림 (블록 종료 시 자동 정리)
+            async with browser_pool.context(viewport={"width": 1920, "height": 1080}) as context:
                 page = await context.new_page()
 
                 # 로그인 시도
@@ -511,8 +509,6 @@ class AuthService:
 
                 if not success:
                     # 로그인 실패
-                    await browser.close()
-
                     # 실패 횟수 증가
                     if user:
                         user.failed_login_attempts += 1
@@ -565,8 +561,6 @@ class AuthService:
                     for c in cookies
                 ]
 
-                await browser.close()
-
         except Exception as e:
             if isinstance(e, (ValueError, PermissionError)):
                 raise
@@ -582,6 +576,7 @@ class AuthService:
                 lulu_lala_user_id=username,
                 name=user_info.get("name", username),  # 크롤링한 실제 이름
                 encrypted_password=encrypt_password(password),
+                encryption_key_version=current_key_version(),
                 is_verified=True,  # 로그인 성공 = 인증 완료
                 is_active=True,
                 session_cookies=session_cookies,
@@ -596,6 +591,7 @@ class AuthService:
         else:
             # 기존 사용자 업데이트
             user.encrypted_password = encrypt_password(password)
+            user.encryption_key_version = current_key_version()
             user.name = user_info.get("name", user.name)  # 이름 업데이트
             user.points = user_info.get("points", user.points)  # 점수 업데이트
             user.is_verified = True
@@ -604,6 +600,8 @@ class AuthService:
             user.last_login = datetime.utcnow()
             user.failed_login_attempts = 0  # 리셋
             user.locked_until = None
+            user.session_warm_failures = 0
+            user.session_warm_failed_at = None
             logger.info(f"Updated existing user: {user.id} (name: {user.name}, points: {user.points})")
 
         await db.commit()
@@ -652,7 +650,8 @@ class AuthService:
     async def get_user_from_token(
         self,
         token: str,
-        db: AsyncSession
+        db: AsyncSession,
+        allow_cached: bool = False
     ) -> Optional[User]:
         """
         JWT 토큰에서 사용자 조회
@@ -660,18 +659,30 @@ class AuthService:
         Args:
             token: JWT 액세스 토큰
             db: 데이터베이스 세션
+            allow_cached: True면 캐시된 스냅샷으로 만든 읽기 전용(detached) User 반환 (DB 조회 생략)
 
         Returns:
-            User | None: 사용자 객체 (토큰이 유효하지 않으면 None)
+            User | None: 사용자 객체 (토큰이 유효하지 않거나 비활성 사용자면 None)
         """
         try:
-            payload = verify_token(token, token_type="access")
-            user_id = payload.get("user_id")
+            # 최근 검증한 토큰이면 JWT 검증 생략
+            snapshot = token_cache.get_snapshot(token)
+            if snapshot is not None:
+                if not snapshot.get("is_active"):
+                    token_cache.invalidate_token(token)
+                    return None
+                if allow_cached:
+                    return detached_user(snapshot)
+                user_id = snapshot["id"]
+            else:
+                payload = verify_token(token, token_type="access")
+                user_id = payload.get("user_id")
 
-            if not user_id:
-                logger.warning("Token missing user_id claim")
-                return None
+                if not user_id:
+                    logger.warning("Token missing user_id claim")
+                    return None
 
+            # 수정 가능한 경로는 항상 최신 행을 조회 (다른 프로세스의 포인트 변경 등을 덮어쓰지 않도록)
             result = await db.execute(
                 select(User).where(User.id == user_id)
             )
@@ -679,8 +690,13 @@ class AuthService:
 
             if not user or not user.is_active:
                 logger.warning(f"User not found or inactive: {user_id}")
+                token_cache.invalidate_token(token)
                 return None
 
+            if snapshot is None:
+                token_cache.set(token, user, token_expires_at=payload.get("exp"))
+            else:
+                token_cache.update_snapshot(token, user)
             return user
 
         except JWTError as e:
@@ -745,6 +761,9 @@ class AuthService:
                 }
             )
 
+            # 이전 액세스 토큰으로 캐시된 사용자 스냅샷 무효화
+            token_cache.invalidate_user(user.id)
+
             logger.info(f"Access token refreshed for user: {user_id}")
 
             return {
@@ -773,12 +792,14 @@ class AuthService:
         """
         try:
             user = await self.get_user_from_token(token, db)
+            token_cache.invalidate_token(token)
 
             if user:
                 # 리프레시 토큰 무효화
                 user.refresh_token_jti = None
                 user.refresh_token_expires_at = None
                 await db.commit()
+                token_cache.invalidate_user(user.id)
                 logger.info(f"User logged out: {user.id}")
 
         except Exception as e:
@@ -10,6 +10,7 @@ from app.models.wishlist import Wishlist
 from app.utils.logger import get_logger
 from app.integrations.firebase_service import FirebaseService
 from app.integrations.kakao_service import KakaoService
+from app.services.lulu_lala_session_manager import session_manager
 
 logger = get_logger(__name__)
 firebase_service = FirebaseService()
@@ -159,8 +160,11 @@ class BookingService:
         if not accommodation:
             raise ValueError("숙소를 찾을 수 없습니다.")
 
-        # 3. session_cookies 확인
-        if not user.session_cookies:
+        # 3. 룰루랄라 세션 확보 (워머가 미리 갱신해 둔 캐시/DB 세션, 없으면 새로 로그인)
+        try:
+            lulu_session = await session_manager.get_session(user_id, db)
+        except Exception as e:
+            logger.warning(f"Failed to get Lulu-Lala session for user {user_id}: {str(e)}")
             raise ValueError("로그인 세션이 만료되었습니다. 다시 로그인해주세요.")
 
         # 4. 중복 예약 체크
@@ -183,7 +187,7 @@ class BookingService:
         check_out = check_in + timedelta(days=1)
 
         # 쿠키 준비
-        cookies = {c["name"]: c["value"] for c in user.session_cookies}
+        cookies = {c["name"]: c["value"] for c in lulu_session.cookies}
 
         # Form data
         form_data = {
@@ -5,8 +5,9 @@ FAQ 기반 질의응답 챗봇
 import asyncio
 import csv
 import os
+import time
 from pathlib import Path
-from typing import TypedDict, Annotated, Sequence, Optional, Dict, Any
+from typing import TypedDict, Annotated, AsyncIterator, Sequence, Optional, Dict, Any, List, Tuple
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
 from langgraph.graph import StateGraph, END
@@ -15,11 +16,41 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import AsyncSessionLocal
 from app.models.faq import FAQ
 from app.services.faq_vector_service import get_faq_vector_service
+from app.utils.answer_cache import CachedAnswer, answer_cache
 from app.config import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 프롬프트 템플릿
+CONTEXT_SYSTEM_PROMPT = """당신은 신한은행 임직원을 위한 Refresh Plus 연성소 예약 플랫폼의 고객 지원 챗봇입니다.
+
+아래 참고 자료를 바탕으로 사용자의 질문에 친절하고 정확하게 답변해주세요.
+
+참고 자료:
+{context}
+
+답변 시 주의사항:
+1. 참고 자료에 있는 정보를 우선적으로 사용하세요
+2. 참고 자료에 없는 내용은 "죄송하지만 해당 정보를 찾을 수 없습니다"라고 안내하세요
+3. 친절하고 공손한 어투로 답변하세요
+4. 필요시 참고 자료의 번호를 인용하세요 (예: [참고 1]에 따르면...)
+"""
+
+NO_CONTEXT_SYSTEM_PROMPT = """당신은 신한은행 임직원을 위한 Refresh Plus 연성소 예약 플랫폼의 고객 지원 챗봇입니다.
+
+관련 FAQ를 찾을 수 없었습니다. 일반적인 지식을 바탕으로 도움을 드리거나,
+더 구체적인 질문을 부탁드려도 좋습니다.
+
+답변 시 주의사항:
+1. 친절하고 공손한 어투로 답변하세요
+2. 확실하지 않은 정보는 추측하지 말고, 관리자에게 문의하도록 안내하세요
+"""
+
+NO_API_KEY_MESSAGE = "OpenAI API 키가 설정되지 않았습니다. 관리자에게 문의하세요."
+GENERATION_ERROR_MESSAGE = "죄송합니다. 응답 생성 중 오류가 발생했습니다."
+REQUEST_ERROR_MESSAGE = "죄송합니다. 요청 처리 중 오류가 발생했습니다."
+
 
 # 상태 정의
 class ChatbotState(TypedDict):
@@ -28,6 +59,7 @@ class ChatbotState(TypedDict):
     """
     messages: Sequence[HumanMessage | AIMessage | SystemMessage]
     query: str
+    query_embedding: Optional[List[float]]
     context: Optional[str]
     response: Optional[str]
     error: Optional[str]
@@ -84,9 +116,10 @@ class ChatbotService:
         # 컴파일
         return workflow.compile()
 
-    def _retrieve_context(self, state: ChatbotState) -> ChatbotState:
+    async def _retrieve_context(self, state: ChatbotState) -> ChatbotState:
         """
         벡터 검색으로 관련 FAQ 컨텍스트 가져오기
+        (Chroma 조회와 쿼리 임베딩은 블로킹 호출이므로 스레드에서 실행)
 
         Args:
             state: 현재 상태
@@ -98,10 +131,15 @@ class ChatbotService:
             query = state["query"]
             logger.info(f"검색 쿼리: {query}")
 
+            # 배치 프로세스가 faq_vectors를 바꿨으면 인덱스 다시 적재 (NumPy 백엔드)
+            await self.faq_vector_service.refresh_if_stale()
+
             # 유사한 FAQ 검색
-            results = self.faq_vector_service.search_similar_faqs(
+            results = await asyncio.to_thread(
+                self.faq_vector_service.search_similar_faqs,
                 query=query,
-                n_results=3  # 상위 3개 결과
+                n_results=3,  # 상위 3개 결과
+                query_embedding=state.get("query_embedding")
             )
 
             # 컨텍스트 구성
@@ -124,9 +162,31 @@ class ChatbotService:
             state["error"] = str(e)
             return state
 
-    def _generate_response(self, state: ChatbotState) -> ChatbotState:
+    def _build_messages(self, query: str, context: Optional[str]) -> list:
+        """
+        검색 컨텍스트 유무에 따라 LLM 프롬프트 메시지 구성
+
+        Args:
+            query: 사용자 질문
+            context: 검색된 FAQ 컨텍스트
+
+        Returns:
+            LLM 입력 메시지 리스트
+        """
+        if context:
+            return [
+                SystemMessage(content=CONTEXT_SYSTEM_PROMPT.format(context=context)),
+                HumanMessage(content=f"사용자 질문: {query}")
+            ]
+        return [
+            SystemMessage(content=NO_CONTEXT_SYSTEM_PROMPT),
+            HumanMessage(content=query)
+        ]
+
+    async def _generate_response(self, state: ChatbotState) -> ChatbotState:
         """
         LLM을 사용하여 응답 생성
+        (astream 실행 시 LangGraph가 토큰 단위로 스트리밍)
 
         Args:
             state: 현재 상태
@@ -136,50 +196,13 @@ class ChatbotService:
         """
         try:
             if not self.llm:
-                state["response"] = "OpenAI API 키가 설정되지 않았습니다. 관리자에게 문의하세요."
+                state["response"] = NO_API_KEY_MESSAGE
                 return state
 
-            query = state["query"]
-            context = state.get("context")
-
-            # 프롬프트 템플릿
-            if context:
-                system_prompt = """당신은 신한은행 임직원을 위한 Refresh Plus 연성소 예약 플랫폼의 고객 지원 챗봇입니다.
-
-아래 참고 자료를 바탕으로 사용자의 질문에 친절하고 정확하게 답변해주세요.
-
-참고 자료:
-{context}
-
-답변 시 주의사항:
-1. 참고 자료에 있는 정보를 우선적으로 사용하세요
-2. 참고 자료에 없는 내용은 "죄송하지만 해당 정보를 찾을 수 없습니다"라고 안내하세요
-3. 친절하고 공손한 어투로 답변하세요
-4. 필요시 참고 자료의 번호를 인용하세요 (예: [참고 1]에 따르면...)
-"""
-                user_prompt = f"사용자 질문: {query}"
-
-                messages = [
-                    SystemMessage(content=system_prompt.format(context=context)),
-                    HumanMessage(content=user_prompt)
-                ]
-            else:
-                system_prompt = """당신은 신한은행 임직원을 위한 Refresh Plus 연성소 예약 플랫폼의 고객 지원 챗봇입니다.
-
-관련 FAQ를 찾을 수 없었습니다. 일반적인 지식을 바탕으로 도움을 드리거나,
-더 구체적인 질문을 부탁드려도 좋습니다.
-
-답변 시 주의사항:
-1. 친절하고 공손한 어투로 답변하세요
-2. 확실하지 않은 정보는 추측하지 말고, 관리자에게 문의하도록 안내하세요
-"""
-                messages = [
-                    SystemMessage(content=system_prompt),
-                    HumanMessage(content=query)
-                ]
+            messages = self._build_messages(state["query"], state.get("context"))
 
             # LLM 호출
-            response = self.llm.invoke(messages)
+            response = await self.llm.ainvoke(messages)
             state["response"] = response.content
             logger.info("응답 생성 완료")
 
@@ -188,7 +211,7 @@ class ChatbotService:
         except Exception as e:
             logger.error(f"응답 생성 실패: {e}")
             state["error"] = str(e)
-            state["response"] = "죄송합니다. 응답 생성 중 오류가 발생했습니다."
+            state["response"] = GENERATION_ERROR_MESSAGE
             return state
 
     async def chat(self, query: str) -> Dict[str, Any]:
@@ -201,21 +224,26 @@ class ChatbotService:
         Returns:
             챗봇 응답 및 메타데이터
         """
+        started_at = time.perf_counter()
         try:
             # FAQ 데이터 및 벡터 스토어 준비
             await self._ensure_initialized()
 
-            # 초기 상태
-            initial_state: ChatbotState = {
-                "messages": [],
-                "query": query,
-                "context": None,
-                "response": None,
-                "error": None
-            }
+            # 답변 캐시 조회
+            tier, cached, query_embedding = await self._lookup_cached_answer(query)
+            if cached is not None:
+                answer_cache.record_hit(tier, (time.perf_counter() - started_at) * 1000)
+                return {
+                    "success": True,
+                    "response": cached.response,
+                    "context": cached.context,
+                    "error": None
+                }
 
             # 워크플로우 실행
-            result = self.workflow.invoke(initial_state)
+            generation = answer_cache.generation
+            result = await self.workflow.ainvoke(self._initial_state(query, query_embedding))
+            await self._remember_answer(query, query_embedding, result, generation, started_at)
 
             return {
                 "success": True,
@@ -228,11 +256,169 @@ class ChatbotService:
             logger.error(f"챗봇 처리 실패: {e}")
             return {
                 "success": False,
-                "response": "죄송합니다. 요청 처리 중 오류가 발생했습니다.",
+                "response": REQUEST_ERROR_MESSAGE,
                 "context": None,
                 "error": str(e)
             }
 
+    async def chat_stream(self, query: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        사용자 질문에 대한 챗봇 응답 스트리밍
+
+        워크플로우를 astream으로 실행해 검색 컨텍스트와 LLM 토큰을 생성되는 즉시 내보낸다.
+
+        Args:
+            query: 사용자 질문
+
+        Yields:
+            {"event": "context" | "token" | "done", "data": {...}}
+        """
+        started_at = time.perf_counter()
+        first_token_ms: Optional[float] = None
+        streamed = False
+        final_state: Dict[str, Any] = {}
+
+        try:
+            # FAQ 데이터 및 벡터 스토어 준비
+            await self._ensure_initialized()
+
+            # 답변 캐시 조회 (적중 시 컨텍스트와 답변을 한 번에 내보냄)
+            tier, cached, query_embedding = await self._lookup_cached_answer(query)
+            if cached is not None:
+                elapsed_ms = (time.perf_counter() - started_at) * 1000
+                answer_cache.record_hit(tier, elapsed_ms)
+                yield {"event": "context", "data": {"context": cached.context}}
+                yield {"event": "token", "data": {"content": cached.response}}
+                yield {
+                    "event": "done",
+                    "data": {
+                        "success": True,
+                        "error": None,
+                        "cached": tier,
+                        "first_token_ms": round(elapsed_ms, 1),
+                        "total_ms": round(elapsed_ms, 1),
+                    }
+                }
+                return
+
+            generation = answer_cache.generation
+            async for mode, chunk in self.workflow.astream(
+                self._initial_state(query, query_embedding),
+                stream_mode=["updates", "messages"]
+            ):
+                if mode == "messages":
+                    message, metadata = chunk
+                    if metadata.get("langgraph_node") != "generate" or not message.content:
+                        continue
+                    if first_token_ms is None:
+                        first_token_ms = (time.perf_counter() - started_at) * 1000
+                    streamed = True
+                    yield {"event": "token", "data": {"content": message.content}}
+                    continue
+
+                for node, update in chunk.items():
+                    if not update:
+                        continue
+                    final_state.update(update)
+                    if node == "retrieve":
+                        yield {"event": "context", "data": {"context": update.get("context")}}
+
+            await self._remember_answer(query, query_embedding, final_state, generation, started_at)
+
+        except Exception as e:
+            logger.error(f"챗봇 스트리밍 실패: {e}")
+            final_state["error"] = str(e)
+            final_state["response"] = REQUEST_ERROR_MESSAGE
+
+        # API 키 미설정/생성 실패처럼 토큰 없이 응답만 정해진 경우 한 번에 내보낸다
+        if not streamed and final_state.get("response"):
+            if first_token_ms is None:
+                first_token_ms = (time.perf_counter() - started_at) * 1000
+            yield {"event": "token", "data": {"content": final_state["response"]}}
+
+        yield {
+            "event": "done",
+            "data": {
+                "success": not final_state.get("error"),
+                "error": final_state.get("error"),
+                "cached": None,
+                "first_token_ms": round(first_token_ms, 1) if first_token_ms is not None else None,
+                "total_ms": round((time.perf_counter() - started_at) * 1000, 1),
+            }
+        }
+
+    async def _lookup_cached_answer(
+        self,
+        query: str
+    ) -> Tuple[Optional[str], Optional[CachedAnswer], Optional[List[float]]]:
+        """
+        답변 캐시 조회 (정확 일치 → 임베딩 유사도)
+
+        유사도 조회를 위해 계산한 쿼리 임베딩은 캐시 미스 시 벡터 검색에 그대로 재사용한다.
+
+        Returns:
+            (적중 단계 "exact" | "semantic" | None, 캐시된 답변, 쿼리 임베딩)
+        """
+        if not settings.CHATBOT_ANSWER_CACHE_ENABLED:
+            return None, None, None
+
+        # 다른 프로세스의 FAQ 변경/캐시 무효화를 반영한 뒤 조회
+        await self.faq_vector_service.refresh_if_stale()
+        await answer_cache.load()
+        cached = answer_cache.get_exact(query)
+        if cached is not None:
+            return "exact", cached, None
+
+        try:
+            query_embedding = await asyncio.to_thread(self.faq_vector_service.embed_query, query)
+        except Exception as e:
+            logger.warning(f"쿼리 임베딩 실패, 유사 질문 캐시를 건너뜁니다: {e}")
+            return None, None, None
+
+        cached = answer_cache.get_similar(query_embedding)
+        if cached is not None:
+            return "semantic", cached, query_embedding
+        return None, None, query_embedding
+
+    async def _remember_answer(
+        self,
+        query: str,
+        query_embedding: Optional[List[float]],
+        result: Dict[str, Any],
+        generation: int,
+        started_at: float
+    ) -> None:
+        """
+        정상 생성된 답변만 캐시에 저장 (오류/API 키 미설정 응답 제외)
+        """
+        if not settings.CHATBOT_ANSWER_CACHE_ENABLED:
+            return
+
+        answer_cache.record_miss((time.perf_counter() - started_at) * 1000)
+        if self.llm is None or result.get("error") or not result.get("response"):
+            return
+        await answer_cache.put(
+            query,
+            query_embedding,
+            result["response"],
+            result.get("context"),
+            generation=generation
+        )
+
+    @staticmethod
+    def _initial_state(query: str, query_embedding: Optional[List[float]] = None) -> ChatbotState:
+        """
+        워크플로우 초기 상태
+        """
+        return {
+            "messages": [],
+            "query": query,
+            "query_embedding": query_embedding,
+            "context": None,
+            "response": None,
+            "error": None
+        }
+
     async def get_stats(self) -> Dict[str, Any]:
         """
         챗봇 통계
@@ -241,13 +427,17 @@ class ChatbotService:
             통계 정보
         """
         await self._ensure_initialized()
-        return self.faq_vector_service.get_collection_stats()
+        stats = await asyncio.to_thread(self.faq_vector_service.get_collection_stats)
+        return {
+            **stats,
+            "answer_cache": answer_cache.snapshot()
+        }
 
     async def _ensure_initialized(self) -> None:
         """
         FAQ DB 데이터 및 벡터 스토어를 준비한다.
         - faqs 테이블이 비어 있으면 CSV를 읽어 채운다.
-        - 벡터 스토어에 데이터가 없으면 벡터화한다.
+        - 벡터 스토어를 FAQ 테이블과 증분 동기화한다.
         """
         if self._initialized:
             return
@@ -270,16 +460,11 @@ class ChatbotService:
                     else:
                         logger.info(f"이미 {faq_count}개의 FAQ 데이터가 존재합니다.")
 
-                    # 벡터 스토어 상태 확인 후 벡터화
-                    stats = self.faq_vector_service.get_collection_stats()
-                    vector_count = stats.get("total_documents", 0) if stats else 0
-                    if vector_count < faq_count and faq_count > 0:
-                        await self.faq_vector_service.vectorize_all_faqs(db)
-                        logger.info("FAQ 벡터화 완료")
-                    elif vector_count == 0 and faq_count == 0:
-                        logger.warning("FAQ 데이터가 없어 벡터화를 건너뜁니다.")
+                    # 벡터 스토어와 증분 동기화 (바뀐 FAQ만 임베딩)
+                    if faq_count > 0:
+                        await self.faq_vector_service.sync_faqs(db)
                     else:
-                        logger.info(f"벡터 스토어에 {vector_count}개 문서가 이미 존재합니다.")
+                        logger.warning("FAQ 데이터가 없어 벡터화를 건너뜁니다.")
 
                 self._initialized = True
             except Exception as e:
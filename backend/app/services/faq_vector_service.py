@@ -2,16 +2,39 @@
 FAQ 벡터화 서비스
 FAQ 데이터를 ChromaDB에 벡터화하여 저장
 """
-from typing import List, Dict, Any, Optional
+import asyncio
+import hashlib
+import inspect
+from typing import List, Dict, Any, Optional, Tuple
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.faq import FAQ
 from app.integrations.vector_store import get_vector_store
+from app.utils.answer_cache import answer_cache
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def build_faq_document(faq: FAQ) -> Tuple[str, str, Dict[str, Any]]:
+    """
+    FAQ → (문서 ID, 문서 텍스트, 메타데이터)
+
+    메타데이터의 content_hash는 임베딩 대상인 문서 텍스트의 해시로,
+    증분 동기화에서 다시 임베딩할지 판단하는 데 사용한다.
+    """
+    # 질문과 답변을 결합하여 문서 생성
+    doc_text = f"질문: {faq.question}\n답변: {faq.answer}"
+    metadata = {
+        "faq_id": faq.id,
+        "question": faq.question,
+        "category": faq.category or "기타",
+        "order": faq.order or 0,
+        "content_hash": hashlib.sha256(doc_text.encode("utf-8")).hexdigest()
+    }
+    return f"faq_{faq.id}", doc_text, metadata
+
+
 class FAQVectorService:
     """
     FAQ 벡터화 서비스
@@ -23,6 +46,40 @@ class FAQVectorService:
         """
         self.vector_store = get_vector_store()
 
+    async def _run_store(self, func, *args, **kwargs):
+        """
+        벡터 스토어 메서드 호출
+        (ChromaDB 동기 메서드는 스레드에서, NumPy 백엔드의 쓰기 코루틴은 그대로 await)
+        """
+        if inspect.iscoroutinefunction(func):
+            return await func(*args, **kwargs)
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+    async def load(self) -> None:
+        """
+        벡터 스토어 적재 (faq_vectors 기반 NumPy 백엔드만 해당, 앱 시작 시 호출)
+        """
+        load = getattr(self.vector_store, "load", None)
+        if load is not None:
+            await load()
+
+    async def refresh_if_stale(self, max_age: Optional[float] = None) -> None:
+        """
+        다른 프로세스(FAQ 크롤링 배치)의 faq_vectors 변경을 반영 (NumPy 백엔드만 해당, 검색 전 호출)
+        확인에 실패하면 기존 인덱스로 계속 검색
+        배치가 다른 호스트에서 돌아 답변 캐시 파일을 공유하지 않아도, 변경을 감지하면 답변 캐시를 무효화
+        """
+        refresh_if_stale = getattr(self.vector_store, "refresh_if_stale", None)
+        if refresh_if_stale is None:
+            return
+        try:
+            reloaded = await refresh_if_stale(max_age)
+        except Exception as e:
+            logger.warning(f"벡터 스토어 변경 확인 실패, 기존 인덱스 사용: {e}")
+            return
+        if reloaded:
+            await answer_cache.clear()
+
     async def vectorize_all_faqs(self, db: AsyncSession) -> Dict[str, Any]:
         """
         모든 FAQ를 벡터화하여 저장
@@ -35,8 +92,9 @@ class FAQVectorService:
         """
         try:
             # 기존 컬렉션 초기화
-            self.vector_store.reset_collection()
-            logger.info("기존 FAQ 벡터 컬렉션 초기화됨")
+            await self._run_store(self.vector_store.reset_collection)
+            await answer_cache.clear()
+            logger.info("기존 FAQ 벡터 컬렉션 및 답변 캐시 초기화됨")
 
             # 모든 FAQ 가져오기
             result = await db.execute(
@@ -49,29 +107,11 @@ class FAQVectorService:
                 return {"success": 0, "failed": 0, "total": 0}
 
             # 문서, 메타데이터, ID 리스트 준비
-            documents = []
-            metadatas = []
-            ids = []
-
-            for faq in faqs:
-                # 질문과 답변을 결합하여 문서 생성
-                doc_text = f"질문: {faq.question}\n답변: {faq.answer}"
-                documents.append(doc_text)
-
-                # 메타데이터
-                metadata = {
-                    "faq_id": faq.id,
-                    "question": faq.question,
-                    "category": faq.category or "기타",
-                    "order": faq.order or 0
-                }
-                metadatas.append(metadata)
-
-                # ID (faq_id 사용)
-                ids.append(f"faq_{faq.id}")
-
-            # ChromaDB에 추가
-            self.vector_store.add_documents(
+            ids, documents, metadatas = (list(column) for column in zip(*map(build_faq_document, faqs)))
+
+            # ChromaDB에 추가 (임베딩 API 호출이 블로킹이므로 스레드에서 실행)
+            await self._run_store(
+                self.vector_store.add_documents,
                 documents=documents,
                 metadatas=metadatas,
                 ids=ids
@@ -89,6 +129,72 @@ class FAQVectorService:
             logger.error(f"FAQ 벡터화 실패: {e}")
             raise
 
+    async def sync_faqs(self, db: AsyncSession) -> Dict[str, Any]:
+        """
+        FAQ 테이블과 벡터 컬렉션 증분 동기화
+
+        저장된 content_hash와 비교해 새로 생기거나 내용이 바뀐 FAQ만 임베딩하고,
+        순서/카테고리만 바뀐 FAQ는 메타데이터만 갱신하며, 테이블에서 사라진 FAQ는 삭제한다.
+
+        Args:
+            db: 데이터베이스 세션
+
+        Returns:
+            처리 결과 (추가/변경/메타데이터 갱신/삭제/유지 개수)
+        """
+        result = await db.execute(
+            select(FAQ).order_by(FAQ.order.asc())
+        )
+        documents = {
+            doc_id: (doc_text, metadata)
+            for doc_id, doc_text, metadata in map(build_faq_document, result.scalars().all())
+        }
+        await self.load()
+        # 다른 프로세스가 먼저 동기화했을 수 있으므로 현재 테이블 기준으로 비교
+        await self.refresh_if_stale(max_age=0)
+        stored = await self._run_store(self.vector_store.get_metadatas)
+
+        added = [doc_id for doc_id in documents if doc_id not in stored]
+        changed = [
+            doc_id for doc_id, (_, metadata) in documents.items()
+            if doc_id in stored and stored[doc_id].get("content_hash") != metadata["content_hash"]
+        ]
+        relabeled = [
+            doc_id for doc_id, (_, metadata) in documents.items()
+            if doc_id in stored and doc_id not in changed and stored[doc_id] != metadata
+        ]
+        removed = [doc_id for doc_id in stored if doc_id not in documents]
+
+        upserts = added + changed
+        if upserts:
+            await self._run_store(
+                self.vector_store.upsert_documents,
+                documents=[documents[doc_id][0] for doc_id in upserts],
+                metadatas=[documents[doc_id][1] for doc_id in upserts],
+                ids=upserts
+            )
+        if relabeled:
+            await self._run_store(
+                self.vector_store.update_metadatas,
+                metadatas=[documents[doc_id][1] for doc_id in relabeled],
+                ids=relabeled
+            )
+        if removed:
+            await self._run_store(self.vector_store.delete_documents, removed)
+        if upserts or removed:
+            await answer_cache.clear()
+
+        summary = {
+            "added": len(added),
+            "updated": len(changed),
+            "metadata_updated": len(relabeled),
+            "deleted": len(removed),
+            "unchanged": len(documents) - len(upserts) - len(relabeled),
+            "total": len(documents)
+        }
+        logger.info(f"FAQ 벡터 증분 동기화 완료: {summary}")
+        return summary
+
     async def add_faq_to_vector(
         self,
         db: AsyncSession,
@@ -115,24 +221,17 @@ class FAQVectorService:
                 logger.warning(f"FAQ ID {faq_id}를 찾을 수 없습니다.")
                 return False
 
-            # 문서 생성
-            doc_text = f"질문: {faq.question}\n답변: {faq.answer}"
-
-            # 메타데이터
-            metadata = {
-                "faq_id": faq.id,
-                "question": faq.question,
-                "category": faq.category or "기타",
-                "order": faq.order or 0
-            }
+            doc_id, doc_text, metadata = build_faq_document(faq)
 
-            # ChromaDB에 추가
-            self.vector_store.add_documents(
+            # ChromaDB에 추가 (이미 있으면 교체)
+            await self._run_store(
+                self.vector_store.upsert_documents,
                 documents=[doc_text],
                 metadatas=[metadata],
-                ids=[f"faq_{faq.id}"]
+                ids=[doc_id]
             )
 
+            await answer_cache.clear()
             logger.info(f"FAQ ID {faq_id} 벡터화 완료")
             return True
 
@@ -144,7 +243,8 @@ class FAQVectorService:
         self,
         query: str,
         n_results: int = 5,
-        category: Optional[str] = None
+        category: Optional[str] = None,
+        query_embedding: Optional[List[float]] = None
     ) -> Dict[str, Any]:
         """
         유사한 FAQ 검색
@@ -153,6 +253,7 @@ class FAQVectorService:
             query: 검색 쿼리
             n_results: 반환할 결과 개수
             category: 카테고리 필터 (선택)
+            query_embedding: 미리 계산한 쿼리 임베딩 (선택)
 
         Returns:
             검색 결과
@@ -167,7 +268,8 @@ class FAQVectorService:
             results = self.vector_store.query(
                 query_text=query,
                 n_results=n_results,
-                where=where
+                where=where,
+                query_embedding=query_embedding
             )
 
             return results
@@ -176,6 +278,18 @@ class FAQVectorService:
             logger.error(f"FAQ 검색 실패: {e}")
             raise
 
+    def embed_query(self, query: str) -> List[float]:
+        """
+        검색 쿼리 임베딩 (답변 캐시 유사도 비교와 검색에 함께 사용)
+
+        Args:
+            query: 검색 쿼리
+
+        Returns:
+            임베딩 벡터
+        """
+        return self.vector_store.embed_query(query)
+
     def get_collection_stats(self) -> Dict[str, Any]:
         """
         벡터 컬렉션 통계
@@ -185,10 +299,15 @@ class FAQVectorService:
         """
         try:
             count = self.vector_store.get_collection_count()
-            return {
+            stats = {
                 "collection_name": self.vector_store.collection_name,
-                "total_documents": count
+                "total_documents": count,
+                "embeddings": self.vector_store.get_embedding_stats()
             }
+            get_index_stats = getattr(self.vector_store, "get_index_stats", None)
+            if get_index_stats is not None:
+                stats["index"] = get_index_stats()
+            return stats
         except Exception as e:
             logger.error(f"통계 조회 실패: {e}")
             raise
@@ -4,19 +4,26 @@
 세션 쿠키를 캐싱하여 예약 신청/취소 시 빠른 응답을 제공합니다.
 - 첫 예약: 8-10초 (세션 생성)
 - 이후 예약: <1초 (캐시 사용)
+- 메모리 캐시는 최대 SESSION_CACHE_MAX_ENTRIES개 (LRU)
+- 백그라운드 워머가 최근 활동한 사용자의 세션을 만료 전에 미리 갱신
 """
 
-from typing import Dict, Optional
+import asyncio
+from collections import OrderedDict
+from typing import Any, Dict, Optional
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from playwright.async_api import BrowserContext, async_playwright, Browser, Playwright
+from playwright.async_api import BrowserContext
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import func, select, update
 import logging
 
+from app.database import AsyncSessionLocal
 from app.models.user import User
+from app.utils.browser_pool import browser_pool
 from app.utils.encryption import decrypt_password
 from auth.lulu_lala_auth import login_to_lulu_lala, navigate_to_reservation_page
+from auth.lulu_lala_http_auth import HttpLoginStatus, login_via_http
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -34,40 +41,21 @@ class LuluLalaSessionManager:
     """룰루랄라 세션 관리자"""
 
     def __init__(self):
-        self.sessions: Dict[str, SessionData] = {}
-        self._playwright: Optional[Playwright] = None
-        self._browser: Optional[Browser] = None
+        self.sessions: "OrderedDict[str, SessionData]" = OrderedDict()
+        self._warmer_task: Optional[asyncio.Task] = None
+        self.warm_stats: Dict[str, Any] = {}
 
     async def initialize(self):
         """
-        앱 시작 시 브라우저 초기화
+        앱 시작 시 브라우저 풀 초기화
 
         브라우저를 미리 실행해두면 세션 생성이 더 빠릅니다.
         """
-        try:
-            self._playwright = await async_playwright().start()
-            self._browser = await self._playwright.chromium.launch(
-                headless=True,
-                args=[
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-dev-shm-usage',  # Docker/메모리 제한 환경 최적화
-                    '--no-sandbox',  # Docker 환경 호환성
-                ]
-            )
-            logger.info("Playwright browser initialized for session management")
-        except Exception as e:
-            logger.error(f"Failed to initialize browser: {str(e)}", exc_info=True)
+        await browser_pool.start()
 
     async def shutdown(self):
-        """앱 종료 시 브라우저 정리"""
-        try:
-            if self._browser:
-                await self._browser.close()
-            if self._playwright:
-                await self._playwright.stop()
-            logger.info("Playwright browser shut down")
-        except Exception as e:
-            logger.error(f"Error shutting down browser: {str(e)}", exc_info=True)
+        """앱 종료 시 브라우저 풀 정리"""
+        await browser_pool.stop()
 
     async def get_session(
         self,
@@ -94,11 +82,12 @@ class LuluLalaSessionManager:
             session = self.sessions[user_id]
             if self._is_valid(session):
                 logger.info(f"Using cached session for user {user_id}")
+                self.sessions.move_to_end(user_id)
                 return session
             else:
                 logger.info(f"Cached session expired for user {user_id}, refreshing...")
                 # 만료된 세션 제거
-                del self.sessions[user_id]
+                await self._evict(user_id)
 
         # 2. DB에서 세션 확인
         result = await db.execute(
@@ -117,15 +106,35 @@ class LuluLalaSessionManager:
                     cookies=user.session_cookies,
                     expires_at=user.session_expires_at
                 )
-                self.sessions[user_id] = session
+                await self._remember(user_id, session)
                 return session
 
         # 3. 새 세션 생성 필요
         logger.info(f"Creating new session for user {user_id} (8-10s)...")
+        return await self.refresh_session(user_id, db)
+
+    async def refresh_session(self, user_id: str, db: AsyncSession) -> SessionData:
+        """캐시/DB 상태와 관계없이 새 세션을 만들어 저장"""
         session = await self._create_session(user_id, db)
-        self.sessions[user_id] = session
+        await self._remember(user_id, session)
         return session
 
+    async def _remember(self, user_id: str, session: SessionData):
+        """메모리 캐시에 저장 (최대 개수 초과 시 가장 오래 쓰지 않은 세션 제거)"""
+        if user_id in self.sessions:
+            await self._evict(user_id)
+        self.sessions[user_id] = session
+        while len(self.sessions) > settings.SESSION_CACHE_MAX_ENTRIES:
+            await self._evict(next(iter(self.sessions)))
+
+    async def _evict(self, user_id: str):
+        session = self.sessions.pop(user_id, None)
+        if session and session.context:
+            try:
+                await session.context.close()
+            except Exception as e:
+                logger.warning(f"Failed to close context for user {user_id}: {str(e)}")
+
     def _is_valid(self, session: SessionData) -> bool:
         """세션이 유효한지 확인"""
         return datetime.utcnow() < session.expires_at
@@ -136,7 +145,9 @@ class LuluLalaSessionManager:
         db: AsyncSession
     ) -> SessionData:
         """
-        새 룰루랄라 세션 생성 (Playwright 사용, 8-10초 소요)
+        새 룰루랄라 세션 생성
+        HTTP 전용 로그인(1초 미만)을 먼저 시도하고, HTTP 경로를 쓸 수 없을 때만 Playwright(8-10초)로 폴백
+        (사이트가 로그인을 거부했으면 폴백하지 않음 - 실패 로그인 누적으로 인한 계정 잠금 방지)
 
         Args:
             user_id: 사용자 ID
@@ -163,73 +174,33 @@ class LuluLalaSessionManager:
 
         # 비밀번호 복호화
         try:
-            password = decrypt_password(user.encrypted_password)
+            password = decrypt_password(user.encrypted_password, user.encryption_key_version)
         except Exception as e:
             logger.error(f"Failed to decrypt password for user {user_id}: {str(e)}")
             raise ValueError("Failed to decrypt password")
 
-        # 브라우저 컨텍스트 생성
-        try:
-            if not self._browser:
-                # 브라우저가 초기화되지 않은 경우 임시로 생성
-                logger.warning("Browser not initialized, creating temporary browser")
-                async with async_playwright() as p:
-                    browser = await p.chromium.launch(
-                        headless=True,
-                        args=[
-                            '--disable-blink-features=AutomationControlled',
-                            '--disable-dev-shm-usage',  # Docker/메모리 제한 환경 최적화
-                            '--no-sandbox',  # Docker 환경 호환성
-                        ]
-                    )
-                    context = await browser.new_context(
-                        viewport={"width": 1920, "height": 1080}
-                    )
-                    page = await context.new_page()
-
-                    # 로그인 시도
-                    success = await self._do_login(page, user, password)
-
-                    if not success:
-                        await browser.close()
-                        raise RuntimeError(f"Login failed for user {user_id}")
+        # HTTP 전용 로그인 (브라우저 없이 폼 전송 + SSO 리다이렉트)
+        if settings.LULU_LALA_HTTP_LOGIN_ENABLED:
+            http_login = await login_via_http(
+                user.lulu_lala_user_id,
+                password,
+                settings.LULU_LALA_RSA_PUBLIC_KEY
+            )
+            if http_login.status == HttpLoginStatus.SUCCESS:
+                return await self._save_session(user, http_login.cookies, db)
+            if http_login.status == HttpLoginStatus.REJECTED:
+                raise RuntimeError(f"Login failed for user {user_id}")
+            logger.info(f"HTTP login unavailable for user {user_id}, falling back to browser")
 
-                    # shbrefresh 세션 확보 (SSO)
-                    logger.info("Establishing shbrefresh session via Refresh portal...")
-                    try:
-                        nav_success, nav_page = await navigate_to_reservation_page(page, context)
-                        if nav_success and nav_page:
-                            logger.info("shbrefresh session established successfully")
-                        else:
-                            logger.warning("Unable to confirm shbrefresh navigation – proceeding with existing cookies")
-                    except Exception as nav_error:
-                        logger.error(
-                            f"Failed to navigate to shbrefresh reservation page: {str(nav_error)}",
-                            exc_info=True
-                        )
-
-                    # 세션 쿠키 추출 (shbrefresh 쿠키 포함)
-                    cookies = await context.cookies()
-                    session_data = await self._save_session(user, cookies, db)
-
-                    # 명시적으로 page, context, browser 닫기
-                    await page.close()
-                    await context.close()
-                    await browser.close()
-                    logger.info("Temporary browser resources closed")
-                    return session_data
-            else:
-                # 기존 브라우저 사용 (더 빠름)
-                context = await self._browser.new_context(
-                    viewport={"width": 1920, "height": 1080}
-                )
+        # 브라우저 풀에서 격리된 컨텍스트를 빌려 로그인 (쿠키만 저장하고 컨텍스트는 반납)
+        try:
+            async with browser_pool.context(viewport={"width": 1920, "height": 1080}) as context:
                 page = await context.new_page()
 
                 # 로그인 시도
                 success = await self._do_login(page, user, password)
 
                 if not success:
-                    await context.close()
                     raise RuntimeError(f"Login failed for user {user_id}")
 
                 # shbrefresh 세션 확보 (SSO)
@@ -248,14 +219,8 @@ class LuluLalaSessionManager:
 
                 # 세션 쿠키 추출 (shbrefresh 쿠키 포함)
                 cookies = await context.cookies()
-                session_data = await self._save_session(user, cookies, db)
 
-                # 페이지는 닫고, 컨텍스트는 유지 (세션 재사용 가능)
-                await page.close()
-                logger.info("Page closed, context kept for session reuse")
-                session_data.context = context
-
-                return session_data
+            return await self._save_session(user, cookies, db)
 
         except Exception as e:
             logger.error(f"Error creating session for user {user_id}: {str(e)}", exc_info=True)
@@ -290,9 +255,11 @@ class LuluLalaSessionManager:
             expires_at=datetime.utcnow() + timedelta(hours=6)
         )
 
-        # DB에 저장
+        # DB에 저장 (로그인 성공 → 백그라운드 갱신 실패 기록 초기화)
         user.session_cookies = session_data.cookies
         user.session_expires_at = session_data.expires_at
+        user.session_warm_failures = 0
+        user.session_warm_failed_at = None
         await db.commit()
 
         logger.info(f"Session created and saved for user {user.id}")
@@ -306,11 +273,7 @@ class LuluLalaSessionManager:
         로그아웃 또는 비밀번호 변경 시 호출
         """
         # 메모리에서 제거
-        if user_id in self.sessions:
-            session = self.sessions[user_id]
-            if session.context:
-                await session.context.close()
-            del self.sessions[user_id]
+        await self._evict(user_id)
 
         # DB에서 제거
         result = await db.execute(
@@ -325,35 +288,142 @@ class LuluLalaSessionManager:
 
         logger.info(f"Session invalidated for user {user_id}")
 
-    async def background_session_warming(self, db: AsyncSession):
+    @staticmethod
+    def _in_warm_backoff(failures: Optional[int], failed_at: Optional[datetime], now: datetime) -> bool:
         """
-        백그라운드 작업: 만료 임박 세션 갱신
+        최근 갱신에 실패한 사용자인지 확인
 
-        매 1시간마다 실행하여 세션을 미리 갱신합니다.
+        실패할 때마다 SESSION_WARM_FAILURE_BACKOFF_MINUTES의 2배씩 기다리고,
+        SESSION_WARM_MAX_FAILURES회 연속 실패하면 다음 로그인 성공 전까지 건너뜁니다.
+        (비밀번호가 바뀐 사용자의 로그인 재시도가 누적되어 계정이 잠기지 않도록)
         """
-        try:
-            # 2시간 내 만료 예정인 세션 조회
-            result = await db.execute(
-                select(User).where(
-                    User.session_expires_at < datetime.utcnow() + timedelta(hours=2),
-                    User.session_expires_at > datetime.utcnow(),
-                    User.is_verified == True,
-                    User.encrypted_password.isnot(None)
+        if not failures:
+            return False
+        if failures >= settings.SESSION_WARM_MAX_FAILURES or failed_at is None:
+            return True
+        backoff = timedelta(minutes=settings.SESSION_WARM_FAILURE_BACKOFF_MINUTES * 2 ** (failures - 1))
+        return now < failed_at + backoff
+
+    async def _record_warm_failure(self, user_id: str, failed_at: datetime):
+        async with AsyncSessionLocal() as session_db:
+            await session_db.execute(
+                update(User)
+                .where(User.id == user_id)
+                .values(
+                    session_warm_failures=func.coalesce(User.session_warm_failures, 0) + 1,
+                    session_warm_failed_at=failed_at
                 )
             )
-            users = result.scalars().all()
+            await session_db.commit()
 
-            logger.info(f"Warming {len(users)} sessions...")
+    async def background_session_warming(self, db: Optional[AsyncSession] = None) -> Dict[str, Any]:
+        """
+        백그라운드 작업: 만료 임박 세션 갱신
 
-            for user in users:
-                try:
-                    await self.get_session(user.id, db)
-                    logger.info(f"Warmed session for user {user.id}")
-                except Exception as e:
-                    logger.error(f"Failed to warm session for user {user.id}: {str(e)}")
+        최근 SESSION_WARM_ACTIVE_DAYS일 안에 로그인한 사용자 중
+        SESSION_REFRESH_BEFORE_MINUTES분 안에 만료되는 세션을
+        SESSION_WARM_CONCURRENCY개씩 동시에 새로 만듭니다.
+        - 이미 만료된 세션은 갱신하지 않음 (다음 사용 시 get_session이 생성)
+        - 최근 갱신에 실패한 사용자는 건너뜀 (_in_warm_backoff)
 
+        Returns:
+            {"due", "refreshed", "failed", "backoff", "next_due_at"}
+        """
+        now = datetime.utcnow()
+        refresh_before = now + timedelta(minutes=settings.SESSION_REFRESH_BEFORE_MINUTES)
+        active_since = now - timedelta(days=settings.SESSION_WARM_ACTIVE_DAYS)
+        stats: Dict[str, Any] = {"due": 0, "refreshed": 0, "failed": 0, "backoff": 0, "next_due_at": None}
+
+        candidates = (
+            select(User.id, User.session_expires_at, User.session_warm_failures, User.session_warm_failed_at)
+            .where(
+                User.is_active == True,
+                User.is_verified == True,
+                User.encrypted_password.isnot(None),
+                User.session_expires_at > now,
+                User.last_login >= active_since
+            )
+            .order_by(User.session_expires_at)
+        )
+
+        try:
+            if db is not None:
+                rows = (await db.execute(candidates)).all()
+            else:
+                async with AsyncSessionLocal() as session_db:
+                    rows = (await session_db.execute(candidates)).all()
         except Exception as e:
             logger.error(f"Error in background session warming: {str(e)}", exc_info=True)
+            return stats
+
+        due_user_ids = []
+        upcoming = []
+        for user_id, expires_at, failures, failed_at in rows:
+            if expires_at >= refresh_before:
+                upcoming.append(expires_at)
+            elif self._in_warm_backoff(failures, failed_at, now):
+                stats["backoff"] += 1
+            else:
+                due_user_ids.append(user_id)
+        if upcoming:
+            stats["next_due_at"] = min(upcoming) - timedelta(minutes=settings.SESSION_REFRESH_BEFORE_MINUTES)
+        stats["due"] = len(due_user_ids)
+
+        if due_user_ids:
+            logger.info(f"Warming {len(due_user_ids)} sessions ({stats['backoff']} in failure backoff)...")
+
+        semaphore = asyncio.Semaphore(settings.SESSION_WARM_CONCURRENCY)
+
+        async def warm(user_id: str):
+            async with semaphore:
+                try:
+                    # 동시에 갱신하므로 사용자마다 별도 DB 세션 사용
+                    async with AsyncSessionLocal() as session_db:
+                        await self.refresh_session(user_id, session_db)
+                    stats["refreshed"] += 1
+                    logger.info(f"Warmed session for user {user_id}")
+                except Exception as e:
+                    stats["failed"] += 1
+                    logger.error(f"Failed to warm session for user {user_id}: {str(e)}")
+                    try:
+                        await self._record_warm_failure(user_id, datetime.utcnow())
+                    except Exception as record_error:
+                        logger.error(f"Failed to record warm failure for user {user_id}: {str(record_error)}")
+
+        await asyncio.gather(*(warm(user_id) for user_id in due_user_ids))
+        self.warm_stats = {**stats, "ran_at": now}
+        return stats
+
+    async def _warmer_loop(self):
+        """다음 만료 예정 시각에 맞춰 워밍을 반복 (최소 60초, 최대 SESSION_WARM_INTERVAL_SECONDS 간격)"""
+        while True:
+            delay = settings.SESSION_WARM_INTERVAL_SECONDS
+            try:
+                stats = await self.background_session_warming()
+                if stats["next_due_at"]:
+                    until_due = (stats["next_due_at"] - datetime.utcnow()).total_seconds()
+                    delay = min(delay, max(60.0, until_due))
+            except Exception as e:
+                # 예상 밖 오류로 워머 태스크가 조용히 종료되지 않도록 기록 후 다음 주기에 재시도
+                logger.error(f"Session warmer iteration failed: {str(e)}", exc_info=True)
+            await asyncio.sleep(delay)
+
+    def start_warmer(self):
+        """백그라운드 세션 워머 시작 (앱 시작 시 호출)"""
+        if self._warmer_task is None or self._warmer_task.done():
+            self._warmer_task = asyncio.create_task(self._warmer_loop())
+            logger.info("Session warmer started")
+
+    async def stop_warmer(self):
+        """백그라운드 세션 워머 중지 (앱 종료 시 호출)"""
+        if self._warmer_task is not None:
+            self._warmer_task.cancel()
+            try:
+                await self._warmer_task
+            except asyncio.CancelledError:
+                pass
+            self._warmer_task = None
+            logger.info("Session warmer stopped")
 
 
 # 전역 싱글톤 인스턴스
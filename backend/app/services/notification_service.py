@@ -6,26 +6,43 @@
 - 알림 이력 추적
 """
 
+import asyncio
 import hashlib
 import json
+import time
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
 from uuid import uuid4
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.database import AsyncSessionLocal
 from app.models.user import User
 from app.models.notification_type import NotificationType
 from app.models.notification_preference import NotificationPreference
 from app.models.notification_log import NotificationLog
-from app.integrations.firebase_service import FirebaseService
+from app.integrations.firebase_service import (
+    FCM_MULTICAST_MAX_TOKENS,
+    FirebaseService,
+    is_invalid_token_error,
+)
 from app.integrations.webpush_service import WebPushService
+from app.utils.dedup_index import dedup_index
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# IN (...) 조회 시 한 번에 넘길 값 수 (sqlite 바인드 파라미터 제한 고려)
+PREFETCH_CHUNK_SIZE = 500
+
+# 알림 타입별 중복 방지 기간 (시간), 없으면 DEFAULT_DEDUP_TTL_HOURS
+DEDUP_TTL_HOURS = {
+    'wishlist_available': 8,  # 09:00와 20:00 중복 방지
+}
+DEFAULT_DEDUP_TTL_HOURS = 24
+
 class NotificationService:
     """통합 알림 발송 서비스"""
 
@@ -122,38 +139,193 @@ class NotificationService:
         self,
         users_data: List[Dict[str, Any]],
         notification_type: str
-    ) -> Dict[str, int]:
+    ) -> Dict[str, Any]:
         """
-        여러 사용자에게 알림 발송 (최적화됨)
+        여러 사용자에게 알림 발송 (일괄 처리)
+
+        1. 사용자/알림 설정/템플릿/유효한 중복 방지 키를 집합 쿼리로 미리 조회
+        2. 발송 대상만 제한된 동시성(NOTIFICATION_SEND_CONCURRENCY)으로 병렬 발송
+           (FCM은 같은 메시지를 받는 사용자끼리 묶어 500개 단위 멀티캐스트)
+        3. 알림 로그를 마지막에 한 번에 저장하고 무효 FCM 토큰 정리
 
         Args:
             users_data: [{'user_id': 'id1', 'data': {...}}, ...]
             notification_type: 알림 타입
 
         Returns:
-            {'sent': 10, 'failed': 2}
+            {'sent': 10, 'failed': 2, 'skipped': 3, 'duration_seconds': 1.2, 'sends_per_second': 8.3}
         """
+        started_at = time.monotonic()
         sent = 0
         failed = 0
+        skipped = 0
 
         async with AsyncSessionLocal() as db:
+            # 1. 집합 단위 사전 조회
+            template = await self._get_notification_template(db, notification_type)
+            if not template or not template.enabled:
+                logger.error(f"Template not found or disabled: {notification_type}")
+                return self._bulk_result(0, len(users_data), 0, started_at)
+
+            user_ids = list({user_info['user_id'] for user_info in users_data})
+            users = await self._get_users(db, user_ids)
+            disabled_user_ids = await self._get_disabled_user_ids(db, user_ids, notification_type)
+
+            dedup_keys = {
+                id(user_info): self._generate_dedup_key(user_info['user_id'], notification_type, user_info['data'])
+                for user_info in users_data
+            }
+            active_dedup_keys = await dedup_index.active_keys(db, dedup_keys.values())
+
+            # 2. 발송 대상 선별 (같은 배치 안의 중복도 제거)
+            targets = []
             for user_info in users_data:
-                try:
-                    success = await self.send_notification(
-                        user_id=user_info['user_id'],
-                        notification_type=notification_type,
-                        data=user_info['data'],
-                        db=db
-                    )
-                    if success:
-                        sent += 1
-                    else:
-                        failed += 1
-                except Exception as e:
-                    logger.error(f"Bulk send error for user {user_info.get('user_id')}: {e}")
-                    failed += 1
-
-        return {"sent": sent, "failed": failed}
+                user_id = user_info['user_id']
+                user = users.get(user_id)
+                dedup_key = dedup_keys[id(user_info)]
+
+                if not user or not user.notification_enabled or user_id in disabled_user_ids:
+                    skipped += 1
+                    continue
+                if dedup_key in active_dedup_keys:
+                    logger.info(f"Duplicate notification skipped: {dedup_key}")
+                    skipped += 1
+                    continue
+
+                active_dedup_keys.add(dedup_key)
+                targets.append((user, user_info['data'], dedup_key))
+
+            # 3. 렌더링 후 채널별 분류
+            #    FCM 수신자는 렌더링 결과(title, body, data)가 같은 것끼리 묶어 멀티캐스트로 발송
+            log_rows: List[Dict[str, Any]] = []
+            multicast_groups: Dict[tuple, List[tuple]] = {}
+            single_sends = []
+
+            for user, data, dedup_key in targets:
+                title = self._render_template(template.template_title, data)
+                body = self._render_template(template.template_body, data)
+                channel = user.preferred_notification_channel or self._auto_select_channel(user)
+
+                if not channel:
+                    logger.warning(f"No valid channel for user {user.id}")
+                    log_rows.append(self._build_log_row(
+                        user.id, notification_type, 'none', title, body, data,
+                        status='failed',
+                        error_message='No valid notification channel',
+                        dedup_key=dedup_key
+                    ))
+                elif channel == 'fcm' and user.fcm_token:
+                    group_key = (title, body, json.dumps(data, sort_keys=True, default=str))
+                    multicast_groups.setdefault(group_key, []).append((user, data, dedup_key))
+                else:
+                    single_sends.append((user, data, dedup_key, title, body, channel))
+
+            # 4. 제한된 동시성으로 병렬 발송
+            semaphore = asyncio.Semaphore(settings.NOTIFICATION_SEND_CONCURRENCY)
+            invalid_tokens: List[Dict[str, str]] = []
+
+            async def dispatch(
+                user: User,
+                data: Dict[str, Any],
+                dedup_key: str,
+                title: str,
+                body: str,
+                channel: str
+            ) -> List[Dict[str, Any]]:
+                async with semaphore:
+                    success = await self._send_via_channel(channel, user, title, body, data)
+
+                return [self._build_log_row(
+                    user.id, notification_type, channel, title, body, data,
+                    status='sent' if success else 'failed',
+                    error_message=None if success else 'Send failed',
+                    dedup_key=dedup_key
+                )]
+
+            async def dispatch_multicast(title: str, body: str, recipients: List[tuple]) -> List[Dict[str, Any]]:
+                data = recipients[0][1]
+                tokens = [user.fcm_token for user, _, _ in recipients]
+
+                async with semaphore:
+                    results = await self._send_fcm_multicast(tokens, title, body, data)
+
+                rows = []
+                for (user, user_data, dedup_key), (success, error_message, invalid) in zip(recipients, results):
+                    if invalid:
+                        invalid_tokens.append({"b_id": user.id, "b_token": user.fcm_token})
+                    rows.append(self._build_log_row(
+                        user.id, notification_type, 'fcm', title, body, user_data,
+                        status='sent' if success else 'failed',
+                        error_message=error_message,
+                        dedup_key=dedup_key
+                    ))
+                return rows
+
+            tasks = [dispatch(*single) for single in single_sends]
+            for (title, body, _), recipients in multicast_groups.items():
+                for start in range(0, len(recipients), FCM_MULTICAST_MAX_TOKENS):
+                    tasks.append(dispatch_multicast(
+                        title, body, recipients[start:start + FCM_MULTICAST_MAX_TOKENS]
+                    ))
+
+            for rows in await asyncio.gather(*tasks):
+                log_rows.extend(rows)
+
+            sent = sum(1 for row in log_rows if row['status'] == 'sent')
+            failed = len(log_rows) - sent
+
+            # 5. 알림 로그 일괄 저장 및 무효 토큰 정리
+            await self._bulk_log_notifications(db, log_rows)
+            await dedup_index.add_many({row['dedup_key']: row['dedup_expires_at'] for row in log_rows})
+            await self._prune_invalid_fcm_tokens(db, invalid_tokens)
+
+        result = self._bulk_result(sent, failed, skipped, started_at)
+        logger.info(
+            f"Bulk notification ({notification_type}) - Sent: {sent}, Failed: {failed}, "
+            f"Skipped: {skipped}, {result['sends_per_second']} sends/sec"
+        )
+        return result
+
+    @staticmethod
+    def _bulk_result(sent: int, failed: int, skipped: int, started_at: float) -> Dict[str, Any]:
+        duration = time.monotonic() - started_at
+        return {
+            "sent": sent,
+            "failed": failed,
+            "skipped": skipped,
+            "duration_seconds": round(duration, 3),
+            "sends_per_second": round((sent + failed) / duration, 1) if duration > 0 else 0.0
+        }
+
+    async def _get_users(self, db: AsyncSession, user_ids: List[str]) -> Dict[str, User]:
+        """사용자 일괄 조회"""
+        users: Dict[str, User] = {}
+        for start in range(0, len(user_ids), PREFETCH_CHUNK_SIZE):
+            result = await db.execute(
+                select(User).where(User.id.in_(user_ids[start:start + PREFETCH_CHUNK_SIZE]))
+            )
+            users.update({user.id: user for user in result.scalars().all()})
+        return users
+
+    async def _get_disabled_user_ids(
+        self,
+        db: AsyncSession,
+        user_ids: List[str],
+        notification_type: str
+    ) -> set:
+        """해당 알림 타입을 끈 사용자 ID 일괄 조회 (설정이 없으면 활성화로 간주)"""
+        disabled = set()
+        for start in range(0, len(user_ids), PREFETCH_CHUNK_SIZE):
+            result = await db.execute(
+                select(NotificationPreference.user_id)
+                .where(
+                    NotificationPreference.user_id.in_(user_ids[start:start + PREFETCH_CHUNK_SIZE]),
+                    NotificationPreference.notification_type_id == notification_type,
+                    NotificationPreference.enabled == False
+                )
+            )
+            disabled.update(result.scalars().all())
+        return disabled
 
     async def _send_via_channel(
         self,
@@ -197,6 +369,60 @@ class NotificationService:
             logger.error(f"FCM send failed: {e}", exc_info=True)
             return False
 
+    async def _send_fcm_multicast(
+        self,
+        tokens: List[str],
+        title: str,
+        body: str,
+        data: Dict[str, Any]
+    ) -> List[tuple]:
+        """
+        Firebase FCM 멀티캐스트 발송 (최대 500개)
+
+        Returns:
+            토큰 순서대로 [(성공 여부, 오류 메시지, 무효 토큰 여부), ...]
+        """
+        try:
+            response = await self.firebase_service.send_multicast(
+                tokens=tokens,
+                title=title,
+                body=body,
+                data=data
+            )
+        except Exception as e:
+            logger.error(f"FCM multicast failed: {e}", exc_info=True)
+            return [(False, 'Send failed', False)] * len(tokens)
+
+        return [
+            (
+                result.success,
+                None if result.success else f"Send failed: {result.exception}",
+                not result.success and is_invalid_token_error(result.exception)
+            )
+            for result in response.responses
+        ]
+
+    async def _prune_invalid_fcm_tokens(self, db: AsyncSession, invalid_tokens: List[Dict[str, str]]):
+        """무효 FCM 토큰 제거 (그사이 새 토큰으로 바뀐 사용자는 건드리지 않음)"""
+        if not invalid_tokens:
+            return
+        try:
+            users_table = User.__table__
+            await db.execute(
+                update(users_table)
+                .where(
+                    users_table.c.id == bindparam("b_id"),
+                    users_table.c.fcm_token == bindparam("b_token")
+                )
+                .values(fcm_token=None),
+                invalid_tokens
+            )
+            await db.commit()
+            logger.info(f"Pruned {len(invalid_tokens)} invalid FCM tokens")
+        except Exception as e:
+            logger.error(f"Failed to prune invalid FCM tokens: {e}", exc_info=True)
+            await db.rollback()
+
     async def _send_web_push(
         self,
         subscription: str,
@@ -212,7 +438,7 @@ class NotificationService:
             else:
                 subscription_info = subscription
 
-            result = self.webpush_service.send_notification(
+            result = await self.webpush_service.send_notification(
                 subscription_info=subscription_info,
                 title=title,
                 body=body,
@@ -255,16 +481,8 @@ class NotificationService:
         return hashlib.md5(key_str.encode()).hexdigest()
 
     async def _is_duplicate(self, db: AsyncSession, dedup_key: str) -> bool:
-        """중복 알림 체크"""
-        result = await db.execute(
-            select(NotificationLog)
-            .where(
-                NotificationLog.dedup_key == dedup_key,
-                NotificationLog.dedup_expires_at > datetime.utcnow()
-            )
-            .limit(1)
-        )
-        return result.scalar_one_or_none() is not None
+        """중복 알림 체크 (Redis 인덱스, 없거나 장애 시 DB 조회)"""
+        return dedup_key in await dedup_index.active_keys(db, [dedup_key])
 
     def _render_template(self, template: str, data: Dict[str, Any]) -> str:
         """템플릿 렌더링 (Python .format() 사용)"""
@@ -314,6 +532,52 @@ class NotificationService:
         # 기본값: 활성화 (설정이 없으면 True)
         return pref.enabled if pref else True
 
+    def _dedup_expires_at(self, notification_type: str) -> datetime:
+        """알림 타입별 중복 방지 만료 시각"""
+        hours = DEDUP_TTL_HOURS.get(notification_type, DEFAULT_DEDUP_TTL_HOURS)
+        return datetime.utcnow() + timedelta(hours=hours)
+
+    def _build_log_row(
+        self,
+        user_id: str,
+        notification_type: str,
+        channel: str,
+        title: str,
+        body: str,
+        data: Dict[str, Any],
+        status: str,
+        error_message: Optional[str] = None,
+        dedup_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """notification_logs 행 생성"""
+        now = datetime.utcnow()
+        return {
+            "id": str(uuid4()),
+            "user_id": user_id,
+            "notification_type_id": notification_type,
+            "channel": channel,
+            "title": title,
+            "body": body,
+            "data": data,
+            "status": status,
+            "error_message": error_message,
+            "sent_at": now if status == 'sent' else None,
+            "dedup_key": dedup_key,
+            "dedup_expires_at": self._dedup_expires_at(notification_type),
+            "created_at": now,
+        }
+
+    async def _bulk_log_notifications(self, db: AsyncSession, rows: List[Dict[str, Any]]):
+        """알림 로그 일괄 저장"""
+        if not rows:
+            return
+        try:
+            await db.execute(insert(NotificationLog.__table__), rows)
+            await db.commit()
+        except Exception as e:
+            logger.error(f"Failed to bulk log {len(rows)} notifications: {e}", exc_info=True)
+            await db.rollback()
+
     async def _log_notification(
         self,
         db: AsyncSession,
@@ -328,31 +592,17 @@ class NotificationService:
         dedup_key: Optional[str] = None
     ):
         """알림 로그 저장"""
+        row = self._build_log_row(
+            user_id, notification_type, channel, title, body, data,
+            status=status,
+            error_message=error_message,
+            dedup_key=dedup_key
+        )
         try:
-            # 알림 타입에 따라 만료 시간 설정
-            if notification_type == 'wishlist_available':
-                # 8시간 쿨다운 (09:00와 20:00 중복 방지)
-                dedup_expires = datetime.utcnow() + timedelta(hours=8)
-            else:
-                # 24시간 쿨다운 (기본값)
-                dedup_expires = datetime.utcnow() + timedelta(hours=24)
-
-            log = NotificationLog(
-                id=str(uuid4()),
-                user_id=user_id,
-                notification_type_id=notification_type,
-                channel=channel,
-                title=title,
-                body=body,
-                data=data,
-                status=status,
-                error_message=error_message,
-                sent_at=datetime.utcnow() if status == 'sent' else None,
-                dedup_key=dedup_key,
-                dedup_expires_at=dedup_expires
-            )
-            db.add(log)
+            db.add(NotificationLog(**row))
             await db.commit()
+            if dedup_key:
+                await dedup_index.add(dedup_key, row['dedup_expires_at'])
         except Exception as e:
             logger.error(f"Failed to log notification: {e}", exc_info=True)
             await db.rollback()
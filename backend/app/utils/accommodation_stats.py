@@ -0,0 +1,191 @@
+"""
+숙소 통계(accommodation_stats) 계산 유틸리티
+
+검색/추천 API가 매 요청마다 accommodation_dates 전체를 GROUP BY 하지 않도록
+숙소별 집계 값을 accommodation_stats 테이블에 미리 계산해 둡니다.
+- 마감(신청종료) 날짜 평균 점수, 온라인 평균가, 날짜 수
+- 최근 90일 요일별 평균 점수 (마감 날짜만)
+- 최근 90일 마감 점수 5점 구간별 날짜 수 (점수 기반 추천용)
+
+크롤링 배치가 저장을 마친 뒤 변경된 숙소 ID만 넘겨 증분 갱신합니다.
+"""
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, case, cast, Integer
+from app.models.accommodation import Accommodation
+from app.models.accommodation_date import AccommodationDate
+from app.models.accommodation_stats import AccommodationStats
+
+CLOSED_STATUS = "마감(신청종료)"
+
+# 요일별/점수대 통계 집계 기간 (일)
+RECENT_DAYS = 90
+
+# 점수 구간 크기 (점)
+SCORE_BUCKET_SIZE = 5
+
+# 요일 이름 매핑 (0=월요일, 6=일요일)
+WEEKDAY_NAMES = ["월", "화", "수", "목", "금", "토", "일"]
+
+
+def _recent_date_str() -> str:
+    return (datetime.now() - timedelta(days=RECENT_DAYS)).strftime("%Y-%m-%d")
+
+
+def score_bucket_key(score: float) -> str:
+    """점수가 속한 5점 구간의 하한을 문자열 키로 반환합니다. (예: 93.5 -> "90")"""
+    return str(int(score // SCORE_BUCKET_SIZE) * SCORE_BUCKET_SIZE)
+
+
+async def fetch_weekday_averages(
+    db: AsyncSession,
+    accommodation_ids: List[str]
+) -> Dict[str, List[dict]]:
+    """
+    여러 숙소의 최근 90일 요일별 평균 점수를 한 번의 GROUP BY 쿼리로 조회합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        accommodation_ids: 조회할 숙소 ID 목록
+
+    Returns:
+        {accommodation_id: [{"weekday", "weekday_name", "avg_score", "count"}, ...]}
+    """
+    if not accommodation_ids:
+        return {}
+
+    result = await db.execute(
+        select(
+            AccommodationDate.accommodation_id,
+            AccommodationDate.weekday,
+            func.avg(AccommodationDate.score).label('avg_score'),
+            func.count(AccommodationDate.id).label('count')
+        )
+        .where(
+            (AccommodationDate.accommodation_id.in_(set(accommodation_ids))) &
+            (AccommodationDate.status == CLOSED_STATUS) &
+            (AccommodationDate.date >= _recent_date_str())
+        )
+        .group_by(AccommodationDate.accommodation_id, AccommodationDate.weekday)
+        .order_by(AccommodationDate.accommodation_id, AccommodationDate.weekday)
+    )
+
+    weekday_averages_map: Dict[str, List[dict]] = {}
+    for data in result.all():
+        weekday_averages_map.setdefault(data.accommodation_id, []).append({
+            "weekday": data.weekday,
+            "weekday_name": WEEKDAY_NAMES[data.weekday] if data.weekday is not None else "",
+            "avg_score": round(data.avg_score, 1) if data.avg_score else 0.0,
+            "count": data.count
+        })
+
+    return weekday_averages_map
+
+
+async def refresh_accommodation_stats(
+    db: AsyncSession,
+    accommodation_ids: Optional[List[str]] = None
+) -> Dict[str, int]:
+    """
+    accommodation_stats 테이블을 갱신합니다.
+
+    accommodation_ids가 주어지면 해당 숙소만, 없으면 전체 숙소를 다시 계산합니다.
+    집계는 숙소 수와 무관하게 GROUP BY 쿼리 3번으로 끝납니다.
+
+    Args:
+        db: 데이터베이스 세션
+        accommodation_ids: 갱신할 숙소 ID 목록 (None이면 전체)
+
+    Returns:
+        업데이트 통계 딕셔너리
+        {
+            'total': 갱신 대상 숙소 수,
+            'inserted': 새로 생성된 통계 행 수,
+            'updated': 갱신된 통계 행 수
+        }
+    """
+    if accommodation_ids is None:
+        result = await db.execute(select(Accommodation.id))
+        target_ids = [row[0] for row in result.fetchall()]
+    else:
+        target_ids = list(dict.fromkeys(acc_id for acc_id in accommodation_ids if acc_id))
+
+    if not target_ids:
+        return {'total': 0, 'inserted': 0, 'updated': 0}
+
+    # 1. 기본 집계 (평균 점수, 평균가, 날짜 수)
+    is_closed = AccommodationDate.status == CLOSED_STATUS
+    base_result = await db.execute(
+        select(
+            AccommodationDate.accommodation_id,
+            func.avg(case((is_closed, AccommodationDate.score))).label("avg_closed_score"),
+            func.avg(AccommodationDate.online_price).label("avg_price"),
+            func.count(AccommodationDate.id).label("date_count"),
+            func.sum(case((is_closed, 1), else_=0)).label("closed_date_count"),
+            func.count(AccommodationDate.online_price).label("priced_date_count"),
+        )
+        .where(AccommodationDate.accommodation_id.in_(target_ids))
+        .group_by(AccommodationDate.accommodation_id)
+    )
+    base_map = {row.accommodation_id: row for row in base_result.all()}
+
+    # 2. 최근 90일 요일별 평균 점수
+    weekday_map = await fetch_weekday_averages(db, target_ids)
+
+    # 3. 최근 90일 마감 점수 5점 구간별 날짜 수
+    bucket = cast(AccommodationDate.score / SCORE_BUCKET_SIZE, Integer) * SCORE_BUCKET_SIZE
+    bucket_result = await db.execute(
+        select(
+            AccommodationDate.accommodation_id,
+            bucket.label("bucket"),
+            func.count(AccommodationDate.id).label("count")
+        )
+        .where(
+            (AccommodationDate.accommodation_id.in_(target_ids)) &
+            is_closed &
+            (AccommodationDate.score.isnot(None)) &
+            (AccommodationDate.date >= _recent_date_str())
+        )
+        .group_by(AccommodationDate.accommodation_id, bucket)
+    )
+    bucket_map: Dict[str, Dict[str, int]] = {}
+    for row in bucket_result.all():
+        bucket_map.setdefault(row.accommodation_id, {})[str(row.bucket)] = row.count
+
+    # 4. 기존 통계 행 조회 후 생성/갱신
+    existing_result = await db.execute(
+        select(AccommodationStats).where(AccommodationStats.accommodation_id.in_(target_ids))
+    )
+    existing_map = {stats.accommodation_id: stats for stats in existing_result.scalars().all()}
+
+    inserted_count = 0
+    updated_count = 0
+    now = datetime.utcnow()
+
+    for acc_id in target_ids:
+        base = base_map.get(acc_id)
+        stats = existing_map.get(acc_id)
+        if stats is None:
+            stats = AccommodationStats(accommodation_id=acc_id)
+            db.add(stats)
+            inserted_count += 1
+        else:
+            updated_count += 1
+
+        stats.avg_closed_score = base.avg_closed_score if base else None
+        stats.avg_price = base.avg_price if base else None
+        stats.date_count = base.date_count if base else 0
+        stats.closed_date_count = int(base.closed_date_count or 0) if base else 0
+        stats.priced_date_count = base.priced_date_count if base else 0
+        stats.weekday_averages = weekday_map.get(acc_id, [])
+        stats.score_bucket_counts = bucket_map.get(acc_id, {})
+        stats.updated_at = now
+
+    await db.commit()
+
+    return {
+        'total': len(target_ids),
+        'inserted': inserted_count,
+        'updated': updated_count
+    }
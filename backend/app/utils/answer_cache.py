@@ -0,0 +1,343 @@
+"""
+FAQ 챗봇 답변 캐시
+
+같은 질문(점수, 취소 규정 등)이 매일 반복되므로, 생성된 답변을 캐시해 임베딩/LLM 호출을 생략합니다.
+- 1단계: 정규화한 질문 텍스트(대소문자, 공백, 문장부호 무시) 일치
+- 2단계: 질문 임베딩의 코사인 유사도가 CHATBOT_ANSWER_CACHE_SIMILARITY 이상인 질문
+- 크기 제한 LRU + TTL, 로컬 SQLite 파일에 저장해 재시작 후에도 유지
+- FAQ 벡터 컬렉션을 다시 만들면(vectorize_all_faqs) 전체 무효화
+- 무효화 세대(generation)를 SQLite 파일의 PRAGMA user_version에 기록해, 다른 프로세스(FAQ 크롤링 배치)가
+  무효화하면 조회 전 load()에서 감지해 다시 적재
+"""
+
+import asyncio
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from app.config import settings
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_PUNCTUATION_PATTERN = re.compile(r"[^\w\s]")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """정확 일치 키: NFKC 정규화, 소문자, 문장부호 제거, 공백 압축"""
+    text = unicodedata.normalize("NFKC", query).lower()
+    text = _PUNCTUATION_PATTERN.sub(" ", text)
+    return _WHITESPACE_PATTERN.sub(" ", text).strip()
+
+
+def _default_cache_path() -> str:
+    # 벡터 스토어(ChromaDB)와 같은 디렉터리에 두어 컬렉션과 수명을 맞춤
+    base_dir = settings.CHROMA_PERSIST_DIRECTORY or Path(__file__).resolve().parents[2] / "chroma_db"
+    return os.path.join(os.path.expanduser(str(base_dir)), "answer_cache.sqlite3")
+
+
+def _unit_vector(embedding: Sequence[float]) -> Optional[np.ndarray]:
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = float(np.linalg.norm(vector))
+    if vector.ndim != 1 or norm == 0.0:
+        return None
+    return vector / norm
+
+
+@dataclass
+class CachedAnswer:
+    """캐시된 답변"""
+    query: str
+    response: str
+    context: Optional[str]
+    embedding: Optional[np.ndarray]  # 단위 벡터 (float32)
+    created_at: float
+
+
+class AnswerCache:
+    """정확 일치 + 임베딩 유사도 2단계 답변 캐시 (SQLite 영구 저장)"""
+
+    def __init__(self, path: Optional[str], max_entries: int, ttl_hours: float, similarity_threshold: float):
+        self.path = path or _default_cache_path()
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_hours * 3600
+        self.similarity_threshold = similarity_threshold
+        self._items: "OrderedDict[str, CachedAnswer]" = OrderedDict()
+        self._matrix: Optional[np.ndarray] = None
+        self._matrix_keys: List[str] = []
+        self._conn: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        self._loaded = False
+        # 무효화 세대 (SQLite user_version과 동기화), 무효화 이전에 시작된 생성 결과가 다시 저장되지 않도록 함
+        self.generation = 0
+        self.exact_hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+        self.hit_ms_total = 0.0
+        self.miss_ms_total = 0.0
+        self.saved_ms_total = 0.0
+
+    # --- SQLite 저장소 (스레드에서 실행) ---
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS chatbot_answers (
+                    query_key TEXT PRIMARY KEY,
+                    query TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    context TEXT,
+                    embedding BLOB,
+                    created_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.commit()
+        return self._conn
+
+    @staticmethod
+    def _stored_generation(conn: sqlite3.Connection) -> int:
+        return conn.execute("PRAGMA user_version").fetchone()[0]
+
+    def _read_generation(self) -> int:
+        with self._db_lock:
+            return self._stored_generation(self._connect())
+
+    def _load_rows(self) -> Tuple[int, List[tuple]]:
+        with self._db_lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM chatbot_answers WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+            conn.commit()
+            rows = conn.execute(
+                "SELECT query_key, query, response, context, embedding, created_at "
+                "FROM chatbot_answers ORDER BY created_at DESC LIMIT ?",
+                (self.max_entries,),
+            ).fetchall()
+            return self._stored_generation(conn), rows
+
+    def _write_row(self, key: str, item: CachedAnswer, evicted: List[str], generation: int) -> bool:
+        """항목 저장 (그 사이 다른 프로세스가 무효화했으면 저장하지 않고 False)"""
+        with self._db_lock:
+            conn = self._connect()
+            if self._stored_generation(conn) != generation:
+                return False
+            conn.execute(
+                "INSERT OR REPLACE INTO chatbot_answers "
+                "(query_key, query, response, context, embedding, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    item.query,
+                    item.response,
+                    item.context,
+                    item.embedding.tobytes() if item.embedding is not None else None,
+                    item.created_at,
+                ),
+            )
+            if evicted:
+                conn.executemany("DELETE FROM chatbot_answers WHERE query_key = ?", [(k,) for k in evicted])
+            conn.commit()
+            return True
+
+    def _delete_all(self) -> int:
+        """전체 삭제 후 세대를 올려 다른 프로세스에 알림 (같은 트랜잭션), 새 세대 반환"""
+        with self._db_lock:
+            conn = self._connect()
+            generation = self._stored_generation(conn) + 1
+            conn.execute("DELETE FROM chatbot_answers")
+            conn.execute(f"PRAGMA user_version = {int(generation)}")
+            conn.commit()
+            return generation
+
+    # --- 메모리 인덱스 ---
+
+    async def load(self) -> None:
+        """
+        SQLite 파일의 유효한 항목을 메모리로 적재 (조회 전마다 호출)
+        최초 1회 적재하고, 이후에는 다른 프로세스가 무효화해 세대가 바뀐 경우에만 다시 적재
+        """
+        if not settings.CHATBOT_ANSWER_CACHE_ENABLED:
+            return
+        if self._loaded:
+            try:
+                generation = await asyncio.to_thread(self._read_generation)
+            except Exception as e:
+                logger.warning(f"Answer cache generation check failed: {str(e)}")
+                return
+            if generation == self.generation:
+                return
+            logger.info(f"Answer cache invalidated by another process (generation {self.generation} → {generation})")
+
+        self._loaded = True
+        try:
+            generation, rows = await asyncio.to_thread(self._load_rows)
+        except Exception as e:
+            logger.warning(f"Answer cache load failed, starting empty: {str(e)}")
+            return
+
+        self.generation = generation
+        self._items.clear()
+        for key, query, response, context, embedding, created_at in reversed(rows):
+            vector = np.frombuffer(embedding, dtype=np.float32).copy() if embedding else None
+            self._items[key] = CachedAnswer(query, response, context, vector, created_at)
+        self._matrix = None
+        logger.info(f"Answer cache loaded: {len(self._items)} entries from {self.path}")
+
+    def _expired(self, item: CachedAnswer) -> bool:
+        return item.created_at + self.ttl_seconds < time.time()
+
+    def _discard(self, key: str) -> None:
+        if self._items.pop(key, None) is not None:
+            self._matrix = None
+
+    def get_exact(self, query: str) -> Optional[CachedAnswer]:
+        if not settings.CHATBOT_ANSWER_CACHE_ENABLED:
+            return None
+
+        key = normalize_query(query)
+        item = self._items.get(key)
+        if item is None:
+            return None
+        if self._expired(item):
+            self._discard(key)
+            return None
+
+        self._items.move_to_end(key)
+        return item
+
+    def get_similar(self, embedding: Sequence[float]) -> Optional[CachedAnswer]:
+        """유사도가 임계값 이상인 가장 가까운 질문의 답변"""
+        if not settings.CHATBOT_ANSWER_CACHE_ENABLED or not self._items:
+            return None
+
+        vector = _unit_vector(embedding)
+        if vector is None:
+            return None
+
+        if self._matrix is None:
+            self._matrix_keys = [key for key, item in self._items.items() if item.embedding is not None]
+            self._matrix = (
+                np.vstack([self._items[key].embedding for key in self._matrix_keys])
+                if self._matrix_keys else np.empty((0, vector.shape[0]), dtype=np.float32)
+            )
+        if self._matrix.shape[0] == 0 or self._matrix.shape[1] != vector.shape[0]:
+            return None
+
+        scores = self._matrix @ vector
+        best = int(np.argmax(scores))
+        if scores[best] < self.similarity_threshold:
+            return None
+
+        key = self._matrix_keys[best]
+        item = self._items[key]
+        if self._expired(item):
+            self._discard(key)
+            return None
+
+        self._items.move_to_end(key)
+        return item
+
+    async def put(
+        self,
+        query: str,
+        embedding: Optional[Sequence[float]],
+        response: str,
+        context: Optional[str],
+        generation: Optional[int] = None,
+    ) -> None:
+        """
+        생성된 답변 저장
+
+        Args:
+            generation: 생성 시작 시점의 self.generation (그 사이 무효화되었으면 저장하지 않음)
+        """
+        if not settings.CHATBOT_ANSWER_CACHE_ENABLED or not response:
+            return
+        generation = self.generation if generation is None else generation
+        if generation != self.generation:
+            return
+
+        key = normalize_query(query)
+        if not key:
+            return
+
+        item = CachedAnswer(
+            query=query,
+            response=response,
+            context=context,
+            embedding=_unit_vector(embedding) if embedding is not None else None,
+            created_at=time.time(),
+        )
+        self._items[key] = item
+        self._items.move_to_end(key)
+        evicted = []
+        while len(self._items) > self.max_entries:
+            evicted.append(self._items.popitem(last=False)[0])
+        self._matrix = None
+
+        try:
+            if not await asyncio.to_thread(self._write_row, key, item, evicted, generation):
+                # 생성 도중 다른 프로세스가 무효화함 → 메모리에도 남기지 않음 (다음 load()에서 다시 적재)
+                self._discard(key)
+        except Exception as e:
+            logger.warning(f"Answer cache persist failed: {str(e)}")
+
+    async def clear(self) -> None:
+        """전체 무효화 (FAQ 벡터 컬렉션 재구성/동기화 시, 같은 파일을 쓰는 다른 프로세스에도 전파)"""
+        self.generation += 1
+        self._items.clear()
+        self._matrix = None
+        try:
+            self.generation = await asyncio.to_thread(self._delete_all)
+        except Exception as e:
+            logger.warning(f"Answer cache clear failed: {str(e)}")
+        logger.info("Answer cache cleared")
+
+    def record_hit(self, tier: str, elapsed_ms: float) -> None:
+        if tier == "exact":
+            self.exact_hits += 1
+        else:
+            self.semantic_hits += 1
+        self.hit_ms_total += elapsed_ms
+        if self.misses:
+            self.saved_ms_total += max(0.0, self.miss_ms_total / self.misses - elapsed_ms)
+
+    def record_miss(self, elapsed_ms: float) -> None:
+        self.misses += 1
+        self.miss_ms_total += elapsed_ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        hits = self.exact_hits + self.semantic_hits
+        total = hits + self.misses
+        return {
+            "enabled": settings.CHATBOT_ANSWER_CACHE_ENABLED,
+            "entries": len(self._items),
+            "exact_hits": self.exact_hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / total, 3) if total else 0.0,
+            "avg_hit_ms": round(self.hit_ms_total / hits, 1) if hits else 0.0,
+            "avg_miss_ms": round(self.miss_ms_total / self.misses, 1) if self.misses else 0.0,
+            "saved_ms_total": round(self.saved_ms_total, 1),
+        }
+
+
+answer_cache = AnswerCache(
+    path=settings.CHATBOT_ANSWER_CACHE_PATH,
+    max_entries=settings.CHATBOT_ANSWER_CACHE_MAX_ENTRIES,
+    ttl_hours=settings.CHATBOT_ANSWER_CACHE_TTL_HOURS,
+    similarity_threshold=settings.CHATBOT_ANSWER_CACHE_SIMILARITY,
+)
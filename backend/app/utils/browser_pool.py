@@ -0,0 +1,186 @@
+"""
+Playwright 브라우저 풀
+
+로그인/세션 생성마다 Chromium을 새로 띄우면 8-10초가 걸리므로,
+앱 시작 시(lifespan) 브라우저를 미리 띄워 두고 요청마다 격리된 BrowserContext만 새로 만듭니다.
+- 동시 컨텍스트 수 제한 (BROWSER_POOL_MAX_CONTEXTS), 초과 요청은 대기열에서 대기
+- 컨텍스트를 내줄 때 브라우저 연결 상태 확인, 끊겼으면 다시 실행
+- 브라우저당 BROWSER_POOL_RECYCLE_AFTER회 사용 후 재시작 (메모리 누수 방지)
+- start()를 호출하지 않은 프로세스(배치 등)는 첫 사용 시 자동으로 시작
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional
+from playwright.async_api import Browser, BrowserContext, Playwright, async_playwright
+from app.config import settings
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+BROWSER_LAUNCH_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',  # Docker/메모리 제한 환경 최적화
+    '--no-sandbox',  # Docker 환경 호환성
+]
+
+
+@dataclass
+class BrowserSlot:
+    """풀의 브라우저 한 개와 사용 현황"""
+    browser: Optional[Browser] = None
+    active: int = 0
+    uses: int = 0
+    launches: int = 0
+
+
+class BrowserPool:
+    """격리된 BrowserContext를 빌려주는 브라우저 풀"""
+
+    def __init__(self, size: int, max_contexts: int, recycle_after: int):
+        self.size = max(1, size)
+        self.max_contexts = max_contexts
+        self.recycle_after = recycle_after
+        self._playwright: Optional[Playwright] = None
+        self._slots: List[BrowserSlot] = [BrowserSlot() for _ in range(self.size)]
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.waiting = 0
+        self.leases = 0
+        self.wait_seconds_total = 0.0
+
+    def _bind_loop(self) -> None:
+        # 배치(Lambda)는 실행마다 새 루프를 만들므로 루프가 바뀌면 동기화 객체와 브라우저를 새로 준비
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_contexts)
+            self._lock = asyncio.Lock()
+            self._playwright = None
+            self._slots = [BrowserSlot() for _ in range(self.size)]
+
+    async def _launch(self, slot: BrowserSlot) -> None:
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        slot.browser = await self._playwright.chromium.launch(headless=True, args=BROWSER_LAUNCH_ARGS)
+        slot.uses = 0
+        slot.launches += 1
+        logger.info(f"Browser pool: launched browser (launch #{slot.launches})")
+
+    async def _close_browser(self, slot: BrowserSlot) -> None:
+        browser, slot.browser = slot.browser, None
+        if browser is None:
+            return
+        try:
+            await browser.close()
+        except Exception as e:
+            logger.warning(f"Browser pool: error closing browser: {str(e)}")
+
+    async def _ensure_healthy(self, slot: BrowserSlot) -> Browser:
+        """연결이 끊겼거나 재시작 대상인 브라우저를 다시 실행"""
+        async with self._lock:
+            needs_recycle = slot.uses >= self.recycle_after and slot.active == 0
+            if slot.browser is not None and (not slot.browser.is_connected() or needs_recycle):
+                if needs_recycle:
+                    logger.info(f"Browser pool: recycling browser after {slot.uses} uses")
+                else:
+                    logger.warning("Browser pool: browser disconnected, relaunching")
+                await self._close_browser(slot)
+            if slot.browser is None:
+                await self._launch(slot)
+            return slot.browser
+
+    async def start(self) -> None:
+        """브라우저를 미리 실행 (앱 시작 시 호출)"""
+        self._bind_loop()
+        try:
+            for slot in self._slots:
+                await self._ensure_healthy(slot)
+            logger.info(f"Browser pool started: {self.size} browser(s), max {self.max_contexts} contexts")
+        except Exception as e:
+            logger.error(f"Failed to start browser pool (will retry on first use): {str(e)}", exc_info=True)
+
+    async def stop(self) -> None:
+        """모든 브라우저와 Playwright 종료 (앱 종료 시 호출)"""
+        for slot in self._slots:
+            await self._close_browser(slot)
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception as e:
+                logger.warning(f"Browser pool: error stopping Playwright: {str(e)}")
+            self._playwright = None
+        logger.info("Browser pool stopped")
+
+    @asynccontextmanager
+    async def context(self, **context_options: Any) -> AsyncIterator[BrowserContext]:
+        """
+        격리된 BrowserContext를 빌려줍니다. 블록을 벗어나면 컨텍스트를 닫습니다.
+
+        Example:
+            async with browser_pool.context(viewport={"width": 1920, "height": 1080}) as context:
+                page = await context.new_page()
+        """
+        self._bind_loop()
+        semaphore = self._semaphore
+
+        self.waiting += 1
+        started_at = time.monotonic()
+        try:
+            await asyncio.wait_for(semaphore.acquire(), timeout=settings.BROWSER_POOL_ACQUIRE_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise RuntimeError("Browser pool is busy. Please try again later.")
+        finally:
+            self.waiting -= 1
+        self.wait_seconds_total += time.monotonic() - started_at
+
+        slot = min(self._slots, key=lambda candidate: candidate.active)
+        slot.active += 1
+        context: Optional[BrowserContext] = None
+        try:
+            browser = await self._ensure_healthy(slot)
+            context = await browser.new_context(**context_options)
+            slot.uses += 1
+            self.leases += 1
+            yield context
+        finally:
+            if context is not None:
+                try:
+                    await context.close()
+                except Exception as e:
+                    logger.warning(f"Browser pool: error closing context: {str(e)}")
+            slot.active -= 1
+            if slot.uses >= self.recycle_after and slot.active == 0:
+                async with self._lock:
+                    if slot.active == 0:
+                        logger.info(f"Browser pool: recycling browser after {slot.uses} uses")
+                        await self._close_browser(slot)
+            semaphore.release()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "max_contexts": self.max_contexts,
+            "recycle_after": self.recycle_after,
+            "waiting": self.waiting,
+            "leases": self.leases,
+            "avg_wait_ms": round(self.wait_seconds_total / self.leases * 1000, 1) if self.leases else 0.0,
+            "browsers": [
+                {
+                    "connected": slot.browser is not None and slot.browser.is_connected(),
+                    "active_contexts": slot.active,
+                    "uses": slot.uses,
+                    "launches": slot.launches,
+                }
+                for slot in self._slots
+            ],
+        }
+
+
+browser_pool = BrowserPool(
+    size=settings.BROWSER_POOL_SIZE,
+    max_contexts=settings.BROWSER_POOL_MAX_CONTEXTS,
+    recycle_after=settings.BROWSER_POOL_RECYCLE_AFTER,
+)
@@ -0,0 +1,180 @@
+"""
+대량 upsert 유틸리티
+
+크롤링 배치가 레코드마다 PK로 SELECT 한 뒤 INSERT/UPDATE 하던 방식을 대체합니다.
+- 청크 단위로 기존 행을 `IN (...)` 쿼리 한 번에 미리 조회
+- 값이 같은 행은 건너뛰고, 신규/변경 행만 `INSERT ... ON CONFLICT DO UPDATE`로 일괄 기록
+- 테이블별 inserted/updated/unchanged 건수 보고
+
+Turso(libsql)와 로컬 sqlite는 sqlite 방언, 그 외 postgres 방언을 지원합니다.
+커밋은 호출하는 쪽에서 수행합니다.
+"""
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects import postgresql, sqlite
+
+# 한 번에 처리할 행 수 (sqlite 바인드 파라미터 제한 고려)
+DEFAULT_CHUNK_SIZE = 200
+
+# upsert 시 덮어쓰지 않는 컬럼
+_PRESERVED_COLUMNS = {"created_at"}
+
+
+@dataclass
+class UpsertResult:
+    """테이블 단위 upsert 결과"""
+    table: str
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    # insert_missing=False일 때 대상 행이 없어 건너뛴 수
+    missing: int = 0
+    # 신규 생성/변경된 행의 PK 목록
+    changed_keys: List[Any] = field(default_factory=list)
+
+    def merge(self, other: "UpsertResult") -> "UpsertResult":
+        self.inserted += other.inserted
+        self.updated += other.updated
+        self.unchanged += other.unchanged
+        self.missing += other.missing
+        self.changed_keys.extend(other.changed_keys)
+        return self
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            "inserted": self.inserted,
+            "updated": self.updated,
+            "unchanged": self.unchanged,
+            "missing": self.missing,
+        }
+
+    def __str__(self) -> str:
+        return (
+            f"{self.table} - Inserted: {self.inserted}, "
+            f"Updated: {self.updated}, Unchanged: {self.unchanged}"
+        )
+
+
+def _insert_for(db: AsyncSession, table):
+    dialect_name = db.bind.dialect.name if db.bind is not None else "sqlite"
+    if dialect_name == "postgresql":
+        return postgresql.insert(table)
+    return sqlite.insert(table)
+
+
+def _chunks(items: Sequence, size: int):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+async def _write_rows(db: AsyncSession, model, pk_name: str, rows: List[Dict[str, Any]]) -> None:
+    """같은 컬럼 구성을 가진 행끼리 묶어 INSERT ... ON CONFLICT DO UPDATE 실행"""
+    groups: Dict[tuple, List[Dict[str, Any]]] = {}
+    for row in rows:
+        groups.setdefault(tuple(sorted(row.keys())), []).append(row)
+
+    for columns, grouped_rows in groups.items():
+        stmt = _insert_for(db, model.__table__).values(grouped_rows)
+        update_set = {
+            column: stmt.excluded[column]
+            for column in columns
+            if column != pk_name and column not in _PRESERVED_COLUMNS
+        }
+        if update_set:
+            stmt = stmt.on_conflict_do_update(index_elements=[pk_name], set_=update_set)
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=[pk_name])
+        await db.execute(stmt)
+
+
+def keep_existing(*columns: str) -> Callable[[Dict[str, Any], Dict[str, Any]], Dict[str, Any]]:
+    """
+    bulk_upsert의 merge 헬퍼: 기존 행에 값이 있는 컬럼은 덮어쓰지 않음
+    columns는 compare_columns 또는 fetch_columns에 포함되어 있어야 합니다.
+    (예: merge=keep_existing("online_price"))
+    """
+    def merge(existing: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+        kept = {column: existing[column] for column in columns if existing.get(column) is not None}
+        return {**new, **kept} if kept else new
+    return merge
+
+
+async def bulk_upsert(
+    db: AsyncSession,
+    model,
+    rows: List[Dict[str, Any]],
+    compare_columns: Sequence[str],
+    merge: Optional[Callable[[Dict[str, Any], Dict[str, Any]], Dict[str, Any]]] = None,
+    fetch_columns: Sequence[str] = (),
+    insert_missing: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> UpsertResult:
+    """
+    rows를 model 테이블에 upsert 합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        model: 대상 ORM 모델 (단일 PK)
+        rows: 저장할 행 목록 (컬럼명 → 값). PK 컬럼은 반드시 포함
+        compare_columns: 기존 행과 비교해 변경 여부를 판단할 컬럼
+        merge: 기존 행이 있을 때 (기존 값, 새 값) → 저장할 값을 반환하는 함수
+               (예: 이미지 목록 합치기, 빈 값으로 덮어쓰지 않기)
+        fetch_columns: merge에 필요한 추가 조회 컬럼
+        insert_missing: False면 기존 행만 갱신하고 없는 행은 건너뜀 (부분 컬럼 갱신용)
+        chunk_size: 청크당 행 수
+
+    Returns:
+        UpsertResult (inserted/updated/unchanged 건수, 변경된 PK 목록)
+    """
+    pk_column = model.__table__.primary_key.columns.values()[0]
+    pk_name = pk_column.key
+    result = UpsertResult(table=model.__tablename__)
+
+    # 같은 PK가 여러 번 들어오면 마지막 값 사용
+    deduped = list({row[pk_name]: row for row in rows}.values())
+
+    select_columns = list(dict.fromkeys([pk_name, *compare_columns, *fetch_columns]))
+    now = datetime.utcnow()
+    has_updated_at = "updated_at" in model.__table__.columns
+
+    for chunk in _chunks(deduped, chunk_size):
+        # 1. 청크의 기존 행을 한 번에 조회
+        existing_result = await db.execute(
+            select(*[model.__table__.columns[name] for name in select_columns])
+            .where(pk_column.in_([row[pk_name] for row in chunk]))
+        )
+        existing_map = {
+            row[0]: dict(zip(select_columns, row))
+            for row in existing_result.fetchall()
+        }
+
+        # 2. 신규/변경/동일 분류
+        rows_to_write = []
+        for row in chunk:
+            existing = existing_map.get(row[pk_name])
+            if existing is None:
+                if not insert_missing:
+                    result.missing += 1
+                    continue
+                result.inserted += 1
+            else:
+                if merge is not None:
+                    row = merge(existing, row)
+                if all(existing.get(column) == row.get(column) for column in compare_columns):
+                    result.unchanged += 1
+                    continue
+                result.updated += 1
+
+            if has_updated_at and "updated_at" not in row:
+                row = {**row, "updated_at": now}
+            rows_to_write.append(row)
+            result.changed_keys.append(row[pk_name])
+
+        # 3. 신규/변경 행만 일괄 기록
+        if rows_to_write:
+            await _write_rows(db, model, pk_name, rows_to_write)
+
+    return result
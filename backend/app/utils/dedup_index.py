@@ -0,0 +1,153 @@
+"""
+알림 중복 방지 인덱스
+
+발송마다 notification_logs를 dedup_key로 조회하는 대신, 만료되지 않은 중복 방지 키를
+Redis에 올려 두고 조회합니다.
+- 만료 시각은 notification_logs.dedup_expires_at 그대로 사용 (8시간/24시간 규칙, Redis 키 TTL)
+- 인덱스는 여러 프로세스가 함께 쓰는 Redis일 때만 사용합니다. 프로세스 내 dict는 다른 프로세스가 기록한
+  로그를 보지 못해 중복 발송을 허용하므로 쓰지 않고, REDIS_URL이 없거나 장애 시 DB를 조회합니다.
+- Redis가 비어 있으면(최초 사용, 재시작/flush) 한 프로세스가 만료되지 않은 로그를 한 번 적재하고
+  적재 완료 표시 키(WARM_MARKER_KEY)를 남깁니다. 이후 모든 발송 로그가 Redis에도 기록되므로,
+  표시 키가 있는 동안 Redis 인덱스는 DB와 같은 결과를 줍니다.
+- notification_logs는 계속 원본으로 기록됩니다.
+"""
+
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Set
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.notification_log import NotificationLog
+from app.utils.logger import get_logger
+from app.utils.redis_client import get_redis
+
+logger = get_logger(__name__)
+
+KEY_PREFIX = "notif:dedup:"
+WARM_MARKER_KEY = f"{KEY_PREFIX}__warmed__"
+
+# 적재 완료 표시 유지 시간 (초) - 만료되면 다음 조회 때 다시 적재해 누락된 키를 보정
+WARM_MARKER_TTL_SECONDS = 3600
+
+# DB 조회 시 IN (...) 한 번에 넣을 키 수 (SQLite 바인드 변수 제한 고려)
+DB_LOOKUP_CHUNK_SIZE = 500
+
+
+def _to_epoch(expires_at: datetime) -> float:
+    """UTC naive datetime(notification_logs 저장 형식) → epoch 초"""
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    return expires_at.timestamp()
+
+
+class DedupIndex:
+    """TTL 기반 중복 방지 키 인덱스 (Redis, 없거나 장애 시 DB 조회)"""
+
+    def __init__(self):
+        self.warmed_at: Optional[datetime] = None
+
+    async def add_many(self, items: Dict[str, datetime]) -> bool:
+        """
+        {dedup_key: 만료 시각} 추가 (Redis가 없으면 DB가 원본이므로 아무것도 하지 않음)
+        Redis 쓰기에 실패하면 False
+        """
+        redis_client = get_redis()
+        if redis_client is None:
+            return True
+
+        now = datetime.now(timezone.utc).timestamp()
+        entries = {
+            key: _to_epoch(expires_at)
+            for key, expires_at in items.items()
+            if key and expires_at and _to_epoch(expires_at) > now
+        }
+        if not entries:
+            return True
+
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for key, expires_epoch in entries.items():
+                    pipe.set(f"{KEY_PREFIX}{key}", 1, exat=int(expires_epoch) + 1)
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.warning(f"Redis dedup write failed, index will be reloaded: {str(e)}")
+            # 누락된 키가 생겼으므로 표시 키를 지워 다음 조회 때 DB에서 다시 적재
+            try:
+                await redis_client.delete(WARM_MARKER_KEY)
+            except Exception:
+                pass
+            return False
+
+    async def add(self, key: str, expires_at: datetime) -> None:
+        await self.add_many({key: expires_at})
+
+    async def active_keys(self, db: AsyncSession, keys: Iterable[str]) -> Set[str]:
+        """keys 중 아직 만료되지 않은 중복 방지 키 (Redis 인덱스, 없거나 장애 시 DB)"""
+        keys = list(dict.fromkeys(key for key in keys if key))
+        if not keys:
+            return set()
+
+        redis_client = get_redis()
+        if redis_client is not None:
+            try:
+                values = await redis_client.mget([WARM_MARKER_KEY] + [f"{KEY_PREFIX}{key}" for key in keys])
+                if values[0] is None:
+                    await self.warm_load(db)
+                    values = await redis_client.mget([WARM_MARKER_KEY] + [f"{KEY_PREFIX}{key}" for key in keys])
+                if values[0] is not None:
+                    return {key for key, value in zip(keys, values[1:]) if value is not None}
+            except Exception as e:
+                logger.warning(f"Redis dedup lookup failed, falling back to DB: {str(e)}")
+
+        return await self._active_keys_from_db(db, keys)
+
+    async def _active_keys_from_db(self, db: AsyncSession, keys: List[str]) -> Set[str]:
+        """배치의 키만 IN (...)으로 조회"""
+        now = datetime.utcnow()
+        active: Set[str] = set()
+        for start in range(0, len(keys), DB_LOOKUP_CHUNK_SIZE):
+            result = await db.execute(
+                select(NotificationLog.dedup_key)
+                .where(
+                    NotificationLog.dedup_key.in_(keys[start:start + DB_LOOKUP_CHUNK_SIZE]),
+                    NotificationLog.dedup_expires_at > now
+                )
+                .distinct()
+            )
+            active.update(result.scalars().all())
+        return active
+
+    async def warm_load(self, db: AsyncSession) -> int:
+        """만료되지 않은 notification_logs의 중복 방지 키를 Redis에 적재하고 적재 건수 반환"""
+        redis_client = get_redis()
+        if redis_client is None:
+            return 0
+
+        now = datetime.utcnow()
+        result = await db.execute(
+            select(NotificationLog.dedup_key, NotificationLog.dedup_expires_at)
+            .where(
+                NotificationLog.dedup_key.is_not(None),
+                NotificationLog.dedup_expires_at > now
+            )
+        )
+        items: Dict[str, datetime] = {}
+        for dedup_key, expires_at in result.all():
+            if expires_at > items.get(dedup_key, now):
+                items[dedup_key] = expires_at
+
+        if not await self.add_many(items):
+            return 0
+        await redis_client.set(WARM_MARKER_KEY, now.isoformat(), ex=WARM_MARKER_TTL_SECONDS)
+        self.warmed_at = now
+        logger.info(f"Dedup index warm-loaded: {len(items)} active keys")
+        return len(items)
+
+    def snapshot(self) -> Dict:
+        return {
+            "backend": "redis" if get_redis() is not None else "db",
+            "warmed_at": self.warmed_at.isoformat() if self.warmed_at else None,
+        }
+
+
+dedup_index = DedupIndex()
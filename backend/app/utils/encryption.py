@@ -3,6 +3,12 @@
 
 AES-256-GCM을 사용하여 룰루랄라 비밀번호를 안전하게 저장합니다.
 복호화가 필요한 이유: Playwright를 통한 룰루랄라 로그인 시 평문 비밀번호 필요
+
+키 버전:
+- ENCRYPTION_KEY_VERSION: 현재 마스터 키(ENCRYPTION_MASTER_KEY)의 버전, 새 암호화에 사용
+- ENCRYPTION_RETIRED_MASTER_KEYS: 이전 버전 마스터 키 {버전: 키}, 복호화에만 사용
+- 사용자별 버전은 User.encryption_key_version에 저장
+PBKDF2 유도 결과는 (마스터 키, 솔트, 버전)별로 프로세스 내에 캐시합니다.
 """
 
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
@@ -10,6 +16,7 @@ from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 import os
 import secrets
+from functools import lru_cache
 from typing import Optional
 
 from app.config import settings
@@ -41,38 +48,62 @@ def _derive_key(master_key: bytes, salt: bytes) -> bytes:
     return kdf.derive(master_key)
 
 
+@lru_cache(maxsize=16)
+def _derive_key_cached(master_key: bytes, salt: bytes, key_version: int) -> bytes:
+    """(마스터 키, 솔트, 키 버전)별 유도 키 캐시 - PBKDF2는 프로세스당 버전별 1회만 실행"""
+    return _derive_key(master_key, salt)
+
+
+def current_key_version() -> int:
+    """새로 암호화할 때 사용하는 키 버전"""
+    return settings.ENCRYPTION_KEY_VERSION
+
+
+def _master_key_for_version(key_version: int) -> Optional[str]:
+    if key_version == settings.ENCRYPTION_KEY_VERSION:
+        return getattr(settings, 'ENCRYPTION_MASTER_KEY', None)
+    return settings.ENCRYPTION_RETIRED_MASTER_KEYS.get(key_version)
+
+
 # 환경 변수에서 키 로드
-def _get_encryption_key() -> bytes:
+def _get_encryption_key(key_version: Optional[int] = None) -> bytes:
     """
     환경 변수에서 암호화 키를 가져옵니다.
 
+    Args:
+        key_version: 키 버전 (None이면 현재 버전)
+
     Returns:
         bytes: 256-bit 암호화 키
 
     Raises:
-        EncryptionError: 환경 변수가 설정되지 않은 경우
+        EncryptionError: 환경 변수가 설정되지 않았거나 알 수 없는 키 버전인 경우
     """
-    master_key = getattr(settings, 'ENCRYPTION_MASTER_KEY', None)
+    if key_version is None:
+        key_version = current_key_version()
+
+    master_key = _master_key_for_version(key_version)
     salt = getattr(settings, 'ENCRYPTION_SALT', None)
 
     if not master_key or not salt:
         raise EncryptionError(
-            "ENCRYPTION_MASTER_KEY and ENCRYPTION_SALT must be set in environment variables"
+            f"Master key for version {key_version} and ENCRYPTION_SALT must be set in environment variables"
         )
 
     # 문자열을 바이트로 변환
     master_key_bytes = master_key.encode('utf-8') if isinstance(master_key, str) else master_key
     salt_bytes = salt.encode('utf-8') if isinstance(salt, str) else salt
 
-    return _derive_key(master_key_bytes, salt_bytes)
+    return _derive_key_cached(master_key_bytes, salt_bytes, key_version)
 
 
-def encrypt_password(password: str) -> bytes:
+def encrypt_password(password: str, key_version: Optional[int] = None) -> bytes:
     """
     AES-256-GCM으로 비밀번호 암호화
 
     Args:
         password: 평문 비밀번호
+        key_version: 키 버전 (None이면 현재 버전, current_key_version()을 사용자에 함께 저장)
 
     Returns:
         bytes: nonce (12 bytes) + ciphertext + auth_tag (16 bytes)
@@ -84,7 +115,7 @@ def encrypt_password(password: str) -> bytes:
     """
     try:
         # 암호화 키 가져오기
-        key = _get_encryption_key()
+        key = _get_encryption_key(key_version)
 
         # AES-GCM 암호화 객체 생성
         aesgcm = AESGCM(key)
@@ -108,12 +139,13 @@ def encrypt_password(password: str) -> bytes:
         raise EncryptionError(f"Failed to encrypt password: {str(e)}")
 
 
-def decrypt_password(encrypted: bytes) -> str:
+def decrypt_password(encrypted: bytes, key_version: Optional[int] = None) -> str:
     """
     암호화된 비밀번호 복호화
 
     Args:
         encrypted: nonce (12 bytes) + ciphertext + auth_tag (16 bytes)
+        key_version: 암호화 당시 키 버전 (User.encryption_key_version, None이면 현재 버전)
 
     Returns:
         str: 복호화된 평문 비밀번호
@@ -129,7 +161,7 @@ def decrypt_password(encrypted: bytes) -> str:
     """
     try:
         # 암호화 키 가져오기
-        key = _get_encryption_key()
+        key = _get_encryption_key(key_version)
 
         # AES-GCM 암호화 객체 생성
         aesgcm = AESGCM(key)
@@ -0,0 +1,49 @@
+"""
+공유 Redis 클라이언트
+
+REDIS_URL이 설정되어 있고 redis 패키지가 설치되어 있으면 redis.asyncio 클라이언트를,
+아니면 None을 반환합니다. 호출하는 쪽은 None일 때 프로세스 내 저장소로 폴백합니다.
+redis.asyncio 연결은 만든 이벤트 루프에 묶이므로, 루프가 바뀌면 (배치 Lambda의 실행마다 asyncio.run) 클라이언트를 다시 만듭니다.
+"""
+
+import asyncio
+from app.config import settings
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_redis = None
+_redis_loop = None
+_redis_module = None
+_redis_checked = False
+
+
+def get_redis():
+    """Redis 클라이언트 (REDIS_URL이 없거나 redis 패키지가 없으면 None)"""
+    global _redis, _redis_loop, _redis_module, _redis_checked
+    if not _redis_checked:
+        _redis_checked = True
+        if settings.REDIS_URL:
+            try:
+                import redis.asyncio as redis_asyncio
+                _redis_module = redis_asyncio
+            except ImportError:
+                logger.warning("redis package not installed. Using in-process stores.")
+    if _redis_module is None:
+        return None
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    # 이전 루프의 연결은 닫힌 루프에 묶여 재사용할 수 없으므로 버리고 새로 생성
+    if _redis is None or (loop is not None and _redis_loop is not loop):
+        _redis = _redis_module.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+            socket_timeout=1.0,
+            socket_connect_timeout=1.0,
+        )
+        _redis_loop = loop
+    return _redis
@@ -0,0 +1,179 @@
+"""
+공개 API 응답 캐시
+
+숙소 데이터는 크롤링 배치가 실행될 때만 바뀌므로, 공개 조회 API 응답을 캐시합니다.
+- REDIS_URL이 설정되어 있으면 Redis, 없거나 장애 시 프로세스 내 LRU 캐시 사용
+- 엔드포인트(namespace)별 TTL
+- 배치 작업이 커밋 후 invalidate_response_cache()로 명시적 무효화
+  무효화가 다른 프로세스에 전달되는 것은 Redis를 쓸 때뿐입니다. LRU는 호출한 프로세스 것만 비워지므로
+  LRU 항목의 TTL은 RESPONSE_CACHE_LOCAL_MAX_TTL로 제한해 배치 후 오래된 응답이 남는 시간을 줄입니다.
+- namespace별 hit/miss 카운터
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional
+from fastapi.encoders import jsonable_encoder
+from app.config import settings
+from app.utils.logger import get_logger
+from app.utils.redis_client import get_redis
+
+logger = get_logger(__name__)
+
+KEY_PREFIX = "resp:"
+
+# 엔드포인트별 TTL (초)
+CACHE_TTLS = {
+    "random": 30,
+    "popular": 60,
+    "sol_recommended": 600,
+    "regions": 3600,
+    "score_based": 600,
+    "search": 120,
+}
+
+
+class LRUCache:
+    """TTL을 지원하는 프로세스 내 LRU 캐시"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._items: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[str]:
+        item = self._items.get(key)
+        if item is None:
+            return None
+
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._items[key]
+            return None
+
+        self._items.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        self._items[key] = (time.monotonic() + ttl, value)
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_entries:
+            self._items.popitem(last=False)
+
+    def clear(self) -> int:
+        count = len(self._items)
+        self._items.clear()
+        return count
+
+
+class ResponseCache:
+    """Redis 우선, LRU 폴백 응답 캐시"""
+
+    def __init__(self):
+        self.local = LRUCache(settings.RESPONSE_CACHE_MAX_ENTRIES)
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    def _get_redis(self):
+        return get_redis()
+
+    def _count(self, namespace: str, field: str) -> None:
+        counters = self.stats.setdefault(namespace, {"hits": 0, "misses": 0})
+        counters[field] += 1
+
+    @staticmethod
+    def build_key(namespace: str, params: Dict[str, Any]) -> str:
+        raw = json.dumps(params, sort_keys=True, default=str, ensure_ascii=False)
+        return f"{KEY_PREFIX}{namespace}:{hashlib.sha1(raw.encode()).hexdigest()}"
+
+    async def _read(self, key: str) -> Optional[str]:
+        redis_client = self._get_redis()
+        if redis_client is not None:
+            try:
+                return await redis_client.get(key)
+            except Exception as e:
+                logger.warning(f"Redis get failed, falling back to local cache: {str(e)}")
+        return self.local.get(key)
+
+    async def _write(self, key: str, value: str, ttl: int) -> None:
+        redis_client = self._get_redis()
+        if redis_client is not None:
+            try:
+                await redis_client.set(key, value, ex=ttl)
+                return
+            except Exception as e:
+                logger.warning(f"Redis set failed, falling back to local cache: {str(e)}")
+        # 다른 프로세스의 무효화가 닿지 않으므로 짧은 TTL만 허용
+        self.local.set(key, value, min(ttl, settings.RESPONSE_CACHE_LOCAL_MAX_TTL))
+
+    async def get_or_set(
+        self,
+        namespace: str,
+        params: Dict[str, Any],
+        loader: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        캐시에 있으면 캐시된 응답을, 없으면 loader() 결과를 저장 후 반환합니다.
+        반환값은 JSON 호환 형태(jsonable_encoder 결과)입니다.
+        """
+        if not settings.RESPONSE_CACHE_ENABLED:
+            return await loader()
+
+        key = self.build_key(namespace, params)
+        cached = await self._read(key)
+        if cached is not None:
+            self._count(namespace, "hits")
+            return json.loads(cached)
+
+        self._count(namespace, "misses")
+        data = jsonable_encoder(await loader())
+        await self._write(key, json.dumps(data, ensure_ascii=False), CACHE_TTLS.get(namespace, 60))
+        return data
+
+    async def invalidate(self) -> int:
+        """
+        캐시된 모든 응답 삭제 후 삭제 건수 반환
+        Redis가 없으면 이 프로세스의 LRU만 비워지며, 다른 프로세스의 LRU는 TTL 만료로만 갱신됩니다.
+        """
+        deleted = self.local.clear()
+
+        redis_client = self._get_redis()
+        if redis_client is None:
+            logger.warning(
+                "Response cache invalidation is local-only without REDIS_URL; other processes serve cached "
+                f"responses for up to {settings.RESPONSE_CACHE_LOCAL_MAX_TTL}s"
+            )
+        else:
+            try:
+                keys = [key async for key in redis_client.scan_iter(match=f"{KEY_PREFIX}*", count=500)]
+                if keys:
+                    deleted += await redis_client.delete(*keys)
+            except Exception as e:
+                logger.warning(f"Redis invalidation failed: {str(e)}")
+
+        return deleted
+
+    def snapshot(self) -> Dict[str, Any]:
+        total_hits = sum(counters["hits"] for counters in self.stats.values())
+        total_misses = sum(counters["misses"] for counters in self.stats.values())
+        total = total_hits + total_misses
+        return {
+            "backend": "redis" if self._get_redis() is not None else "local",
+            "hits": total_hits,
+            "misses": total_misses,
+            "hit_rate": round(total_hits / total, 3) if total else 0.0,
+            "local_entries": len(self.local._items),
+            "endpoints": self.stats,
+        }
+
+
+response_cache = ResponseCache()
+
+
+async def invalidate_response_cache() -> None:
+    """배치 작업이 DB 커밋 후 호출 - 공개 API 응답 캐시 무효화"""
+    try:
+        deleted = await response_cache.invalidate()
+        logger.info(f"Response cache invalidated: {deleted} entries")
+    except Exception as e:
+        logger.warning(f"Response cache invalidation failed: {str(e)}")
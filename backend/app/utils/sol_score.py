@@ -11,12 +11,19 @@ SOL점수는 숙소의 온라인 최저가 대비 신청 점수의 효율성을
 - 온라인 최저가 또는 신청 점수가 없는 경우 계산 대상에서 제외
 """
 from typing import List, Dict, Optional
+import numpy as np
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func as sql_func
+from sqlalchemy import select, update, bindparam, and_, func as sql_func
 from app.models.accommodation_date import AccommodationDate
 from app.models.today_accommodation import TodayAccommodation
 from app.models.accommodation import Accommodation
 
+# 한 번에 읽어올 행 수 (키셋 페이지네이션)
+SOL_SCORE_FETCH_SIZE = 5000
+
+# 한 번의 배치 UPDATE로 기록할 행 수
+SOL_SCORE_UPDATE_BATCH_SIZE = 1000
+
 
 def get_score_weight(score: float) -> float:
     """
@@ -39,13 +46,60 @@ def get_score_weight(score: float) -> float:
         return 1.3  # 낮은 점수 → 높은 가중치
 
 
+def compute_sol_scores(scores: np.ndarray, online_prices: np.ndarray) -> np.ndarray:
+    """
+    신청 점수/온라인 최저가 배열로 SOL점수 배열을 한 번에 계산합니다.
+
+    Args:
+        scores: 신청 점수 배열 (없는 값은 NaN)
+        online_prices: 온라인 최저가 배열 (없는 값은 NaN)
+
+    Returns:
+        SOL점수 배열 (0~100, 소수점 둘째 자리). 계산 대상이 아닌 위치는 NaN
+    """
+    sol_scores = np.full(scores.shape, np.nan)
+
+    # online_price와 score가 모두 존재하고 score가 0보다 큰 경우만 계산
+    with np.errstate(invalid="ignore"):
+        valid = ~np.isnan(online_prices) & ~np.isnan(scores) & (scores > 0)
+    if not valid.any():
+        return sol_scores
+
+    valid_scores = scores[valid]
+
+    # 신청 점수에 가중치 적용 (get_score_weight와 동일한 구간)
+    weights = np.select([valid_scores >= 90, valid_scores >= 70], [0.7, 1.0], default=1.3)
+
+    # 효율성 = 온라인 최저가 / 가중치 적용된 신청 점수
+    efficiencies = online_prices[valid] / (valid_scores * weights)
+
+    # Min-Max 정규화 (모든 값이 같으면 50점)
+    min_efficiency = efficiencies.min()
+    max_efficiency = efficiencies.max()
+    if max_efficiency == min_efficiency:
+        sol_scores[valid] = 50.0
+    else:
+        sol_scores[valid] = np.round(
+            (efficiencies - min_efficiency) / (max_efficiency - min_efficiency) * 100, 2
+        )
+
+    return sol_scores
+
+
+def _to_float_array(values: List[Optional[float]]) -> np.ndarray:
+    return np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+
+
 async def calculate_and_update_sol_scores(
     db: AsyncSession,
     model_class: type[AccommodationDate | TodayAccommodation]
-) -> Dict[str, int]:
+) -> Dict:
     """
     지정된 모델의 모든 레코드에 대해 SOL점수를 계산하고 업데이트합니다.
 
+    ORM 객체를 불러오지 않고 (id, score, online_price, sol_score) 튜플만 청크 단위로 읽어
+    NumPy로 한 번에 계산한 뒤, SOL점수가 실제로 바뀐 행만 배치 UPDATE 합니다.
+
     Args:
         db: 데이터베이스 세션
         model_class: AccommodationDate 또는 TodayAccommodation 모델 클래스
@@ -55,76 +109,96 @@ async def calculate_and_update_sol_scores(
         {
             'total': 전체 레코드 수,
             'calculated': SOL점수가 계산된 레코드 수,
-            'skipped': 계산 대상에서 제외된 레코드 수
+            'skipped': 계산 대상에서 제외된 레코드 수,
+            'updated': SOL점수가 변경되어 저장된 레코드 수,
+            'changed_accommodation_ids': SOL점수가 바뀐 레코드의 숙소 ID 목록
         }
     """
-    # 1. 모든 레코드 조회
-    result = await db.execute(select(model_class))
-    all_records = result.scalars().all()
-
-    total_count = len(all_records)
-
-    # 2. 유효한 데이터 필터링 및 효율성 계산
-    valid_records = []
-    efficiencies = []
-
-    for record in all_records:
-        # online_price와 score가 모두 존재하고 score가 0보다 큰 경우만 계산
-        if (record.online_price is not None and
-            record.score is not None and
-            record.score > 0):
-            # 신청 점수에 가중치 적용
-            weight = get_score_weight(record.score)
-            weighted_score = record.score * weight
-
-            # 효율성 = 온라인 최저가 / 가중치 적용된 신청 점수
-            efficiency = record.online_price / weighted_score
-            valid_records.append(record)
-            efficiencies.append(efficiency)
-
-    calculated_count = len(valid_records)
-    skipped_count = total_count - calculated_count
-
-    # 3. 유효한 데이터가 없는 경우
-    if calculated_count == 0:
+    table = model_class.__table__
+
+    # 1. id 기준 키셋 페이지네이션으로 필요한 컬럼만 스트리밍
+    ids: List[str] = []
+    accommodation_ids: List[Optional[str]] = []
+    scores: List[Optional[float]] = []
+    online_prices: List[Optional[float]] = []
+    current_scores: List[Optional[float]] = []
+
+    last_id = None
+    while True:
+        query = select(
+            table.c.id, table.c.accommodation_id, table.c.score, table.c.online_price, table.c.sol_score
+        )
+        if last_id is not None:
+            query = query.where(table.c.id > last_id)
+        result = await db.execute(query.order_by(table.c.id).limit(SOL_SCORE_FETCH_SIZE))
+        rows = result.all()
+        if not rows:
+            break
+
+        for row_id, accommodation_id, score, online_price, sol_score in rows:
+            ids.append(row_id)
+            accommodation_ids.append(accommodation_id)
+            scores.append(score)
+            online_prices.append(online_price)
+            current_scores.append(sol_score)
+        last_id = rows[-1][0]
+
+    total_count = len(ids)
+    if total_count == 0:
         return {
-            'total': total_count,
+            'total': 0,
             'calculated': 0,
-            'skipped': skipped_count
+            'skipped': 0,
+            'updated': 0,
+            'changed_accommodation_ids': []
         }
 
-    # 4. Min-Max 정규화
-    min_efficiency = min(efficiencies)
-    max_efficiency = max(efficiencies)
+    # 2. 가중치/효율성/정규화 일괄 계산
+    new_scores = compute_sol_scores(_to_float_array(scores), _to_float_array(online_prices))
+    old_scores = _to_float_array(current_scores)
 
-    # 모든 효율성 값이 동일한 경우 (max == min)
-    if max_efficiency == min_efficiency:
-        # 모든 레코드에 50점 부여 (중간값)
-        for record in valid_records:
-            record.sol_score = 50.0
-    else:
-        # 정규화: (value - min) / (max - min) * 100
-        for i, record in enumerate(valid_records):
-            normalized_score = ((efficiencies[i] - min_efficiency) /
-                              (max_efficiency - min_efficiency)) * 100
-            record.sol_score = round(normalized_score, 2)
-
-    # 5. 유효하지 않은 레코드는 sol_score를 None으로 설정
-    for record in all_records:
-        if record not in valid_records:
-            record.sol_score = None
-
-    # 6. 변경사항 커밋
+    calculated_count = int((~np.isnan(new_scores)).sum())
+    skipped_count = total_count - calculated_count
+
+    # 3. 값이 바뀐 행만 선택 (NaN ↔ NaN은 동일로 취급)
+    unchanged = (new_scores == old_scores) | (np.isnan(new_scores) & np.isnan(old_scores))
+    changed_indexes = np.flatnonzero(~unchanged)
+
+    # 4. 배치 UPDATE
+    update_stmt = (
+        update(table)
+        .where(table.c.id == bindparam("b_id"))
+        .values(sol_score=bindparam("b_sol_score"))
+    )
+    for start in range(0, len(changed_indexes), SOL_SCORE_UPDATE_BATCH_SIZE):
+        batch = changed_indexes[start:start + SOL_SCORE_UPDATE_BATCH_SIZE]
+        await db.execute(
+            update_stmt,
+            [
+                {
+                    "b_id": ids[index],
+                    "b_sol_score": None if np.isnan(new_scores[index]) else float(new_scores[index]),
+                }
+                for index in batch
+            ]
+        )
+
+    # 5. 변경사항 커밋
     await db.commit()
 
     return {
         'total': total_count,
         'calculated': calculated_count,
-        'skipped': skipped_count
+        'skipped': skipped_count,
+        'updated': len(changed_indexes),
+        'changed_accommodation_ids': sorted({
+            accommodation_ids[index] for index in changed_indexes
+            if accommodation_ids[index] is not None
+        })
     }
 
 
-async def calculate_sol_scores_for_accommodation_dates(db: AsyncSession) -> Dict[str, int]:
+async def calculate_sol_scores_for_accommodation_dates(db: AsyncSession) -> Dict:
     """
     accommodation_dates 테이블의 모든 레코드에 대해 SOL점수를 계산하고 업데이트합니다.
 
@@ -137,7 +211,7 @@ async def calculate_sol_scores_for_accommodation_dates(db: AsyncSession) -> Dict
     return await calculate_and_update_sol_scores(db, AccommodationDate)
 
 
-async def calculate_sol_scores_for_today_accommodation(db: AsyncSession) -> Dict[str, int]:
+async def calculate_sol_scores_for_today_accommodation(db: AsyncSession) -> Dict:
     """
     today_accommodation_info 테이블의 모든 레코드에 대해 SOL점수를 계산하고 업데이트합니다.
 
@@ -184,67 +258,82 @@ async def get_top_sol_score_dates(
     return result.scalars().all()
 
 
-async def calculate_and_update_average_sol_scores(db: AsyncSession) -> Dict[str, int]:
+async def calculate_and_update_average_sol_scores(
+    db: AsyncSession,
+    accommodation_ids: Optional[List[str]] = None
+) -> Dict[str, int]:
     """
     각 숙소의 평균 SOL점수를 계산하고 accommodations 테이블에 업데이트합니다.
 
-    각 숙소에 대해 accommodation_dates의 모든 SOL점수를 평균하여 저장합니다.
-    SOL점수가 없는 날짜는 제외됩니다.
+    accommodation_dates를 숙소별로 한 번에 GROUP BY 집계한 뒤,
+    평균값이 바뀐 숙소만 배치 UPDATE 합니다. SOL점수가 없는 날짜는 제외됩니다.
+    숙소 수와 무관하게 쿼리 수는 일정합니다.
 
     Args:
         db: 데이터베이스 세션
+        accommodation_ids: 갱신할 숙소 ID 목록 (None이면 전체 숙소)
 
     Returns:
         업데이트 통계 딕셔너리
         {
-            'total': 전체 숙소 수,
+            'total': 대상 숙소 수,
             'updated': 평균 SOL점수가 계산된 숙소 수,
-            'skipped': 계산 대상에서 제외된 숙소 수
+            'skipped': 계산 대상에서 제외된 숙소 수,
+            'changed': 값이 바뀌어 저장된 숙소 수
         }
     """
-    # 1. 모든 숙소 조회
-    result = await db.execute(select(Accommodation))
-    all_accommodations = result.scalars().all()
-
-    total_count = len(all_accommodations)
-    updated_count = 0
-    skipped_count = 0
-
-    # 2. 각 숙소별로 평균 SOL점수 계산
-    for accommodation in all_accommodations:
-        # 해당 숙소의 모든 날짜별 SOL점수 조회
-        dates_result = await db.execute(
-            select(AccommodationDate)
-            .where(
-                and_(
-                    AccommodationDate.accommodation_id == accommodation.id,
-                    AccommodationDate.sol_score.isnot(None)
-                )
-            )
-        )
-        dates = dates_result.scalars().all()
-
-        # SOL점수가 있는 날짜가 없으면 스킵
-        if not dates:
-            accommodation.average_sol_score = None
-            skipped_count += 1
-            continue
-
-        # 평균 SOL점수 계산
-        sol_scores = [date.sol_score for date in dates]
-        average_sol_score = sum(sol_scores) / len(sol_scores)
+    if accommodation_ids is not None and not accommodation_ids:
+        return {'total': 0, 'updated': 0, 'skipped': 0, 'changed': 0}
+
+    accommodations_table = Accommodation.__table__
+    dates_table = AccommodationDate.__table__
+
+    # 1. 대상 숙소의 현재 평균 SOL점수
+    current_query = select(accommodations_table.c.id, accommodations_table.c.average_sol_score)
+    if accommodation_ids is not None:
+        current_query = current_query.where(accommodations_table.c.id.in_(set(accommodation_ids)))
+    current_result = await db.execute(current_query)
+    current_averages = dict(current_result.all())
+
+    # 2. 숙소별 평균 SOL점수 GROUP BY 집계
+    average_query = (
+        select(dates_table.c.accommodation_id, sql_func.avg(dates_table.c.sol_score))
+        .where(dates_table.c.sol_score.isnot(None))
+        .group_by(dates_table.c.accommodation_id)
+    )
+    if accommodation_ids is not None:
+        average_query = average_query.where(dates_table.c.accommodation_id.in_(set(accommodation_ids)))
+    average_result = await db.execute(average_query)
+    new_averages = {
+        accommodation_id: round(average, 2)
+        for accommodation_id, average in average_result.all()
+    }
 
-        # 소수점 둘째 자리까지 반올림
-        accommodation.average_sol_score = round(average_sol_score, 2)
-        updated_count += 1
+    # 3. 값이 바뀐 숙소만 배치 UPDATE (SOL점수가 있는 날짜가 없으면 None)
+    changed_params = [
+        {"b_id": accommodation_id, "b_average": new_averages.get(accommodation_id)}
+        for accommodation_id, current_average in current_averages.items()
+        if new_averages.get(accommodation_id) != current_average
+    ]
+    if changed_params:
+        await db.execute(
+            update(accommodations_table)
+            .where(accommodations_table.c.id == bindparam("b_id"))
+            .values(average_sol_score=bindparam("b_average")),
+            changed_params
+        )
 
-    # 3. 변경사항 커밋
+    # 4. 변경사항 커밋
     await db.commit()
 
+    total_count = len(current_averages)
+    updated_count = sum(1 for accommodation_id in current_averages if accommodation_id in new_averages)
+
     return {
         'total': total_count,
         'updated': updated_count,
-        'skipped': skipped_count
+        'skipped': total_count - updated_count,
+        'changed': len(changed_params)
     }
 
 
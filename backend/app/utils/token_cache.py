@@ -0,0 +1,153 @@
+"""
+액세스 토큰 검증 캐시
+
+인증이 필요한 모든 요청은 JWT 검증 + users 조회를 거칩니다.
+검증된 토큰 → 사용자 스냅샷(컬럼 값)을 짧은 TTL로 캐시합니다.
+- 크기 제한 LRU + TTL (토큰 만료 시각을 넘지 않음)
+- 기본(get_current_user): JWT 검증만 캐시 결과로 생략하고 사용자 행은 항상 다시 조회
+  → 라우트가 포인트 등을 수정해도 최신 값 기준으로 UPDATE
+- 읽기 전용(get_current_user_readonly): 스냅샷으로 만든 detached User를 반환해 DB 조회 생략
+  (세션에 붙지 않으므로 수정해도 저장되지 않음, 최대 TTL만큼 오래된 값일 수 있음)
+- User가 ORM으로 수정/삭제되면(포인트 변경, 로그아웃 등) 해당 사용자 항목 무효화
+- 프로세스 내 캐시이므로 다른 프로세스(배치 등)의 변경은 읽기 전용 경로에 TTL 안에 반영
+"""
+
+import copy
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set
+from sqlalchemy import event
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+from app.config import settings
+from app.models.user import User
+
+
+def _token_key(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class TokenCache:
+    """토큰 해시 → (사용자 ID, 컬럼 스냅샷, 만료 시각) LRU 캐시"""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._items: "OrderedDict[str, tuple[str, Dict[str, Any], float]]" = OrderedDict()
+        self._keys_by_user: Dict[str, Set[str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _discard(self, key: str) -> None:
+        item = self._items.pop(key, None)
+        if item is None:
+            return
+        user_keys = self._keys_by_user.get(item[0])
+        if user_keys is not None:
+            user_keys.discard(key)
+            if not user_keys:
+                del self._keys_by_user[item[0]]
+
+    def get_snapshot(self, token: str) -> Optional[Dict[str, Any]]:
+        if not settings.AUTH_TOKEN_CACHE_ENABLED:
+            return None
+
+        key = _token_key(token)
+        item = self._items.get(key)
+        if item is None or item[2] < time.monotonic():
+            if item is not None:
+                self._discard(key)
+            self.misses += 1
+            return None
+
+        self._items.move_to_end(key)
+        self.hits += 1
+        return item[1]
+
+    def set(self, token: str, user: User, token_expires_at: Optional[float] = None) -> None:
+        """
+        검증된 토큰의 사용자 스냅샷 저장
+
+        Args:
+            token: 액세스 토큰
+            user: 조회한 사용자
+            token_expires_at: 토큰 만료 시각 (epoch 초, JWT exp)
+        """
+        if not settings.AUTH_TOKEN_CACHE_ENABLED:
+            return
+
+        ttl = self.ttl_seconds
+        if token_expires_at is not None:
+            ttl = min(ttl, token_expires_at - time.time())
+        if ttl <= 0:
+            return
+
+        key = _token_key(token)
+        self._discard(key)
+        snapshot = {
+            attr.key: copy.deepcopy(getattr(user, attr.key))
+            for attr in User.__mapper__.column_attrs
+        }
+        self._items[key] = (user.id, snapshot, time.monotonic() + ttl)
+        self._keys_by_user.setdefault(user.id, set()).add(key)
+
+        while len(self._items) > self.max_entries:
+            self._discard(next(iter(self._items)))
+
+    def update_snapshot(self, token: str, user: User) -> None:
+        """다시 조회한 사용자 값으로 스냅샷 갱신 (만료 시각은 유지)"""
+        key = _token_key(token)
+        item = self._items.get(key)
+        if item is None or item[0] != user.id:
+            return
+        snapshot = {
+            attr.key: copy.deepcopy(getattr(user, attr.key))
+            for attr in User.__mapper__.column_attrs
+        }
+        self._items[key] = (item[0], snapshot, item[2])
+
+    def invalidate_user(self, user_id: str) -> None:
+        for key in list(self._keys_by_user.get(user_id, ())):
+            self._discard(key)
+
+    def invalidate_token(self, token: str) -> None:
+        self._discard(_token_key(token))
+
+    def clear(self) -> None:
+        self._items.clear()
+        self._keys_by_user.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._items),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        }
+
+
+def detached_user(snapshot: Dict[str, Any]) -> User:
+    """
+    스냅샷으로 세션에 붙지 않은(detached) User를 만듭니다. (읽기 전용)
+    수정해도 DB에 반영되지 않으므로 사용자 행을 수정하는 라우트에서는 쓰지 않습니다.
+    """
+    user = User.__mapper__.class_manager.new_instance()
+    for key, value in copy.deepcopy(snapshot).items():
+        set_committed_value(user, key, value)
+    make_transient_to_detached(user)
+    return user
+
+
+token_cache = TokenCache(
+    max_entries=settings.AUTH_TOKEN_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.AUTH_TOKEN_CACHE_TTL_SECONDS,
+)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_on_user_change(mapper, connection, target) -> None:
+    """포인트/토큰/활성 상태 등 사용자 변경 시 캐시된 스냅샷 무효화"""
+    token_cache.invalidate_user(target.id)
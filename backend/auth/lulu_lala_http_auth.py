@@ -0,0 +1,263 @@
+"""
+룰루랄라 HTTP 전용 로그인 (httpx)
+
+브라우저 없이 로그인 폼 전송과 shbrefresh SSO 리다이렉트를 재현해 세션 쿠키를 수집합니다.
+1. 로그인 페이지를 받아 폼 action/hidden 필드/아이디·비밀번호 필드명을 파싱
+2. 비밀번호를 encrypt_rsa로 암호화해 폼 전송 → access_token 쿠키 확인
+3. 메인 페이지의 'Refresh' 링크를 따라가며 자동 전송 폼/스크립트 리다이렉트를 처리해 shbrefresh 도착
+4. 쿠키 jar를 _save_session이 저장하는 형식([{name, value, domain}])으로 반환
+
+결과는 HttpLoginResult로 반환합니다.
+- SUCCESS: 세션 쿠키 수집 완료
+- REJECTED: 폼 전송은 됐지만 사이트가 로그인을 거부 (비밀번호 변경 등)
+  → 호출하는 쪽은 Playwright로 다시 로그인하지 않음 (실패 로그인이 두 번 쌓여 계정 잠금 위험)
+- UNAVAILABLE: RSA 공개키 없음(평문 비밀번호는 보내지 않음), 페이지 구조 불일치, 네트워크 오류 등
+  → 호출하는 쪽은 Playwright 로그인으로 폴백
+실사이트 검증 전까지 LULU_LALA_HTTP_LOGIN_ENABLED 기본값은 False입니다.
+"""
+
+from __future__ import annotations
+
+import html
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+import httpx
+
+from auth.lulu_lala_auth import LULU_LALA_LOGIN_URL, encrypt_rsa
+
+logger = logging.getLogger(__name__)
+
+HTTP_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8",
+}
+
+# SSO 단계에서 따라갈 최대 자동 전송 폼/스크립트 리다이렉트 수
+MAX_SSO_HOPS = 6
+
+FORM_PATTERN = re.compile(r"<form\b([^>]*)>(.*?)</form>", re.IGNORECASE | re.DOTALL)
+INPUT_PATTERN = re.compile(r"<input\b([^>]*)>", re.IGNORECASE)
+ATTR_PATTERN = re.compile(r"""([\w:-]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""")
+SCRIPT_LOGIN_URL_PATTERN = re.compile(
+    r"""(?:url\s*:\s*|\$\.post\(\s*|fetch\(\s*|action\s*=\s*)["']([^"']*login[^"']*)["']""",
+    re.IGNORECASE,
+)
+REFRESH_LINK_PATTERN = re.compile(
+    r"""<a\b([^>]*)>(?:(?!</a>).)*?(?:Refresh|refresh|연성소)(?:(?!</a>).)*?</a>""",
+    re.IGNORECASE | re.DOTALL,
+)
+SCRIPT_REDIRECT_PATTERN = re.compile(
+    r"""(?:location\.href|location\.replace\(|location\.assign\(|window\.location)\s*=?\s*["']([^"']+)["']""",
+    re.IGNORECASE,
+)
+AUTO_SUBMIT_PATTERN = re.compile(r"\.submit\(\)", re.IGNORECASE)
+
+
+class HttpLoginStatus(str, Enum):
+    """HTTP 로그인 결과 상태"""
+    SUCCESS = "success"
+    REJECTED = "rejected"          # 사이트가 자격 증명을 거부 → 브라우저로 재시도하지 않음
+    UNAVAILABLE = "unavailable"    # HTTP 경로를 쓸 수 없음 → 브라우저 로그인으로 폴백
+
+
+@dataclass
+class HttpLoginResult:
+    status: HttpLoginStatus
+    cookies: List[Dict[str, str]] = field(default_factory=list)
+
+
+def _attrs(tag_attrs: str) -> Dict[str, str]:
+    return {
+        match.group(1).lower(): html.unescape(next(value for value in match.groups()[1:] if value is not None))
+        for match in ATTR_PATTERN.finditer(tag_attrs)
+    }
+
+
+def _parse_forms(page_html: str) -> List[Tuple[Dict[str, str], List[Dict[str, str]]]]:
+    """[(form 속성, [input 속성, ...]), ...]"""
+    return [
+        (_attrs(form_attrs), [_attrs(input_attrs) for input_attrs in INPUT_PATTERN.findall(body)])
+        for form_attrs, body in FORM_PATTERN.findall(page_html)
+    ]
+
+
+def _parse_login_form(page_html: str, page_url: str) -> Optional[Tuple[str, Dict[str, str], str, str]]:
+    """
+    로그인 폼 파싱
+
+    Returns:
+        (전송 URL, hidden 필드, 아이디 필드명, 비밀번호 필드명) 또는 None
+    """
+    for form_attrs, inputs in _parse_forms(page_html):
+        password_input = next((item for item in inputs if item.get("type", "").lower() == "password"), None)
+        if password_input is None:
+            continue
+
+        username_input = next(
+            (item for item in inputs if item.get("id") == "username" or item.get("name") == "username"),
+            None,
+        ) or next(
+            (item for item in inputs if item.get("type", "text").lower() in ("text", "email")),
+            None,
+        )
+        if username_input is None:
+            continue
+
+        hidden = {
+            item["name"]: item.get("value", "")
+            for item in inputs
+            if item.get("type", "").lower() == "hidden" and item.get("name")
+        }
+
+        action = form_attrs.get("action", "").strip()
+        if not action or action.lower().startswith("javascript:"):
+            script_url = SCRIPT_LOGIN_URL_PATTERN.search(page_html)
+            if script_url is None:
+                return None
+            action = script_url.group(1)
+
+        return (
+            urljoin(page_url, action),
+            hidden,
+            username_input.get("name") or username_input.get("id") or "username",
+            password_input.get("name") or password_input.get("id") or "password",
+        )
+    return None
+
+
+def _find_refresh_link(page_html: str, page_url: str) -> Optional[str]:
+    match = REFRESH_LINK_PATTERN.search(page_html)
+    if match is None:
+        return None
+    href = _attrs(match.group(1)).get("href", "")
+    if not href or href.startswith("#") or href.lower().startswith("javascript:"):
+        return None
+    return urljoin(page_url, href)
+
+
+def _is_shbrefresh(url: str) -> bool:
+    lowered = url.lower()
+    return (
+        ("shbrefresh" in lowered or "interparkb2b" in lowered)
+        and "error" not in lowered
+        and "login" not in lowered
+    )
+
+
+def _cookie_list(client: httpx.AsyncClient) -> List[Dict[str, str]]:
+    return [
+        {"name": cookie.name, "value": cookie.value, "domain": cookie.domain}
+        for cookie in client.cookies.jar
+    ]
+
+
+async def _follow_sso(client: httpx.AsyncClient, response: httpx.Response) -> Optional[httpx.Response]:
+    """자동 전송 폼/스크립트 리다이렉트를 따라 shbrefresh 페이지까지 이동"""
+    for _ in range(MAX_SSO_HOPS):
+        if _is_shbrefresh(str(response.url)):
+            return response
+
+        forms = _parse_forms(response.text)
+        if forms and AUTO_SUBMIT_PATTERN.search(response.text):
+            form_attrs, inputs = forms[0]
+            data = {item["name"]: item.get("value", "") for item in inputs if item.get("name")}
+            action = urljoin(str(response.url), form_attrs.get("action", "") or str(response.url))
+            if form_attrs.get("method", "get").lower() == "post":
+                response = await client.post(action, data=data)
+            else:
+                response = await client.get(action, params=data)
+            continue
+
+        redirect = SCRIPT_REDIRECT_PATTERN.search(response.text)
+        if redirect is not None:
+            response = await client.get(urljoin(str(response.url), redirect.group(1)))
+            continue
+
+        return None
+
+    return response if _is_shbrefresh(str(response.url)) else None
+
+
+async def login_via_http(
+    username: str,
+    password: str,
+    rsa_public_key: Optional[str] = None,
+    timeout: float = 10.0,
+) -> HttpLoginResult:
+    """
+    HTTP 요청만으로 룰루랄라 로그인 후 shbrefresh 세션 쿠키 수집
+
+    Args:
+        username: 룰루랄라 사용자 ID
+        password: 평문 비밀번호
+        rsa_public_key: 로그인 폼 비밀번호 암호화용 RSA 공개키 (없으면 시도하지 않음)
+        timeout: 요청별 타임아웃 (초)
+
+    Returns:
+        HttpLoginResult (SUCCESS면 cookies에 [{"name", "value", "domain"}, ...])
+    """
+    unavailable = HttpLoginResult(HttpLoginStatus.UNAVAILABLE)
+    if not rsa_public_key:
+        # 페이지의 login() JS는 비밀번호를 암호화해 보내므로 평문 전송은 하지 않음
+        logger.warning("HTTP login: RSA public key not configured, falling back to browser")
+        return unavailable
+
+    started_at = time.perf_counter()
+    async with httpx.AsyncClient(headers=HTTP_HEADERS, timeout=timeout, follow_redirects=True) as client:
+        try:
+            login_page = await client.get(LULU_LALA_LOGIN_URL)
+            login_form = _parse_login_form(login_page.text, str(login_page.url))
+            if login_form is None:
+                logger.warning("HTTP login: login form not found, falling back to browser")
+                return unavailable
+
+            action_url, data, username_field, password_field = login_form
+            data[username_field] = username
+            data[password_field] = encrypt_rsa(password, rsa_public_key)
+
+            main_page = await client.post(action_url, data=data, headers={"Referer": str(login_page.url)})
+            if not any(cookie.name == "access_token" for cookie in client.cookies.jar):
+                # 404/405/5xx는 전송 경로가 예상과 다른 것 → 폴백, 그 외(200, 401, 403)는 로그인 거부
+                if main_page.status_code in (401, 403) or main_page.status_code < 400:
+                    logger.warning(f"HTTP login: credentials rejected (status {main_page.status_code})")
+                    return HttpLoginResult(HttpLoginStatus.REJECTED)
+                logger.warning(f"HTTP login: unexpected login response (status {main_page.status_code})")
+                return unavailable
+
+            # 로그인 응답이 메인 페이지가 아니면(JSON 응답 등) 메인 페이지를 다시 요청
+            refresh_url = _find_refresh_link(main_page.text, str(main_page.url))
+            if refresh_url is None:
+                main_page = await client.get(urljoin(LULU_LALA_LOGIN_URL, "/"))
+                refresh_url = _find_refresh_link(main_page.text, str(main_page.url))
+            if refresh_url is None:
+                logger.warning("HTTP login: 'Refresh' link not found")
+                return unavailable
+
+            shbrefresh_page = await _follow_sso(client, await client.get(refresh_url))
+            if shbrefresh_page is None:
+                logger.warning("HTTP login: shbrefresh SSO redirect chain not completed")
+                return unavailable
+
+            cookies = _cookie_list(client)
+            logger.info(
+                f"HTTP login succeeded in {(time.perf_counter() - started_at) * 1000:.0f}ms "
+                f"({len(cookies)} cookies)"
+            )
+            return HttpLoginResult(HttpLoginStatus.SUCCESS, cookies)
+
+        except httpx.HTTPError as e:
+            logger.warning(f"HTTP login request failed: {str(e)}")
+            return unavailable
+        except Exception as e:
+            # 암호화 실패, 예상 밖 응답 등 → 브라우저 로그인으로 폴백
+            logger.warning(f"HTTP login failed unexpectedly: {str(e)}")
+            return unavailable
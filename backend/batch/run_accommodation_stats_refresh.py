@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+숙소 통계(accommodation_stats) 전체 재계산 스크립트
+- 매일 1회(새벽) 스케줄 실행: 크롤링 배치는 변경된 숙소만 증분 갱신하므로, 변경이 없는 숙소의
+  최근 90일 요일별 평균/점수대 통계는 기간이 밀리지 않고 마지막 갱신 시점에 고정됨 → 전체 숙소를 다시 계산
+- 005 마이그레이션 직후 최초 백필 또는 통계가 어긋났을 때 수동 실행도 가능
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# 부모 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.database import AsyncSessionLocal
+from app.utils.accommodation_stats import refresh_accommodation_stats
+from app.utils.response_cache import invalidate_response_cache
+
+
+async def main():
+    async with AsyncSessionLocal() as db:
+        result = await refresh_accommodation_stats(db)
+    await invalidate_response_cache()
+    return result
+
+
+if __name__ == "__main__":
+    print("Starting accommodation stats refresh...")
+
+    result = asyncio.run(main())
+    print(f"Accommodation stats refresh completed: {result}")
+    sys.exit(0)
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+알림 로그 중복 방지 데이터 정리 배치 작업 실행 스크립트 (04:00 KST)
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# 부모 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.batch.notification_log_compaction import process_notification_log_compaction
+
+if __name__ == "__main__":
+    print("Starting notification log compaction batch job...")
+
+    result = asyncio.run(process_notification_log_compaction())
+    print(f"Notification log compaction completed: {result}")
+
+    if result.get("status") == "error":
+        sys.exit(1)
+    else:
+        sys.exit(0)
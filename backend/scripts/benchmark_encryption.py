@@ -0,0 +1,83 @@
+"""
+비밀번호 암호화/복호화 마이크로벤치마크
+
+PBKDF2(100,000회) 키 유도를 매번 수행하던 기존 방식과
+(마스터 키, 솔트, 버전)별 유도 키 캐시를 쓰는 현재 방식의 처리량을 비교합니다.
+ENCRYPTION_MASTER_KEY/ENCRYPTION_SALT가 없으면 임시 키를 사용합니다.
+
+사용법:
+    python scripts/benchmark_encryption.py --iterations 200
+"""
+
+import argparse
+import base64
+import os
+import secrets
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+os.environ.setdefault("ENCRYPTION_MASTER_KEY", base64.b64encode(secrets.token_bytes(32)).decode())
+os.environ.setdefault("ENCRYPTION_SALT", base64.b64encode(secrets.token_bytes(16)).decode())
+
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM  # noqa: E402
+
+from app.config import settings  # noqa: E402
+from app.utils.encryption import (  # noqa: E402
+    _derive_key,
+    _derive_key_cached,
+    decrypt_password,
+    encrypt_password,
+)
+
+PASSWORD = "benchmark_password_1234!@#$"
+
+
+def uncached_round_trip() -> None:
+    """기존 방식: 암호화/복호화마다 PBKDF2 키 유도"""
+    master_key = settings.ENCRYPTION_MASTER_KEY.encode("utf-8")
+    salt = settings.ENCRYPTION_SALT.encode("utf-8")
+
+    nonce = secrets.token_bytes(12)
+    encrypted = nonce + AESGCM(_derive_key(master_key, salt)).encrypt(nonce, PASSWORD.encode("utf-8"), None)
+    AESGCM(_derive_key(master_key, salt)).decrypt(encrypted[:12], encrypted[12:], None)
+
+
+def cached_round_trip() -> None:
+    """현재 방식: 캐시된 유도 키 사용"""
+    decrypt_password(encrypt_password(PASSWORD))
+
+
+def measure(label: str, func, iterations: int) -> float:
+    started_at = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed = time.perf_counter() - started_at
+    ops_per_second = iterations * 2 / elapsed
+    print(
+        f"{label:>8} | {iterations:>6} round trips | {elapsed:7.3f}s"
+        f" | {elapsed / iterations * 1000:8.3f}ms/round trip | {ops_per_second:10.1f} ops/s"
+    )
+    return ops_per_second
+
+
+def main():
+    parser = argparse.ArgumentParser(description="비밀번호 암호화/복호화 벤치마크")
+    parser.add_argument("--iterations", type=int, default=200, help="암호화+복호화 반복 횟수")
+    args = parser.parse_args()
+
+    before = measure("before", uncached_round_trip, args.iterations)
+
+    _derive_key_cached.cache_clear()
+    started_at = time.perf_counter()
+    cached_round_trip()
+    print(f"    cold | first round trip (cache miss) {(time.perf_counter() - started_at) * 1000:.1f}ms")
+
+    after = measure("after", cached_round_trip, args.iterations)
+    print(f"speedup  | {after / before:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+SOL점수 재계산 벤치마크
+
+임시 SQLite 파일에 accommodation_dates 행을 N개 채운 뒤 다음을 측정합니다.
+- compute: NumPy 일괄 계산만 (DB 제외)
+- loop: 같은 계산을 파이썬 루프로 수행 (참고용)
+- full: calculate_sol_scores_for_accommodation_dates 첫 실행 (모든 행 UPDATE)
+- incremental: 데이터 변경 없이 다시 실행 (UPDATE 0건)
+- partial: 1% 행의 가격을 바꾼 뒤 다시 실행
+
+사용법:
+    python scripts/benchmark_sol_score.py --sizes 10000 100000 1000000
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import insert, update  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.database import Base  # noqa: E402
+from app.models import Accommodation, AccommodationDate  # noqa: E402
+from app.utils.sol_score import (  # noqa: E402
+    calculate_sol_scores_for_accommodation_dates,
+    compute_sol_scores,
+    get_score_weight,
+)
+
+INSERT_BATCH_SIZE = 10_000
+
+
+def python_loop_sol_scores(scores, prices):
+    efficiencies = []
+    for score, price in zip(scores, prices):
+        if price is not None and score is not None and score > 0:
+            efficiencies.append(price / (score * get_score_weight(score)))
+        else:
+            efficiencies.append(None)
+
+    valid = [value for value in efficiencies if value is not None]
+    low, high = min(valid), max(valid)
+    return [
+        None if value is None else round((value - low) / (high - low) * 100, 2)
+        for value in efficiencies
+    ]
+
+
+async def seed(session_factory, size: int, rng: np.random.Generator):
+    scores = rng.uniform(30, 100, size)
+    prices = rng.uniform(50_000, 400_000, size)
+    # 10%는 가격 없음
+    prices[rng.random(size) < 0.1] = np.nan
+
+    async with session_factory() as session:
+        await session.execute(
+            insert(Accommodation.__table__),
+            [{"id": "1", "name": "벤치마크", "images": []}]
+        )
+        for start in range(0, size, INSERT_BATCH_SIZE):
+            await session.execute(
+                insert(AccommodationDate.__table__),
+                [
+                    {
+                        "id": f"1_{idx:08d}",
+                        "accommodation_id": "1",
+                        "date": "2026-01-01",
+                        "score": float(scores[idx]),
+                        "online_price": None if np.isnan(prices[idx]) else float(prices[idx]),
+                    }
+                    for idx in range(start, min(start + INSERT_BATCH_SIZE, size))
+                ]
+            )
+        await session.commit()
+
+    return scores, prices
+
+
+async def timed_recompute(session_factory):
+    started_at = time.perf_counter()
+    async with session_factory() as session:
+        stats = await calculate_sol_scores_for_accommodation_dates(session)
+    return time.perf_counter() - started_at, stats
+
+
+async def run(size: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(tmp_dir, 'bench.db')}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+        rng = np.random.default_rng(42)
+        scores, prices = await seed(session_factory, size, rng)
+
+        started_at = time.perf_counter()
+        compute_sol_scores(scores, prices)
+        compute_seconds = time.perf_counter() - started_at
+
+        score_list = scores.tolist()
+        price_list = [None if np.isnan(price) else price for price in prices.tolist()]
+        started_at = time.perf_counter()
+        python_loop_sol_scores(score_list, price_list)
+        loop_seconds = time.perf_counter() - started_at
+
+        full_seconds, full_stats = await timed_recompute(session_factory)
+        incremental_seconds, incremental_stats = await timed_recompute(session_factory)
+
+        # 1% 행의 가격을 5% 인상
+        changed_ids = [f"1_{idx:08d}" for idx in rng.choice(size, size // 100, replace=False)]
+        async with session_factory() as session:
+            await session.execute(
+                update(AccommodationDate.__table__)
+                .where(AccommodationDate.__table__.c.id.in_(changed_ids))
+                .values(online_price=AccommodationDate.__table__.c.online_price * 1.05)
+            )
+            await session.commit()
+        partial_seconds, partial_stats = await timed_recompute(session_factory)
+
+        await engine.dispose()
+
+    print(
+        f"{size:>9,} rows | compute {compute_seconds * 1000:8.1f}ms"
+        f" | loop {loop_seconds * 1000:8.1f}ms"
+        f" | full {full_seconds:6.2f}s ({full_stats['updated']:,} updated)"
+        f" | incremental {incremental_seconds:6.2f}s ({incremental_stats['updated']:,} updated)"
+        f" | partial {partial_seconds:6.2f}s ({partial_stats['updated']:,} updated)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SOL점수 재계산 벤치마크")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10_000, 100_000, 1_000_000],
+        help="측정할 행 수 목록",
+    )
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        asyncio.run(run(size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""
+FAQ 벡터 스토어 벤치마크 (ChromaDB vs NumPy/faq_vectors)
+
+임시 디렉터리에 ChromaDB 컬렉션과 SQLite faq_vectors 테이블을 만들고, 같은 합성 임베딩(N개, 1536차원)으로
+다음을 측정합니다. 임베딩은 미리 만든 난수 벡터를 쓰므로 OpenAI API는 호출하지 않습니다.
+- build: 문서 N개 추가 시간
+- load: 새 프로세스 시작을 가정한 적재 시간 (Chroma: 클라이언트 재생성 + 첫 검색, NumPy: faq_vectors → 행렬)
+- memory: 적재 전후 RSS 증가량, NumPy는 행렬 크기, Chroma는 디스크 사용량
+- query: top-5 검색 p50/p99 (전체 / 카테고리 필터), Chroma 대비 NumPy(정확 검색) top-1 일치율
+
+사용법:
+    python scripts/benchmark_vector_store.py --sizes 200 1000 5000 --queries 500
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("OPENAI_API_KEY", "benchmark-without-api-calls")
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.config import settings  # noqa: E402
+from app.database import Base  # noqa: E402
+from app.integrations import numpy_vector_store  # noqa: E402
+from app.integrations.numpy_vector_store import NumpyVectorStore  # noqa: E402
+from app.integrations.vector_store import VectorStore  # noqa: E402
+from app.models import FAQ  # noqa: E402
+
+DIMENSION = 1536
+CATEGORIES = ["신청/배정 문의", "취소/환불", "이용 안내", "포인트", "기타"]
+TOP_K = 5
+
+
+def current_rss_bytes() -> Optional[int]:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+def directory_bytes(path: str) -> int:
+    return sum(file.stat().st_size for file in Path(path).rglob("*") if file.is_file())
+
+
+def percentile(samples: List[float], ratio: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+
+def make_corpus(size: int, rng: np.random.Generator) -> Dict:
+    embeddings = rng.standard_normal((size, DIMENSION)).astype(np.float32)
+    documents = [f"질문: 벤치마크 질문 {i}\n답변: 벤치마크 답변 {i}" for i in range(size)]
+    metadatas = [
+        {"faq_id": str(i), "question": f"벤치마크 질문 {i}", "category": CATEGORIES[i % len(CATEGORIES)], "order": i}
+        for i in range(size)
+    ]
+    return {
+        "ids": [f"faq_{i}" for i in range(size)],
+        "documents": documents,
+        "metadatas": metadatas,
+        "vectors": dict(zip(documents, embeddings.tolist())),
+        "embeddings": embeddings,
+    }
+
+
+def use_fixed_embeddings(store, vectors: Dict[str, List[float]]) -> None:
+    # 임베딩 API 대신 미리 만든 벡터 사용
+    store.embed_texts = lambda texts: [vectors[text] for text in texts]
+
+
+def time_queries(query: Callable, query_vectors: np.ndarray, where: Optional[Dict]) -> Dict:
+    latencies = []
+    top1 = []
+    for vector in query_vectors:
+        started_at = time.perf_counter()
+        result = query(query_text="", n_results=TOP_K, where=where, query_embedding=vector.tolist())
+        latencies.append(time.perf_counter() - started_at)
+        top1.append(result["ids"][0][0] if result["ids"][0] else None)
+    return {"p50_ms": percentile(latencies, 0.5) * 1000, "p99_ms": percentile(latencies, 0.99) * 1000, "top1": top1}
+
+
+def bench_chroma(tmp_dir: str, corpus: Dict, query_vectors: np.ndarray) -> Dict:
+    persist_directory = os.path.join(tmp_dir, "chroma")
+    store = VectorStore(collection_name="benchmark", persist_directory=persist_directory)
+    use_fixed_embeddings(store, corpus["vectors"])
+
+    started_at = time.perf_counter()
+    store.add_documents(corpus["documents"], corpus["metadatas"], corpus["ids"])
+    build_seconds = time.perf_counter() - started_at
+    del store
+
+    rss_before = current_rss_bytes()
+    started_at = time.perf_counter()
+    store = VectorStore(collection_name="benchmark", persist_directory=persist_directory)
+    store.query(query_text="", n_results=TOP_K, query_embedding=query_vectors[0].tolist())
+    load_seconds = time.perf_counter() - started_at
+    rss_after = current_rss_bytes()
+
+    return {
+        "build_s": build_seconds,
+        "load_ms": load_seconds * 1000,
+        "rss_mb": (rss_after - rss_before) / 1e6 if rss_before is not None else None,
+        "size_mb": directory_bytes(persist_directory) / 1e6,
+        "all": time_queries(store.query, query_vectors, None),
+        "category": time_queries(store.query, query_vectors, {"category": CATEGORIES[0]}),
+    }
+
+
+async def bench_numpy(tmp_dir: str, corpus: Dict, query_vectors: np.ndarray) -> Dict:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(tmp_dir, 'bench.db')}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    numpy_vector_store.AsyncSessionLocal = session_factory
+
+    async with session_factory() as session:
+        session.add_all([
+            FAQ(id=metadata["faq_id"], question=metadata["question"], answer="-", category=metadata["category"])
+            for metadata in corpus["metadatas"]
+        ])
+        await session.commit()
+
+    store = NumpyVectorStore(collection_name="benchmark")
+    use_fixed_embeddings(store, corpus["vectors"])
+    started_at = time.perf_counter()
+    await store.add_documents(corpus["documents"], corpus["metadatas"], corpus["ids"])
+    build_seconds = time.perf_counter() - started_at
+    del store
+
+    rss_before = current_rss_bytes()
+    store = NumpyVectorStore(collection_name="benchmark")
+    started_at = time.perf_counter()
+    await store.load()
+    load_seconds = time.perf_counter() - started_at
+    rss_after = current_rss_bytes()
+    await engine.dispose()
+
+    return {
+        "build_s": build_seconds,
+        "load_ms": load_seconds * 1000,
+        "rss_mb": (rss_after - rss_before) / 1e6 if rss_before is not None else None,
+        "size_mb": store.get_index_stats()["matrix_bytes"] / 1e6,
+        "all": time_queries(store.query, query_vectors, None),
+        "category": time_queries(store.query, query_vectors, {"category": CATEGORIES[0]}),
+    }
+
+
+def print_result(label: str, size: int, result: Dict, agreement: Optional[float] = None) -> None:
+    rss = f"{result['rss_mb']:6.1f}MB" if result["rss_mb"] is not None else "     -"
+    line = (
+        f"{label:>6} {size:>6,} docs | build {result['build_s']:6.2f}s | load {result['load_ms']:7.1f}ms"
+        f" | rss +{rss} | {'disk' if label == 'chroma' else 'matrix'} {result['size_mb']:6.1f}MB"
+        f" | query p50/p99 {result['all']['p50_ms']:6.2f}/{result['all']['p99_ms']:6.2f}ms"
+        f" | category p50/p99 {result['category']['p50_ms']:6.2f}/{result['category']['p99_ms']:6.2f}ms"
+    )
+    if agreement is not None:
+        line += f" | top-1 = chroma {agreement * 100:5.1f}%"
+    print(line)
+
+
+def run(size: int, queries: int) -> None:
+    rng = np.random.default_rng(42)
+    corpus = make_corpus(size, rng)
+    # 문서 벡터에 잡음을 더한 질의 (실제 질문-FAQ 관계를 흉내)
+    picks = rng.integers(0, size, queries)
+    query_vectors = corpus["embeddings"][picks] + 0.5 * rng.standard_normal((queries, DIMENSION)).astype(np.float32)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        chroma = bench_chroma(tmp_dir, corpus, query_vectors)
+        numpy_result = asyncio.run(bench_numpy(tmp_dir, corpus, query_vectors))
+
+    agreement = float(np.mean([a == b for a, b in zip(chroma["all"]["top1"], numpy_result["all"]["top1"])]))
+    print_result("chroma", size, chroma)
+    print_result("numpy", size, numpy_result, agreement)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FAQ 벡터 스토어 벤치마크 (ChromaDB vs NumPy)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[200, 1000, 5000], help="문서 수 목록")
+    parser.add_argument("--queries", type=int, default=500, help="측정할 검색 횟수")
+    args = parser.parse_args()
+
+    # 합성 벡터를 디스크 임베딩 캐시에 남기지 않음
+    settings.EMBEDDING_CACHE_ENABLED = False
+    for size in args.sizes:
+        run(size, args.queries)
+
+
+if __name__ == "__main__":
+    main()
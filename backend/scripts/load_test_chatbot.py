@@ -0,0 +1,181 @@
+"""
+챗봇 동시 부하 테스트 (첫 토큰 지연 + 이벤트 루프 지연)
+
+실행 중인 서버에 /api/chatbot/chat 또는 /api/chatbot/chat/stream 요청을 동시에 보내고,
+같은 시간 동안 /health를 주기적으로 호출해 응답 지연으로 이벤트 루프 블로킹 정도를 측정합니다.
+- stream: 첫 token 이벤트까지의 시간(TTFT)과 전체 응답 시간
+- chat: 전체 응답 시간 (TTFT = 전체 응답 시간)
+- /health 지연: 부하 전(기준) 대비 부하 중 p50/p99/max
+
+OPENAI_API_KEY가 설정된 서버가 필요하며, 실제 OpenAI 호출 비용이 발생합니다.
+
+사용법:
+    python scripts/load_test_chatbot.py --requests 40 --concurrency 10
+    python scripts/load_test_chatbot.py --endpoints chat stream --base-url http://localhost:8000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Dict, List, Optional
+
+import httpx
+
+CHAT_PATH = "/api/chatbot/chat"
+STREAM_PATH = "/api/chatbot/chat/stream"
+HEALTH_PATH = "/health"
+
+DEFAULT_QUERIES = [
+    "예약 취소는 어떻게 하나요?",
+    "SOL 점수는 어떻게 계산되나요?",
+    "당첨 발표는 언제 하나요?",
+    "숙소 이용 후 후기는 어디에 남기나요?",
+]
+
+
+def percentile(samples: List[float], ratio: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+
+async def probe_health(client: httpx.AsyncClient, stop: asyncio.Event, interval: float) -> List[float]:
+    """stop이 설정될 때까지 /health 응답 지연(초)을 수집"""
+    latencies: List[float] = []
+    while not stop.is_set():
+        started_at = time.perf_counter()
+        try:
+            await client.get(HEALTH_PATH)
+            latencies.append(time.perf_counter() - started_at)
+        except httpx.HTTPError:
+            pass
+        await asyncio.sleep(interval)
+    return latencies
+
+
+async def stream_once(client: httpx.AsyncClient, query: str) -> Optional[Dict[str, float]]:
+    started_at = time.perf_counter()
+    first_token: Optional[float] = None
+    event = None
+    async with client.stream("POST", STREAM_PATH, json={"query": query}) as response:
+        if response.status_code != 200:
+            return None
+        async for line in response.aiter_lines():
+            if line.startswith("event: "):
+                event = line[len("event: "):]
+            elif line.startswith("data: ") and event == "token" and first_token is None:
+                first_token = time.perf_counter() - started_at
+            elif line.startswith("data: ") and event == "done" and not json.loads(line[len("data: "):]).get("success"):
+                return None
+    total = time.perf_counter() - started_at
+    return {"ttft": first_token if first_token is not None else total, "total": total}
+
+
+async def chat_once(client: httpx.AsyncClient, query: str) -> Optional[Dict[str, float]]:
+    started_at = time.perf_counter()
+    response = await client.post(CHAT_PATH, json={"query": query})
+    total = time.perf_counter() - started_at
+    if response.status_code != 200 or not response.json().get("success"):
+        return None
+    return {"ttft": total, "total": total}
+
+
+async def run_load(base_url: str, endpoint: str, total_requests: int, concurrency: int,
+                   queries: List[str], probe_interval: float) -> Dict:
+    request_once = stream_once if endpoint == "stream" else chat_once
+    samples: List[Dict[str, float]] = []
+    errors = 0
+    queue: asyncio.Queue = asyncio.Queue()
+    for index in range(total_requests):
+        queue.put_nowait(queries[index % len(queries)])
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=120.0) as client, \
+            httpx.AsyncClient(base_url=base_url, timeout=30.0) as probe_client:
+        # 워밍업 요청 (챗봇 초기화, 측정 제외)
+        await chat_once(client, queries[0])
+
+        # 부하 전 기준 /health 지연
+        idle_stop = asyncio.Event()
+        idle_probe = asyncio.create_task(probe_health(probe_client, idle_stop, probe_interval))
+        await asyncio.sleep(2.0)
+        idle_stop.set()
+        idle_latencies = await idle_probe
+
+        async def worker():
+            nonlocal errors
+            while True:
+                try:
+                    query = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    sample = await request_once(client, query)
+                except httpx.HTTPError:
+                    sample = None
+                if sample is None:
+                    errors += 1
+                else:
+                    samples.append(sample)
+
+        load_stop = asyncio.Event()
+        load_probe = asyncio.create_task(probe_health(probe_client, load_stop, probe_interval))
+        started_at = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started_at
+        load_stop.set()
+        load_latencies = await load_probe
+
+    ttfts = [sample["ttft"] for sample in samples]
+    totals = [sample["total"] for sample in samples]
+    return {
+        "requests": total_requests,
+        "errors": errors,
+        "rps": total_requests / elapsed if elapsed else 0.0,
+        "ttft_p50_ms": percentile(ttfts, 0.5) * 1000,
+        "ttft_p99_ms": percentile(ttfts, 0.99) * 1000,
+        "total_p50_ms": percentile(totals, 0.5) * 1000,
+        "total_p99_ms": percentile(totals, 0.99) * 1000,
+        "health_idle_p50_ms": percentile(idle_latencies, 0.5) * 1000,
+        "health_load_p50_ms": percentile(load_latencies, 0.5) * 1000,
+        "health_load_p99_ms": percentile(load_latencies, 0.99) * 1000,
+        "health_load_max_ms": max(load_latencies, default=0.0) * 1000,
+    }
+
+
+def print_result(label: str, result: Dict) -> None:
+    print(
+        f"{label:>6} | TTFT p50/p99 {result['ttft_p50_ms']:7.0f}/{result['ttft_p99_ms']:7.0f}ms"
+        f" | total p50/p99 {result['total_p50_ms']:7.0f}/{result['total_p99_ms']:7.0f}ms"
+        f" | {result['rps']:5.2f} req/s | errors {result['errors']}"
+    )
+    print(
+        f"{'':>6} | /health idle p50 {result['health_idle_p50_ms']:6.1f}ms"
+        f" | under load p50 {result['health_load_p50_ms']:6.1f}ms"
+        f" p99 {result['health_load_p99_ms']:6.1f}ms max {result['health_load_max_ms']:6.1f}ms"
+    )
+
+
+async def main_async(args) -> None:
+    queries = args.queries or DEFAULT_QUERIES
+    for endpoint in args.endpoints:
+        result = await run_load(
+            args.base_url, endpoint, args.requests, args.concurrency, queries, args.probe_interval
+        )
+        print_result(endpoint, result)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="챗봇 동시 부하 테스트 (TTFT + 이벤트 루프 지연)")
+    parser.add_argument("--base-url", default="http://localhost:8000", help="측정할 서버 주소")
+    parser.add_argument("--requests", type=int, default=40, help="총 요청 수")
+    parser.add_argument("--concurrency", type=int, default=10, help="동시 요청 수")
+    parser.add_argument("--endpoints", nargs="+", default=["chat", "stream"], choices=["chat", "stream"])
+    parser.add_argument("--probe-interval", type=float, default=0.05, help="/health 호출 간격 (초)")
+    parser.add_argument("--queries", nargs="+", default=None, help="질문 목록 (기본: 예시 질문)")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
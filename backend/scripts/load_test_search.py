@@ -0,0 +1,151 @@
+"""
+/api/accommodations/search 부하 테스트 (NullPool vs 커넥션 풀)
+
+DB_POOL_MODE를 바꿔 가며 uvicorn 서버를 띄우고, 같은 부하를 걸어 p50/p99 지연 시간을 비교합니다.
+DATABASE_URL 등 나머지 설정은 현재 환경 변수(.env)를 그대로 사용합니다.
+
+사용법:
+    python scripts/load_test_search.py --requests 500 --concurrency 20
+    python scripts/load_test_search.py --modes queue --pool-size 10
+    python scripts/load_test_search.py --base-url http://localhost:8000   # 실행 중인 서버 1회 측정
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+SEARCH_PATH = "/api/accommodations/search"
+
+
+def percentile(samples: List[float], ratio: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+
+async def run_load(base_url: str, total_requests: int, concurrency: int, params: Dict[str, str]) -> Dict:
+    latencies: List[float] = []
+    errors = 0
+    queue: asyncio.Queue = asyncio.Queue()
+    for _ in range(total_requests):
+        queue.put_nowait(None)
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=60.0) as client:
+        # 워밍업 요청 (측정 제외)
+        await client.get(SEARCH_PATH, params=params)
+
+        async def worker():
+            nonlocal errors
+            while True:
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                started_at = time.perf_counter()
+                try:
+                    response = await client.get(SEARCH_PATH, params=params)
+                    if response.status_code != 200:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append(time.perf_counter() - started_at)
+
+        started_at = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started_at
+
+        pool_response = await client.get("/health/db")
+        pool_snapshot = pool_response.json() if pool_response.status_code == 200 else {}
+
+    return {
+        "requests": total_requests,
+        "errors": errors,
+        "rps": total_requests / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 0.5) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "pool": pool_snapshot,
+    }
+
+
+def start_server(mode: str, port: int, pool_size: int, max_overflow: int) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "DB_POOL_MODE": mode,
+        "DB_POOL_SIZE": str(pool_size),
+        "DB_MAX_OVERFLOW": str(max_overflow),
+    }
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR,
+        env=env,
+    )
+
+
+async def wait_until_ready(base_url: str, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get("/health")).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.5)
+    raise RuntimeError(f"Server at {base_url} did not become ready")
+
+
+def print_result(label: str, result: Dict) -> None:
+    pool = result["pool"]
+    print(
+        f"{label:>6} | p50 {result['p50_ms']:8.1f}ms | p99 {result['p99_ms']:8.1f}ms"
+        f" | {result['rps']:7.1f} req/s | errors {result['errors']}"
+        f" | connects {pool.get('connects', '-')}"
+        f" | wait p50/p99 {pool.get('wait_ms_p50', '-')}/{pool.get('wait_ms_p99', '-')}ms"
+    )
+
+
+async def main_async(args) -> None:
+    params = {"limit": str(args.limit)}
+    if args.keyword:
+        params["keyword"] = args.keyword
+
+    if args.base_url:
+        print_result("server", await run_load(args.base_url, args.requests, args.concurrency, params))
+        return
+
+    for mode in args.modes:
+        process: Optional[subprocess.Popen] = start_server(mode, args.port, args.pool_size, args.max_overflow)
+        base_url = f"http://127.0.0.1:{args.port}"
+        try:
+            await wait_until_ready(base_url)
+            print_result(mode, await run_load(base_url, args.requests, args.concurrency, params))
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="/api/accommodations/search 부하 테스트")
+    parser.add_argument("--requests", type=int, default=500, help="총 요청 수")
+    parser.add_argument("--concurrency", type=int, default=20, help="동시 요청 수")
+    parser.add_argument("--limit", type=int, default=20, help="search limit 파라미터")
+    parser.add_argument("--keyword", default=None, help="search keyword 파라미터")
+    parser.add_argument("--modes", nargs="+", default=["null", "queue"], help="비교할 DB_POOL_MODE 목록")
+    parser.add_argument("--pool-size", type=int, default=5)
+    parser.add_argument("--max-overflow", type=int, default=10)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--base-url", default=None, help="이미 실행 중인 서버를 측정할 때 사용")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+import httpx
+from Crypto.PublicKey import RSA
+
+from auth import lulu_lala_http_auth as http_auth
+from auth.lulu_lala_auth import LULU_LALA_LOGIN_URL
+from auth.lulu_lala_http_auth import (
+    HttpLoginStatus,
+    _find_refresh_link,
+    _follow_sso,
+    _parse_login_form,
+    login_via_http,
+)
+
+MAIN_URL = "https://lulu-lala.zzzmobile.co.kr/"
+SSO_URL = "https://sso.example.com/relay"
+SHBREFRESH_URL = "https://shbrefresh.interparkb2b.co.kr/main"
+
+# 로그인 페이지 fixture: 검색 폼 + 로그인 폼 (hidden 필드, username/password)
+LOGIN_PAGE = """
+<html><body>
+<form action="/search" method="get"><input type="text" name="q"></form>
+<form id="loginForm" action="/member/loginProc.do" method="post">
+  <input type="hidden" name="csrf" value="tok&amp;1">
+  <input type="hidden" name="returnUrl" value='/main'>
+  <input type="text" id="username" name="userId">
+  <input type="password" id="password" name="userPw">
+</form>
+</body></html>
+"""
+
+# 폼 action 없이 login() JS가 전송하는 경우
+SCRIPT_LOGIN_PAGE = """
+<html><body>
+<form onsubmit="return false;">
+  <input type="text" id="username">
+  <input type="password" id="password">
+</form>
+<script>function login(u, p) { $.post("/api/login.json", {username: u, password: p}); }</script>
+</body></html>
+"""
+
+MAIN_PAGE = """
+<html><body>
+<a href="javascript:void(0)">메뉴</a>
+<a class="banner" href="/sso/refresh.do?target=shb"><span>Refresh</span> 연성소 예약</a>
+</body></html>
+"""
+
+# SSO 단계 fixture: 자동 전송 폼 → 스크립트 리다이렉트 → shbrefresh
+SSO_AUTO_SUBMIT_PAGE = f"""
+<html><body onload="document.forms[0].submit()">
+<form action="{SSO_URL}" method="post"><input type="hidden" name="ticket" value="T-1"></form>
+<script>document.forms[0].submit();</script>
+</body></html>
+"""
+SSO_SCRIPT_REDIRECT_PAGE = f"""<script>location.replace("{SHBREFRESH_URL}");</script>"""
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+class LoginPageParsingCheck(unittest.TestCase):
+    def test_parse_login_form_with_action(self):
+        action, hidden, username_field, password_field = _parse_login_form(LOGIN_PAGE, LULU_LALA_LOGIN_URL)
+        self.assertEqual(action, "https://lulu-lala.zzzmobile.co.kr/member/loginProc.do")
+        self.assertEqual(hidden, {"csrf": "tok&1", "returnUrl": "/main"})
+        self.assertEqual((username_field, password_field), ("userId", "userPw"))
+
+    def test_parse_login_form_with_script_action(self):
+        action, hidden, username_field, password_field = _parse_login_form(SCRIPT_LOGIN_PAGE, LULU_LALA_LOGIN_URL)
+        self.assertEqual(action, "https://lulu-lala.zzzmobile.co.kr/api/login.json")
+        self.assertEqual(hidden, {})
+        self.assertEqual((username_field, password_field), ("username", "password"))
+
+    def test_parse_login_form_without_password_field(self):
+        self.assertIsNone(_parse_login_form('<form action="/search"><input name="q"></form>', LULU_LALA_LOGIN_URL))
+
+    def test_find_refresh_link(self):
+        self.assertEqual(
+            _find_refresh_link(MAIN_PAGE, MAIN_URL),
+            "https://lulu-lala.zzzmobile.co.kr/sso/refresh.do?target=shb",
+        )
+        self.assertIsNone(_find_refresh_link('<a href="javascript:goRefresh()">Refresh</a>', MAIN_URL))
+        self.assertIsNone(_find_refresh_link('<a href="/mypage">마이페이지</a>', MAIN_URL))
+
+
+class SsoHopCheck(unittest.TestCase):
+    def test_follow_sso_through_auto_submit_form_and_script_redirect(self):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append((request.method, str(request.url), request.content))
+            if str(request.url) == SSO_URL:
+                return httpx.Response(200, text=SSO_SCRIPT_REDIRECT_PAGE)
+            return httpx.Response(200, text="<html>예약</html>")
+
+        async def follow():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                start = httpx.Response(200, text=SSO_AUTO_SUBMIT_PAGE, request=httpx.Request("GET", MAIN_URL))
+                return await _follow_sso(client, start)
+
+        response = _run(follow())
+        self.assertIsNotNone(response)
+        self.assertEqual(str(response.url), SHBREFRESH_URL)
+        self.assertEqual(requests[0][:2], ("POST", SSO_URL))
+        self.assertEqual(requests[0][2], b"ticket=T-1")
+
+    def test_follow_sso_stops_on_page_without_redirect(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, text="<html>no redirect</html>")
+
+        async def follow():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                start = httpx.Response(200, text="<html>오류</html>", request=httpx.Request("GET", SSO_URL))
+                return await _follow_sso(client, start)
+
+        self.assertIsNone(_run(follow()))
+
+
+class LoginViaHttpCheck(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.public_key = RSA.generate(1024).publickey().export_key().decode()
+
+    def _login(self, handler, public_key=None):
+        real_client = httpx.AsyncClient
+
+        def client_factory(**kwargs):
+            return real_client(transport=httpx.MockTransport(handler), **kwargs)
+
+        with patch.object(http_auth.httpx, "AsyncClient", client_factory):
+            return _run(login_via_http("user", "secret", public_key or self.public_key))
+
+    def test_no_rsa_key_sends_nothing(self):
+        with patch.object(http_auth.httpx, "AsyncClient", side_effect=AssertionError("no request expected")):
+            result = _run(login_via_http("user", "secret", None))
+        self.assertEqual(result.status, HttpLoginStatus.UNAVAILABLE)
+        self.assertEqual(result.cookies, [])
+
+    def test_success_collects_cookies(self):
+        posted = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            url = str(request.url)
+            if url == LULU_LALA_LOGIN_URL:
+                return httpx.Response(200, text=LOGIN_PAGE)
+            if url.endswith("/member/loginProc.do"):
+                posted["body"] = request.content.decode()
+                return httpx.Response(
+                    200, text=MAIN_PAGE, headers={"set-cookie": "access_token=abc; Domain=.zzzmobile.co.kr; Path=/"}
+                )
+            if "/sso/refresh.do" in url:
+                return httpx.Response(200, text=SSO_AUTO_SUBMIT_PAGE)
+            if url == SSO_URL:
+                return httpx.Response(200, text=SSO_SCRIPT_REDIRECT_PAGE)
+            return httpx.Response(200, text="<html>예약</html>")
+
+        result = self._login(handler)
+        self.assertEqual(result.status, HttpLoginStatus.SUCCESS)
+        self.assertIn("access_token", {cookie["name"] for cookie in result.cookies})
+        # 비밀번호는 암호화되어 전송
+        self.assertIn("userId=user", posted["body"])
+        self.assertNotIn("userPw=secret", posted["body"])
+
+    def test_rejected_credentials(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if str(request.url) == LULU_LALA_LOGIN_URL:
+                return httpx.Response(200, text=LOGIN_PAGE)
+            return httpx.Response(200, text="<script>alert('아이디 또는 비밀번호가 일치하지 않습니다.');</script>")
+
+        self.assertEqual(self._login(handler).status, HttpLoginStatus.REJECTED)
+
+    def test_unexpected_page_structure_falls_back(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, text="<html><div id='app'></div></html>")
+
+        self.assertEqual(self._login(handler).status, HttpLoginStatus.UNAVAILABLE)
+
+    def test_wrong_login_endpoint_falls_back(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if str(request.url) == LULU_LALA_LOGIN_URL:
+                return httpx.Response(200, text=LOGIN_PAGE)
+            return httpx.Response(404, text="not found")
+
+        self.assertEqual(self._login(handler).status, HttpLoginStatus.UNAVAILABLE)
+
+
+if __name__ == "__main__":
+    unittest.main()
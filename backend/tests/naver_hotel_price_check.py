@@ -0,0 +1,83 @@
+import json
+import unittest
+
+from app.batch.naver_hotel_price import _extract_prices_from_html, _pick_lowest_price
+
+HOTEL_ID = "N1234567"
+
+
+def _page(next_data: dict, body: str = "") -> str:
+    return (
+        "<html><body>"
+        f"{body}"
+        f'<script id="__NEXT_DATA__" type="application/json">{json.dumps(next_data)}</script>'
+        "</body></html>"
+    )
+
+
+# 상세 페이지 fixture: 요청한 호텔 + 추천/주변 호텔 + 요금 구성 항목
+MULTI_HOTEL_NEXT_DATA = {
+    "props": {
+        "pageProps": {
+            "hotel": {
+                "hotelId": HOTEL_ID,
+                "name": "요청 호텔",
+                "rooms": [
+                    {"id": 1, "salePrice": 182000, "priceBreakdown": {"tax": 16500, "price": 15000}},
+                    {"id": 2, "salePrice": 159000, "nightlyPrices": [{"price": 53000}]},
+                ],
+                "nearbyHotels": [{"hotelId": "N7654321", "lowestPrice": 45000}],
+            },
+            "recommendedHotels": [
+                {"hotelId": "N1111111", "minPrice": 38000},
+                {"hotelId": "N2222222", "price": 61000},
+            ],
+        }
+    }
+}
+
+
+class NaverHotelPriceExtractionCheck(unittest.TestCase):
+    """
+    HTTP 경로(__NEXT_DATA__ 파싱)가 요청한 호텔의 가격만 사용하는지 확인.
+    """
+
+    def test_ignores_other_hotels_and_price_fragments(self):
+        prices = _extract_prices_from_html(_page(MULTI_HOTEL_NEXT_DATA), HOTEL_ID)
+        self.assertEqual(sorted(prices), [159000.0, 182000.0])
+        self.assertEqual(_pick_lowest_price(prices), 159000.0)
+
+    def test_unknown_hotel_node_returns_nothing(self):
+        # 요청한 호텔 노드가 없으면 다른 호텔 가격으로 대신하지 않음 → Playwright 폴백
+        other_page = _page(MULTI_HOTEL_NEXT_DATA["props"]["pageProps"]["recommendedHotels"][0])
+        self.assertEqual(_extract_prices_from_html(other_page, HOTEL_ID), [])
+
+    def test_info_block_fallback_reads_only_first_price(self):
+        body = (
+            '<div class="Info_Info__abc"><div class="common_price__x1">210,000원</div></div>'
+            '<div class="Card_Card__z"><div class="common_price__x1">39,000원</div></div>'
+        )
+        prices = _extract_prices_from_html(_page({"props": {}}, body), HOTEL_ID)
+        self.assertEqual(prices, [210000.0])
+
+    def test_info_block_fallback_ignores_later_cheaper_info_blocks(self):
+        # 추천/주변 호텔 카드가 같은 Info 클래스를 쓰는 경우: 첫 블록(요청 호텔) 가격만 사용
+        body = (
+            '<div class="Info_Info__abc"><span class="common_price__x1"><em>210,000</em>원</span>'
+            '<img src="a.png"><br></div>'
+            '<div class="Info_Info__abc"><span class="common_price__x1">39,000원</span></div>'
+        )
+        prices = _extract_prices_from_html(_page({"props": {}}, body), HOTEL_ID)
+        self.assertEqual(prices, [210000.0])
+        self.assertEqual(_pick_lowest_price(prices), 210000.0)
+
+    def test_info_block_without_price_does_not_borrow_next_block(self):
+        body = (
+            '<div class="Info_Info__abc"><p>가격 정보 없음</p></div>'
+            '<div class="Info_Info__abc"><span class="common_price__x1">39,000원</span></div>'
+        )
+        self.assertEqual(_extract_prices_from_html(_page({"props": {}}, body), HOTEL_ID), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
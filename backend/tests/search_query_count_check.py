@@ -0,0 +1,93 @@
+import unittest
+from datetime import date, timedelta
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.models import Accommodation, AccommodationDate
+from app.routes.accommodations import search_accommodations
+from app.utils.accommodation_stats import refresh_accommodation_stats
+
+
+class SearchQueryCountCheck(unittest.IsolatedAsyncioTestCase):
+    """
+    /api/accommodations/search 의 쿼리 수가 limit과 무관하게 일정한지 확인.
+    인메모리 sqlite에 숙소/날짜 데이터를 채운 뒤 실행된 SQL 문 수를 센다.
+    """
+
+    async def asyncSetUp(self):
+        self.engine = create_async_engine(
+            "sqlite+aiosqlite://",
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+        )
+        async with self.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        self.session_factory = sessionmaker(
+            self.engine,
+            class_=AsyncSession,
+            expire_on_commit=False
+        )
+
+        recent = date.today() - timedelta(days=7)
+        async with self.session_factory() as session:
+            for acc_idx in range(60):
+                acc_id = str(acc_idx)
+                session.add(Accommodation(id=acc_id, name=f"숙소{acc_idx}", region="강원", images=[]))
+                for day_offset in range(7):
+                    day = recent - timedelta(days=day_offset)
+                    session.add(AccommodationDate(
+                        id=f"{acc_id}_{day.isoformat()}",
+                        accommodation_id=acc_id,
+                        date=day.isoformat(),
+                        weekday=day.weekday(),
+                        score=50.0 + day_offset,
+                        status="마감(신청종료)",
+                    ))
+            await session.commit()
+            await refresh_accommodation_stats(session)
+
+        self.statement_count = 0
+
+        def count_statements(*args, **kwargs):
+            self.statement_count += 1
+
+        event.listen(self.engine.sync_engine, "before_cursor_execute", count_statements)
+
+    async def asyncTearDown(self):
+        await self.engine.dispose()
+
+    async def _count_search_queries(self, limit: int) -> int:
+        self.statement_count = 0
+        async with self.session_factory() as session:
+            results = await search_accommodations(
+                keyword=None,
+                region=None,
+                sort_by="avg_score",
+                sort_order="desc",
+                available_only=False,
+                date=None,
+                limit=limit,
+                authorization=None,
+                user_id=None,
+                db=session,
+            )
+        self.assertEqual(len(results), limit)
+        self.assertTrue(all(len(item["weekday_averages"]) == 7 for item in results))
+        self.assertTrue(all(item["avg_score"] == 53.0 for item in results))
+        return self.statement_count
+
+    async def test_search_query_count_is_constant(self):
+        small = await self._count_search_queries(limit=5)
+        large = await self._count_search_queries(limit=50)
+
+        self.assertEqual(small, large)
+        self.assertEqual(large, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
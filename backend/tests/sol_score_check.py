@@ -0,0 +1,130 @@
+import random
+import unittest
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.models import Accommodation, AccommodationDate
+from app.utils.sol_score import (
+    calculate_and_update_average_sol_scores,
+    calculate_sol_scores_for_accommodation_dates,
+    get_score_weight,
+)
+
+
+def expected_sol_scores(rows):
+    """기존 레코드 단위 계산 방식으로 구한 기대값 {id: sol_score}"""
+    efficiencies = {
+        row_id: price / (score * get_score_weight(score))
+        for row_id, score, price in rows
+        if price is not None and score is not None and score > 0
+    }
+    if not efficiencies:
+        return {}
+
+    low, high = min(efficiencies.values()), max(efficiencies.values())
+    if low == high:
+        return {row_id: 50.0 for row_id in efficiencies}
+    return {
+        row_id: round((value - low) / (high - low) * 100, 2)
+        for row_id, value in efficiencies.items()
+    }
+
+
+class SolScoreCheck(unittest.IsolatedAsyncioTestCase):
+    """NumPy 일괄 계산 결과가 기존 계산식과 같고, 변경된 행만 다시 쓰는지 확인"""
+
+    async def asyncSetUp(self):
+        self.engine = create_async_engine(
+            "sqlite+aiosqlite://",
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+        )
+        async with self.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        self.session_factory = sessionmaker(
+            self.engine,
+            class_=AsyncSession,
+            expire_on_commit=False
+        )
+
+        rng = random.Random(7)
+        self.rows = []
+        async with self.session_factory() as session:
+            for acc_id in ("1", "2", "3"):
+                session.add(Accommodation(id=acc_id, name=f"숙소{acc_id}", region="강원", images=[]))
+            for idx in range(300):
+                score = rng.choice([None, 0.0, rng.uniform(40, 100)])
+                price = rng.choice([None, rng.uniform(50_000, 400_000)])
+                acc_id = str(idx % 2 + 1)
+                row_id = f"{acc_id}_{idx:04d}"
+                self.rows.append((row_id, score, price))
+                session.add(AccommodationDate(
+                    id=row_id,
+                    accommodation_id=acc_id,
+                    date=f"2026-01-{idx % 28 + 1:02d}",
+                    score=score,
+                    online_price=price,
+                    sol_score=-1.0 if idx % 5 == 0 else None,
+                ))
+            await session.commit()
+
+    async def asyncTearDown(self):
+        await self.engine.dispose()
+
+    async def _stored_scores(self):
+        async with self.session_factory() as session:
+            result = await session.execute(select(AccommodationDate.id, AccommodationDate.sol_score))
+            return dict(result.all())
+
+    async def test_matches_reference_and_is_incremental(self):
+        async with self.session_factory() as session:
+            stats = await calculate_sol_scores_for_accommodation_dates(session)
+
+        expected = expected_sol_scores(self.rows)
+        stored = await self._stored_scores()
+
+        self.assertEqual(stats["total"], len(self.rows))
+        self.assertEqual(stats["calculated"], len(expected))
+        for row_id, _, _ in self.rows:
+            if row_id in expected:
+                self.assertAlmostEqual(stored[row_id], expected[row_id], places=6)
+            else:
+                self.assertIsNone(stored[row_id])
+
+        async with self.session_factory() as session:
+            second = await calculate_sol_scores_for_accommodation_dates(session)
+        self.assertEqual(second["updated"], 0)
+        self.assertEqual(second["changed_accommodation_ids"], [])
+
+    async def test_average_rollup(self):
+        async with self.session_factory() as session:
+            sol_stats = await calculate_sol_scores_for_accommodation_dates(session)
+            self.assertEqual(sol_stats["changed_accommodation_ids"], ["1", "2"])
+            avg_stats = await calculate_and_update_average_sol_scores(
+                session, sol_stats["changed_accommodation_ids"]
+            )
+
+        stored = await self._stored_scores()
+        async with self.session_factory() as session:
+            result = await session.execute(select(Accommodation.id, Accommodation.average_sol_score))
+            averages = dict(result.all())
+
+        for acc_id in ("1", "2"):
+            values = [score for row_id, score in stored.items() if row_id.startswith(f"{acc_id}_") and score is not None]
+            self.assertAlmostEqual(averages[acc_id], round(sum(values) / len(values), 2), places=6)
+        self.assertIsNone(averages["3"])
+        self.assertEqual(avg_stats, {"total": 2, "updated": 2, "skipped": 0, "changed": 2})
+
+        # 전체 재계산 시 값이 같은 숙소는 다시 쓰지 않음
+        async with self.session_factory() as session:
+            full_stats = await calculate_and_update_average_sol_scores(session)
+        self.assertEqual(full_stats, {"total": 3, "updated": 2, "skipped": 1, "changed": 0})
+
+
+if __name__ == "__main__":
+    unittest.main()
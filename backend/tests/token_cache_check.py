@@ -0,0 +1,98 @@
+import unittest
+
+from sqlalchemy import event, update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.config import settings
+from app.database import Base
+from app.models import User
+from app.services.auth_service import auth_service
+from app.utils.jwt import create_access_token
+from app.utils.token_cache import token_cache
+
+
+class TokenCacheCheck(unittest.IsolatedAsyncioTestCase):
+    """
+    액세스 토큰 캐시가 쓰기 경로에 오래된 사용자 값을 넘기지 않는지,
+    읽기 전용 경로에서는 DB 조회를 생략하는지, 무효화가 동작하는지 확인.
+    """
+
+    async def asyncSetUp(self):
+        self.engine = create_async_engine(
+            "sqlite+aiosqlite://",
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+        )
+        async with self.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        self.session_factory = sessionmaker(self.engine, class_=AsyncSession, expire_on_commit=False)
+
+        async with self.session_factory() as session:
+            session.add(User(id="u1", name="사용자", points=100.0, is_active=True))
+            await session.commit()
+
+        if not settings.JWT_SECRET_KEY:
+            settings.JWT_SECRET_KEY = "token-cache-check-secret-key-0123456789"
+        token_cache.clear()
+        self.token = create_access_token(data={"user_id": "u1"})
+        async with self.session_factory() as session:
+            await auth_service.get_user_from_token(self.token, session)
+
+        self.statement_count = 0
+
+        def count_statements(*args, **kwargs):
+            self.statement_count += 1
+
+        event.listen(self.engine.sync_engine, "before_cursor_execute", count_statements)
+
+    async def asyncTearDown(self):
+        token_cache.clear()
+        await self.engine.dispose()
+
+    async def _external_points_change(self, points: float):
+        # 다른 프로세스(배치 등)의 Core UPDATE → ORM 이벤트가 없어 캐시가 무효화되지 않음
+        async with self.session_factory() as session:
+            await session.execute(update(User).where(User.id == "u1").values(points=points))
+            await session.commit()
+
+    async def test_readonly_path_skips_database(self):
+        async with self.session_factory() as session:
+            user = await auth_service.get_user_from_token(self.token, session, allow_cached=True)
+        self.assertEqual(user.id, "u1")
+        self.assertEqual(self.statement_count, 0)
+
+    async def test_write_path_reloads_row(self):
+        await self._external_points_change(80.0)
+
+        async with self.session_factory() as session:
+            user = await auth_service.get_user_from_token(self.token, session)
+            self.assertEqual(user.points, 80.0)
+            user.points += 5.0
+            await session.commit()
+
+        async with self.session_factory() as session:
+            self.assertEqual((await session.get(User, "u1")).points, 85.0)
+
+    async def test_orm_update_invalidates_snapshot(self):
+        async with self.session_factory() as session:
+            user = await auth_service.get_user_from_token(self.token, session)
+            user.points = 42.0
+            await session.commit()
+
+        self.assertIsNone(token_cache.get_snapshot(self.token))
+
+    async def test_inactive_user_rejected(self):
+        async with self.session_factory() as session:
+            await session.execute(update(User).where(User.id == "u1").values(is_active=False))
+            await session.commit()
+
+        async with self.session_factory() as session:
+            self.assertIsNone(await auth_service.get_user_from_token(self.token, session))
+            # 조회로 비활성 사실을 확인한 뒤에는 읽기 전용 경로도 캐시를 쓰지 않음
+            self.assertIsNone(await auth_service.get_user_from_token(self.token, session, allow_cached=True))
+
+
+if __name__ == "__main__":
+    unittest.main()